@@ -0,0 +1,4 @@
+from antools.logging._logger_class import _get_thread_logger
+
+from ._async_process_class import AsyncProcess
+from ._async_handler import AsyncHandler
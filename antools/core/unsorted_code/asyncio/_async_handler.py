@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+ASYNCIO HANDLER
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import os
+import threading
+
+from antools.asyncio import AsyncProcess
+from antools.multiprocessing import SyncPrimitives
+from antools.scheduling import (
+    CancelToken,
+    LoopExecutor,
+    NodeCache,
+    ObjectStore,
+    ProcessPool,
+    ScheduleEngine,
+    Telemetry,
+    as_sequence,
+)
+
+
+class AsyncHandler:
+    """Handler running coroutine functions on one event loop, concurrency is not limited by threads.
+
+    ...
+
+    Attributes
+    ----------
+    _logger : object
+        Logger class.
+
+    Methods
+    -------
+    __init__(self, logger:object)
+        Class constructor.
+    run_schedule(self):
+        Run multiple functions dependent between themselves.
+    run_func(self)
+        Run coroutine function for every item of args.
+    run_func_async(self)
+        The same as run_func, awaitable from running event loop.
+
+    Examples
+    -------
+    antools/asyncio/_examples/_example_async_handler.py
+    """
+
+    def __init__(self, logger):
+        """Class constructor."""
+        self._logger = logger
+
+    def run_schedule(
+        self,
+        schedule: dict,
+        max_workers: int = 100,
+        lock: object = None,
+        cache: NodeCache = None,
+        telemetry: Telemetry = None,
+        store: ObjectStore = None,
+        resources: dict = None,
+        on_error: str = "continue",
+        deadline: float = None,
+        token: CancelToken = None,
+    ) -> dict:
+        """Run multiple functions dependent between themselves.
+
+        Parameters
+        ----------
+        schedule : dict
+            Key -> name of function
+            Value -> list of names of dependent functions or directly dependent function
+        max_workers : int
+            Max functions awaited at once.
+        lock
+           Asyncio lock (default is None -> new asyncio.Lock()).
+        cache : NodeCache, optional
+            If set, function with unchanged code and unchanged dependency results is loaded from cache
+            instead of being run (default is None).
+        telemetry : Telemetry, optional
+            If set, timings of every function are recorded to it (default is None).
+        store : ObjectStore, optional
+            If set, results of functions are kept in store and functions get dictionary
+            dependency name -> ObjectRef, read data by ref.get() (default is None). Cannot be combined with cache.
+        resources : dict, optional
+            Capacity shared by running functions, e.g. {"cpus": 8, "memory": 16 * 1024**3}, functions declare
+            their needs by node(cpus=..., memory=...) (default is None -> cpus is max_workers, memory is physical memory).
+        on_error : str, optional
+            What happens when function fails (default is "continue"). Options are ["continue", "fail_branch", "fail_fast"].
+            "fail_branch" -> dependent functions are skipped, "fail_fast" -> the whole schedule is cancelled.
+        deadline : float, optional
+            Seconds for the whole schedule, then it is cancelled (default is None -> no limit).
+        token : CancelToken, optional
+            Token to cancel the schedule from other thread (default is None). Running functions
+            check get_cancel_token().cancelled and should return early, skipped functions have status "CANCELLED".
+
+        Functions run on one event loop, functions declared by node(executor="thread") run in threads
+        and node(executor="process") in worker processes (with native lock instead of given lock).
+
+        Returns
+        ----------
+        Dictionary with results
+        """
+
+        # process nodes get native lock handed to workers by initializer
+        sync = SyncPrimitives()
+        lock = asyncio.Lock() if lock is None else lock
+        engine = ScheduleEngine(
+            self._logger,
+            factories={
+                "asyncio": lambda: LoopExecutor(max_workers),
+                "thread": lambda: concurrent.futures.ThreadPoolExecutor(
+                    min(max_workers, os.cpu_count() + 4)
+                ),
+                "process": lambda: ProcessPool(
+                    min(max_workers, os.cpu_count()),
+                    initializer=SyncPrimitives.initializer,
+                    initargs=(sync,),
+                ),
+            },
+            locks={"asyncio": lock, "thread": threading.Lock(), "process": sync.lock},
+            default_executor="asyncio",
+            name="asyncio",
+        )
+        return engine.run(
+            schedule,
+            max_workers,
+            cache,
+            telemetry,
+            store=store,
+            resources=resources,
+            on_error=on_error,
+            deadline=deadline,
+            token=token,
+        )
+
+    def run_func(
+        self,
+        func,
+        args: list,
+        max_workers: int = 100,
+        lock: object = None,
+        timeout: float = None,
+    ) -> list:
+        """Run coroutine function for every item of args on new event loop.
+
+        Parameters
+        ----------
+        func
+            Coroutine function called as func(value, lock)
+        args : list
+            List of data which should be processed
+        max_workers : int
+            Max items awaited at once (bounded by semaphore).
+        lock
+            Asyncio lock (default is None -> new asyncio.Lock()).
+        timeout : float, optional
+            Max seconds for one item, item which timed out fails (default is None -> no limit).
+
+        Failed or timed out item does not stop the others, its result is None.
+
+        Returns
+        ----------
+        List with results
+        """
+        return asyncio.run(self.run_func_async(func, args, max_workers, lock, timeout))
+
+    async def run_func_async(
+        self,
+        func,
+        args: list,
+        max_workers: int = 100,
+        lock: object = None,
+        timeout: float = None,
+    ) -> list:
+        """Run coroutine function for every item of args on running event loop, see run_func().
+
+        Returns
+        ----------
+        List with results
+        """
+
+        if not inspect.iscoroutinefunction(func):
+            raise ValueError(f"Function <{func}> must be a coroutine function!")
+        if max_workers < 1:
+            raise ValueError(
+                f"Max workers must be a positive integer, inserted value is {max_workers}!"
+            )
+
+        args = as_sequence(args)
+        lock = asyncio.Lock() if lock is None else lock
+        semaphore = asyncio.Semaphore(max_workers)
+        processes = [None] * len(args)
+        tasks = set()
+
+        self._logger.info(
+            f"Awaiting function <{func}> for {len(args)} items, {max_workers} at once ..."
+        )
+        # task is created only when semaphore is acquired, so at most max_workers tasks exist at once
+        for i, value in enumerate(args):
+            await semaphore.acquire()
+            task = asyncio.ensure_future(
+                self._run_async(func, value, lock, timeout, processes, i)
+            )
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            task.add_done_callback(lambda _: semaphore.release())
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        status_list = [process.status for process in processes]
+        msg = f"Asyncio function <{func.__name__}> is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
+        (
+            self._logger.info(msg)
+            if status_list.count("OK") == len(status_list)
+            else self._logger.error(msg, terminate=False)
+        )
+
+        return [process.data for process in processes]
+
+    async def _run_async(
+        self,
+        func,
+        value: object,
+        lock: object,
+        timeout: float,
+        processes: list,
+        i: int,
+    ):
+        """Await function for one item, result is stored to processes[i]."""
+
+        p = AsyncProcess(lock, self._logger, log=False)
+        try:
+            if timeout is None:
+                p.data = await func(value, lock)
+            else:
+                p.data = await asyncio.wait_for(func(value, lock), timeout)
+            p.status = "OK"
+        except asyncio.TimeoutError:
+            p.error = f"Timeout after {timeout} seconds"
+        except Exception as err:
+            p.error = err
+
+        processes[i] = p.finish(terminate_all=False)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+ASYNCIO HANDLER BENCHMARK
+
+Compares throughput of AsyncHandler and ThreadHandler on I/O bound work, every item waits WAIT seconds.
+Threads block one OS thread per wait, coroutines share one event loop.
+ITEMS/S -> processed items per second, IDEAL -> CONCURRENCY / WAIT.
+"""
+
+import asyncio
+import time
+
+from antools.asyncio import AsyncHandler
+from antools.logging import get_logger
+from antools.threading import ThreadHandler
+
+N_ITEMS = 10_000
+WAIT = 0.1
+CONCURRENCY = [100, 1_000, 5_000]
+
+
+async def async_wait(value, lock):
+    await asyncio.sleep(WAIT)
+    return value
+
+
+def thread_wait(value, lock):
+    time.sleep(WAIT)
+    return value
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="ERROR", file_log=False)
+
+    print(f"N_ITEMS={N_ITEMS}, WAIT={WAIT} s")
+    print(f"{'CONCURRENCY':>12}{'IDEAL':>12}{'ASYNCIO':>12}{'THREADING':>12}")
+    for concurrency in CONCURRENCY:
+        st = time.perf_counter()
+        AsyncHandler(logger).run_func(
+            async_wait, range(N_ITEMS), max_workers=concurrency
+        )
+        async_rate = N_ITEMS / (time.perf_counter() - st)
+
+        # one item per chunk, every thread waits for one item at a time
+        st = time.perf_counter()
+        ThreadHandler(logger).run_func(
+            thread_wait,
+            range(N_ITEMS),
+            max_workers=concurrency,
+            chunking="stealing",
+            chunksize=1,
+        )
+        thread_rate = N_ITEMS / (time.perf_counter() - st)
+
+        ideal = min(concurrency, N_ITEMS) / WAIT
+        print(f"{concurrency:>12}{ideal:>12.0f}{async_rate:>12.0f}{thread_rate:>12.0f}")
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+ASYNCIO HANDLER EXAMPLES
+"""
+
+import asyncio
+import random
+
+from antools.asyncio import AsyncHandler, AsyncProcess
+from antools.logging import get_logger
+from antools.scheduling import node
+
+
+async def fetch(value, lock):
+    await asyncio.sleep(random.random() / 10)  # e.g. HTTP request
+    async with lock:
+        pass  # e.g. write to shared file
+    return value * 2
+
+
+async def slow_fetch(value, lock):
+    await asyncio.sleep(1 if value == 3 else 0.01)
+    return value
+
+
+async def download(lock, logger, args=None):
+    p = AsyncProcess(lock, logger)
+    await asyncio.sleep(0.5)
+    p.data = list(range(10))
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+async def upload(lock, logger, args=None):
+    p = AsyncProcess(lock, logger)
+    await p.lock()
+    try:
+        await asyncio.sleep(0.1)
+    finally:
+        p.release()
+    p.data = sum(args["download"])
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+@node(executor="thread")
+def report(lock, logger, args=None):
+    p = AsyncProcess(lock, logger)
+    p.data = f"Uploaded {args['upload']}"  # blocking code runs in thread
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    handler = AsyncHandler(logger)
+
+    # FIRST EXAMPLE
+    # THOUSANDS OF CONCURRENT WAITS ON ONE THREAD
+    data = handler.run_func(fetch, range(5_000), max_workers=1_000)
+    print(data[:10])
+
+    # SECOND EXAMPLE
+    # ITEM WHICH TIMED OUT RETURNS NONE, OTHERS ARE FINISHED
+    print(handler.run_func(slow_fetch, range(6), timeout=0.5))
+
+    # THIRD EXAMPLE
+    # SCHEDULE OF COROUTINE FUNCTIONS, BLOCKING NODE IN THREAD
+    schedule = {download: None, upload: download, report: upload}
+    print(handler.run_schedule(schedule)["report"])
@@ -1 +1,3 @@
+from ._timing_stats import TimingStats
 from ._approach_comparator_class import ApproachComparator
+from ._benchmark_history import BenchmarkHistory, get_environment
@@ -0,0 +1,99 @@
+"""
+Commands of helpers, run as python -m antools.helpers <command>.
+
+    history -> list runs stored in benchmark history
+    compare -> compare runs against baseline, exit code 1 if any approach regressed (for CI),
+               2 if runs given by --baseline or --current cannot be compared
+"""
+
+import argparse
+import sys
+
+from antools.helpers._benchmark_history import BenchmarkHistory
+
+
+def history(args: argparse.Namespace) -> int:
+    """Print runs of benchmark history, the latest last."""
+
+    runs = BenchmarkHistory(args.db).runs()
+    for run in runs[-args.limit :]:
+        commit = (run["git_commit"] or "-")[:10] + ("*" if run["git_dirty"] else "")
+        approaches = ", ".join(
+            f"{r['approach']}={round(r['median'], 5)}" for r in run["results"]
+        )
+        print(
+            f"#{run['id']} {run['created']} {run['name']} commit={commit} python={run['python']} machine={run['machine']}: {approaches}"
+        )
+    if not runs:
+        print(f"No runs in {args.db}!")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Print comparison of current runs with baseline, returns 1 if any approach regressed
+    and 2 if runs given by --baseline or --current cannot be compared."""
+
+    try:
+        rows = BenchmarkHistory(args.db).compare(
+            baseline=args.baseline, current=args.current, threshold=args.threshold
+        )
+    except ValueError as err:
+        print(f"ERROR: {err}")
+        return 2
+    if not rows:
+        # the first run of benchmark has no previous run, explicit runs must be comparable
+        if args.baseline is None and args.current is None:
+            print("Nothing to compare, baseline was not found!")
+            return 0
+        print("ERROR: Given runs have no common benchmark and approach to compare!")
+        return 2
+
+    for row in rows:
+        if row["regression"]:
+            verdict = "REGRESSION"
+        elif row["significant"] and row["change"] < 0:
+            verdict = "faster"
+        elif row["significant"]:
+            verdict = "slower, within threshold"
+        else:
+            verdict = "no significant difference"
+        warning = "" if row["comparable"] else " (different machine or Python!)"
+        print(
+            f"{row['name']} {row['approach']}: #{row['baseline_run']} {round(row['baseline'], 5)}s -> #{row['current_run']} {round(row['current'], 5)}s ({row['change']:+.1%}) {verdict}{warning}"
+        )
+
+    regressions = sum(row["regression"] for row in rows)
+    print(f"TOTAL_COMPARED={len(rows)}, REGRESSIONS={regressions}")
+    return 1 if regressions else 0
+
+
+def main(argv: list = None) -> int:
+    """Enable to run python -m antools.helpers commands"""
+
+    parser = argparse.ArgumentParser(prog="python -m antools.helpers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    history_parser = commands.add_parser("history", help="List stored benchmark runs.")
+    history_parser.add_argument("--db", default="benchmark_history.sqlite")
+    history_parser.add_argument("--limit", type=int, default=20)
+    history_parser.set_defaults(handler=history)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare runs with baseline, exit code 1 on regression."
+    )
+    compare_parser.add_argument("--db", default="benchmark_history.sqlite")
+    compare_parser.add_argument(
+        "--baseline", help="Run id or git commit, default is previous run."
+    )
+    compare_parser.add_argument(
+        "--current", help="Run id or git commit, default is the latest run."
+    )
+    compare_parser.add_argument("--threshold", type=float, default=0.05)
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
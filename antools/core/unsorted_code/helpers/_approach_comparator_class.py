@@ -5,12 +5,20 @@ APPROACH COMPARATOR CLASS
 
 import concurrent.futures
 import os
+import platform
 import time
 
-import numpy as np
-
+from antools.helpers._timing_stats import TimingStats
 from antools.logging import get_logger
-from antools.multiprocessing import MultiProcess
+from antools.multiprocessing import MultiProcess, SyncPrimitives, get_mp_context
+from antools.scheduling import (
+    InterpreterPool,
+    as_sequence,
+    get_chunk_bounds,
+    get_gil_status,
+    is_interpreters_available,
+    partition,
+)
 from antools.threading import ThreadProcess
 
 
@@ -37,7 +45,9 @@ class ApproachComparator:
     Attributes
     ----------
     results: dict
-        Sorted data from performed processed
+        Sorted data from performed processed, median times in seconds
+    stats: dict
+        TimingStats of performed processes (median, IQR, confidence interval, outliers)
     _func: method
         Function to be tested, must be in format -> func(args:list = [], lock)
     _args: list
@@ -46,16 +56,30 @@ class ApproachComparator:
         Lock with acquire and release funtion, which does nothing
     _logger: Logger
         Logger object
+    _ctx : object
+        Multiprocessing context of process pools
+    gil_status : str
+        Status of the GIL, threads run CPU bound functions in parallel only when it is "disabled".
+    warmup : int
+        Untimed runs of every approach before measurement, they start workers and fill caches.
+    repeats : int
+        Minimal number of timed runs of every approach.
+    min_time : float
+        Minimal total time of timed runs of every approach in seconds, more runs are made to reach it.
+    confidence : float
+        Confidence level of intervals, "x faster" is printed only when it is significant at this level.
 
 
     Methods
     -------
-    __init__(self, func, args=None)
+    __init__(self, func, args=None, logger=None, start_method=None, preload=None, warmup=1, repeats=5,
+             min_time=0.0, confidence=0.95, seed=None)
         Class constructor.
      __call__(self)
         When class instance is called, it compare results and print them.
     compare_all(self, max_workers:list or int=None, mp_lock:object=None, thread_lock:object=None,
-                    run_main:bool=True, run_threading:bool=True, run_mp:bool=True, batch_only:bool=True)
+                    run_main:bool=True, run_threading:bool=True, run_mp:bool=True, batch_only:bool=True,
+                    run_interpreters:bool=True)
         Compare all processed instructed by user and prints results.
     main(self)
         Run simple python process.
@@ -63,6 +87,8 @@ class ApproachComparator:
         Run multiprocessing.
     threading(self, max_workers=os.cpu_count(), lock=None,  batch=True)
         Run threading.
+    interpreters(self, max_workers=os.cpu_count(), batch=True)
+        Run sub-interpreters (experimental, Python 3.13+).
 
     Examples
     -------
@@ -70,9 +96,25 @@ class ApproachComparator:
     """
 
     data = {}
+    stats = {}
     _abstract_lock = _AbstractLock()
 
-    def __init__(self, func, args=None, logger: object = None):
+    # timed runs of one approach are stopped here even if min_time is not reached
+    MAX_REPEATS = 10_000
+
+    def __init__(
+        self,
+        func,
+        args=None,
+        logger: object = None,
+        start_method: str = None,
+        preload: list = None,
+        warmup: int = 1,
+        repeats: int = 5,
+        min_time: float = 0.0,
+        confidence: float = 0.95,
+        seed: int = None,
+    ):
         """Class constructor.
 
         Parameters
@@ -83,11 +125,38 @@ class ApproachComparator:
             List which should be passed to test function (default is None).
         _logger
             Class for logging messages
+        start_method: str, optional
+            Start method of multiprocessing workers (default is None -> platform default). Options are [None, "fork", "spawn", "forkserver"].
+        preload: list, optional
+            Modules imported once in fork server, only for "forkserver" (default is None).
+            SyncPrimitives passed as lock must be created with the same context -> SyncPrimitives(ctx=get_mp_context(start_method)).
+        warmup: int, optional
+            Untimed runs of every approach before measurement (default is 1).
+        repeats: int, optional
+            Minimal number of timed runs of every approach (default is 5).
+        min_time: float, optional
+            Minimal total time of timed runs of every approach in seconds (default is 0.0).
+        confidence: float, optional
+            Confidence level of bootstrap intervals and significance of differences (default is 0.95).
+        seed: int, optional
+            Seed of bootstrap resampling (default is None).
         """
 
+        if repeats < 1 or warmup < 0:
+            raise ValueError(
+                f"Repeats <{repeats}> must be positive and warmup <{warmup}> must not be negative!"
+            )
+
         self._logger = get_logger(_activate=False) if not logger else logger
         self._func = func
-        self._args = [] if not args else args
+        self._args = [] if args is None else as_sequence(args)
+        self._ctx = get_mp_context(start_method, preload)
+        self.gil_status = get_gil_status()
+        self.warmup = warmup
+        self.repeats = repeats
+        self.min_time = min_time
+        self.confidence = confidence
+        self.seed = seed
 
     def __call__(self):
         """When class instance is called, it compare results and print them."""
@@ -97,20 +166,43 @@ class ApproachComparator:
         print("  PROCESS RESULTS  ")
         print("###################")
         print("")
+        print(f"Python {platform.python_version()}, GIL {self.gil_status}")
+        print("")
 
         if not self.results:
             print("NO RESULTS")
         else:
             i = 0
-            last_value = self.results[list(self.results)[-1]]
+            last_key = list(self.results)[-1]
             for key, value in self.results.items():
                 i += 1
-                if last_value != value:
-                    comparison = f" ({round(last_value/value, 2)}x faster)"
+                stats = self.stats[key]
+                if key != last_key:
+                    comparison = f" ({self._get_comparison(key, last_key)})"
                 else:
                     comparison = " (slowest)" if not len(self.results) == 1 else ""
 
-                print(f"{str(i)}. {key} -> {value} seconds {comparison}")
+                print(
+                    f"{str(i)}. {key} -> {value} seconds{comparison}, IQR {round(stats.iqr, 5)}, "
+                    f"{round(100 * stats.confidence)}% CI {round(stats.ci[0], 5)}-{round(stats.ci[1], 5)}, "
+                    f"runs {len(stats.samples)}, outliers {len(stats.outliers)}"
+                )
+
+            # best threads against best processes, threads win CPU bound work only without the GIL
+            best = {}
+            for prefix in ["Threading", "Multiprocessing", "Interpreters"]:
+                keys = [k for k in self.results if k.startswith(prefix)]
+                if keys:
+                    best[prefix] = keys[0]
+            if "Threading" in best and "Multiprocessing" in best:
+                print("")
+                print(
+                    f"Best threading vs best multiprocessing: {self._get_comparison(best['Threading'], best['Multiprocessing'])} (GIL {self.gil_status})."
+                )
+            if "Interpreters" in best and "Multiprocessing" in best:
+                print(
+                    f"Best sub-interpreters vs best multiprocessing: {self._get_comparison(best['Interpreters'], best['Multiprocessing'])}."
+                )
 
             print("\n")
 
@@ -123,6 +215,7 @@ class ApproachComparator:
         run_threading: bool = True,
         run_mp: bool = True,
         batch_only: bool = True,
+        run_interpreters: bool = True,
     ):
         """Compare all processed instructed by user and prints results.
 
@@ -131,7 +224,7 @@ class ApproachComparator:
         max_workers: list or int
             Maximum mumber of workers which should be run (default is None -> try multiple possibilities including maximum).
         mp_lock: object, optional
-            Instance of multiprocessing lock created in main function (default is None).
+            Instance of multiprocessing lock or SyncPrimitives created in main function (default is None).
         thread_lock: object, optional
             Instance of thread lock created in main function (default is None).
         run_main : bool
@@ -142,6 +235,8 @@ class ApproachComparator:
             Run threading (default is True).
         batch_only: bool
             Set False if possibility not using batching should be used
+        run_interpreters : bool
+            Run sub-interpreters, only when they are available -> Python 3.13+ (default is True).
         """
 
         if not max_workers:
@@ -168,6 +263,8 @@ class ApproachComparator:
                 if run_threading:
                     lock = thread_lock
                     self.threading(workers, lock, batch)
+                if run_interpreters and is_interpreters_available():
+                    self.interpreters(workers, batch)
 
         if run_main:
             self.main()
@@ -179,12 +276,9 @@ class ApproachComparator:
         """Run simple python process"""
         lock = self._abstract_lock
         print(f"Starting single thread ... ")
-        st = time.perf_counter()
-        [self._func(value, lock) for value in self._args]
-        process_time = round(time.perf_counter() - st, 5)
-        print(f"Process finished. Total time {process_time} seconds.")
-        self.data[f"Main"] = process_time
-        return process_time
+        return self._measure(
+            "Main", lambda: [self._func(value, lock) for value in self._args]
+        )
 
     def multiprocessing(self, max_workers=os.cpu_count(), lock=None, batch=True):
         """Run multiprocessing.
@@ -194,38 +288,52 @@ class ApproachComparator:
         max_workers: list or int
             Maximum mumber of workers which should be run (default is os.cpu_count()).
         lock: object, optional
-            Instance of multiprocessing lock created in main function (default is None).
+            Instance of multiprocessing lock or SyncPrimitives created in main function (default is None).
+            SyncPrimitives are handed to workers through pool initializer and lock wait time is printed.
         batch_only: bool
             Set False if batching is not wanted (default = True).
         """
 
-        args = self._args if not batch else np.array_split(self._args, max_workers)
+        args = (
+            self._args
+            if not batch
+            else partition(self._args, get_chunk_bounds(len(self._args), max_workers))
+        )
         batch_msg = "True" if batch else "False"
         lock_msg = "True" if lock else "False"
+        method_msg = self._ctx.get_start_method()
         lock = self._abstract_lock if not lock else lock
 
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=max_workers
-        ) as executor:
-            print(
-                f"Starting multiprocessing (max_workers={max_workers}, lock={lock_msg}, batch={batch_msg}) ..."
+        # native primitives cannot be pickled into tasks, workers inherit them
+        sync = lock if isinstance(lock, SyncPrimitives) else None
+        if sync:
+            lock = sync.lock
+            sync_stats = sync.lock.stats()
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=SyncPrimitives.initializer,
+                initargs=(sync,),
+                mp_context=self._ctx,
+            )
+        else:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=self._ctx
             )
-            st = time.perf_counter()
-            proc_results = [
-                executor.submit(
-                    self._run_multiprocess, self._func, curr_args, lock, batch
-                )
-                for curr_args in args
-            ]
 
-            for f in concurrent.futures.as_completed(proc_results):
-                f.result()
+        with executor:
+            print(
+                f"Starting multiprocessing (max_workers={max_workers}, lock={lock_msg}, batch={batch_msg}, start_method={method_msg}) ..."
+            )
+            process_time = self._measure(
+                f"Multiprocessing(max_workers={max_workers}, lock={lock_msg}, batch={batch_msg}, start_method={method_msg})",
+                lambda: self._run_all(
+                    executor, self._run_multiprocess, args, lock, batch
+                ),
+            )
 
-        process_time = round(time.perf_counter() - st, 5)
-        print(f"Process finished. Total time: {process_time} seconds.")
-        self.data[
-            f"Multiprocessing(max_workers={max_workers}, lock={lock_msg}, batch={batch_msg})"
-        ] = process_time
+        if sync:
+            wait_time = sync.lock.stats()["wait_time"] - sync_stats["wait_time"]
+            print(f"Total lock wait time of all runs: {round(wait_time, 5)} seconds.")
         return process_time
 
     def threading(self, max_workers=os.cpu_count(), lock=None, batch=True):
@@ -241,38 +349,107 @@ class ApproachComparator:
             Set False if batching is not wanted (default = True).
         """
 
-        args = self._args if not batch else np.array_split(self._args, max_workers)
+        args = (
+            self._args
+            if not batch
+            else partition(self._args, get_chunk_bounds(len(self._args), max_workers))
+        )
         batch_msg = "True" if batch else "False"
         lock_msg = "True" if lock else "False"
         lock = self._abstract_lock if not lock else lock
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             print(
-                f"Starting threading (max_workers={max_workers}, lock={lock_msg}, batch={batch_msg}) ..."
+                f"Starting threading (max_workers={max_workers}, lock={lock_msg}, batch={batch_msg}, gil={self.gil_status}) ..."
+            )
+            return self._measure(
+                f"Threading(max_workers={max_workers}, lock={lock_msg}, batch={batch_msg}, gil={self.gil_status})",
+                lambda: self._run_all(executor, self._run_thread, args, lock, batch),
             )
-            st = time.perf_counter()
-            proc_results = [
-                executor.submit(
-                    self._run_multiprocess, self._func, curr_args, lock, batch
-                )
-                for curr_args in args
-            ]
 
-            for f in concurrent.futures.as_completed(proc_results):
-                f.result()
+    def interpreters(self, max_workers=os.cpu_count(), batch=True):
+        """Run sub-interpreters (experimental, Python 3.13+), function gets abstract lock.
 
-        process_time = round(time.perf_counter() - st, 5)
-        print(f"Process finished. Total time: {process_time} seconds.")
-        self.data[
-            f"Threading(max_workers={max_workers}, lock={lock_msg}, batch={batch_msg})"
-        ] = process_time
-        return process_time
+        Parameters
+        ----------
+        max_workers: list or int
+            Maximum mumber of sub-interpreters which should be run (default is os.cpu_count()).
+        batch_only: bool
+            Set False if batching is not wanted (default = True).
+        """
+
+        args = (
+            self._args
+            if not batch
+            else partition(self._args, get_chunk_bounds(len(self._args), max_workers))
+        )
+        batch_msg = "True" if batch else "False"
+
+        # sub-interpreters are started and function is unpickled (its script is loaded) before time is measured
+        with InterpreterPool(
+            max_workers=max_workers, initializer=id, initargs=(self._func,)
+        ) as executor:
+            print(
+                f"Starting sub-interpreters (max_workers={max_workers}, batch={batch_msg}) ..."
+            )
+            return self._measure(
+                f"Interpreters(max_workers={max_workers}, batch={batch_msg})",
+                lambda: self._run_all(
+                    executor, self._run_interpreter, args, self._abstract_lock, batch
+                ),
+            )
 
     @property
     def results(self) -> dict:
         """Returns data dict soreted by time"""
         return {k: v for k, v in sorted(self.data.items(), key=lambda item: item[1])}
 
+    def _measure(self, key: str, run_once) -> float:
+        """Run approach warmup times untimed, then at least repeats times and at least min_time seconds.
+        Stats are stored to self.stats and median to self.data, returns median."""
+
+        for _ in range(self.warmup):
+            run_once()
+
+        samples = []
+        while len(samples) < self.MAX_REPEATS:
+            if len(samples) >= self.repeats and sum(samples) >= self.min_time:
+                break
+            st = time.perf_counter()
+            run_once()
+            samples.append(time.perf_counter() - st)
+
+        stats = TimingStats(samples, self.confidence, seed=self.seed)
+        self.stats[key] = stats
+        self.data[key] = round(stats.median, 5)
+        print(
+            f"Process finished. Median time: {self.data[key]} seconds, IQR {round(stats.iqr, 5)}, runs {len(samples)}, outliers {len(stats.outliers)}."
+        )
+        return self.data[key]
+
+    def _get_comparison(self, key: str, other_key: str) -> str:
+        """Returns how many times approach is faster than other one, only if it is significant."""
+
+        ratio, low, high = self.stats[key].compare(self.stats[other_key])
+        interval = (
+            f"{round(100 * self.confidence)}% CI {round(low, 2)}-{round(high, 2)}"
+        )
+        if low > 1:
+            return f"{round(ratio, 2)}x faster, {interval}"
+        if high < 1:
+            return f"{round(1 / ratio, 2)}x slower, {interval}"
+        return f"no significant difference, {interval}"
+
+    def _run_all(self, executor: object, run, args: list, lock: object, batch: bool):
+        """Run all chunks of args in executor and wait for them."""
+
+        proc_results = [
+            executor.submit(run, self._func, curr_args, lock, batch)
+            for curr_args in args
+        ]
+        for f in concurrent.futures.as_completed(proc_results):
+            f.result()
+
     def _run_multiprocess(self, func, args: list, lock: object, batch: bool) -> object:
         """Run function from self.multiprocessing()"""
         p = MultiProcess(lock, self._logger)
@@ -280,6 +457,11 @@ class ApproachComparator:
         p.status = "OK"
         return p.finish(terminate_all=True)
 
+    @staticmethod
+    def _run_interpreter(func, args: list, lock: object, batch: bool) -> object:
+        """Run function from self.interpreters(), comparator and its logger stay in main interpreter"""
+        return func(args, lock) if not batch else [func(value, lock) for value in args]
+
     def _run_thread(self, func, args: list, lock: object, batch: bool) -> object:
         """Run function from self.threading()"""
         p = ThreadProcess(lock, self._logger)
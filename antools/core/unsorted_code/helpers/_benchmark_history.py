@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+BENCHMARK HISTORY CLASS
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import tempfile
+
+from antools.helpers._timing_stats import TimingStats
+from antools.scheduling import get_gil_status, get_total_memory
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created TEXT NOT NULL,
+    name TEXT NOT NULL,
+    git_commit TEXT,
+    git_dirty INTEGER,
+    python TEXT NOT NULL,
+    gil TEXT,
+    machine TEXT NOT NULL,
+    machine_info TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    approach TEXT NOT NULL,
+    median REAL NOT NULL,
+    iqr REAL,
+    ci_low REAL,
+    ci_high REAL,
+    samples TEXT NOT NULL
+);
+"""
+
+_RUN_COLUMNS = [
+    "id",
+    "created",
+    "name",
+    "git_commit",
+    "git_dirty",
+    "python",
+    "gil",
+    "machine",
+    "machine_info",
+]
+_RESULT_COLUMNS = ["approach", "median", "iqr", "ci_low", "ci_high", "samples"]
+
+
+def _git(*args: str) -> str:
+    """Returns output of git command in current directory, None outside of git repository."""
+    try:
+        result = subprocess.run(
+            ["git", *args], capture_output=True, text=True, timeout=10, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip()
+
+
+def get_environment() -> dict:
+    """Returns tags of benchmark run -> git commit (and if working tree is dirty), Python version, GIL status
+    and machine fingerprint. Fingerprint is hash of hardware and OS, so runs of the same machine are comparable.
+    """
+
+    machine_info = {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "memory": get_total_memory(),
+    }
+    fingerprint = hashlib.sha256(
+        json.dumps(machine_info, sort_keys=True).encode()
+    ).hexdigest()[:12]
+    machine_info["node"] = platform.node()
+
+    commit = _git("rev-parse", "HEAD")
+    dirty = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "git_commit": commit or None,
+        "git_dirty": None if dirty is None else int(bool(dirty)),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "gil": get_gil_status(),
+        "machine": fingerprint,
+        "machine_info": json.dumps(machine_info, sort_keys=True),
+    }
+
+
+class BenchmarkHistory:
+    """Local history of ApproachComparator results, stored in SQLite database or JSON file.
+    Every record is a run tagged with git commit, Python version and machine fingerprint, it keeps
+    timings of all approaches, so runs can be compared later and regressions can fail CI:
+
+        python -m antools.helpers compare --db benchmark_history.sqlite --threshold 0.05
+
+    ...
+
+    Attributes
+    ----------
+    path : str
+        Path of history file.
+    storage : str
+        Storage of history, "sqlite" or "json" (by suffix of path).
+
+    Methods
+    -------
+    __init__(self, path:str="benchmark_history.sqlite", storage:str=None)
+        Class constructor.
+    record(self, comparator:ApproachComparator, name:str=None) -> int
+        Store results of comparator as new run, returns id of the run.
+    runs(self) -> list
+        Returns all runs with their results, oldest first.
+    compare(self, baseline=None, current=None, threshold:float=0.05) -> list
+        Compare results of current runs against baseline runs.
+
+    Examples
+    -------
+    antools/helpers/_examples/_example_benchmark_history.py
+    """
+
+    STORAGE_OPTIONS = ["sqlite", "json"]
+
+    def __init__(self, path: str = "benchmark_history.sqlite", storage: str = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path of history file (default is "benchmark_history.sqlite").
+        storage : str, optional
+            Storage of history (default is None -> "json" for .json files, otherwise "sqlite"). Options are [None, "sqlite", "json"].
+        """
+
+        if storage is None:
+            storage = "json" if path.lower().endswith(".json") else "sqlite"
+        if storage not in self.STORAGE_OPTIONS:
+            raise ValueError(
+                f"Storage <{storage}> is not valid! It must be in {[None] + self.STORAGE_OPTIONS}!"
+            )
+
+        self.path = path
+        self.storage = storage
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"BenchmarkHistory(path={self.path}, storage={self.storage})"
+
+    def record(self, comparator: object, name: str = None) -> int:
+        """Store results of comparator as new run.
+
+        Parameters
+        ----------
+        comparator : ApproachComparator
+            Comparator with measured approaches.
+        name : str, optional
+            Name of benchmark (default is None -> name of compared function).
+
+        Returns
+        ----------
+        Id of the run
+        """
+
+        if not comparator.stats:
+            raise ValueError("Comparator has no results to be recorded!")
+
+        run = get_environment()
+        run["created"] = datetime.datetime.now().isoformat(timespec="seconds")
+        run["name"] = name or getattr(comparator._func, "__qualname__", "benchmark")
+        run["results"] = [
+            {
+                "approach": approach,
+                "median": stats.median,
+                "iqr": stats.iqr,
+                "ci_low": stats.ci[0],
+                "ci_high": stats.ci[1],
+                # outliers are kept, they are rejected again when stats are rebuilt
+                "samples": stats.samples + stats.outliers,
+            }
+            for approach, stats in comparator.stats.items()
+        ]
+
+        if self.storage == "sqlite":
+            return self._insert_sqlite(run)
+        return self._insert_json(run)
+
+    def runs(self) -> list:
+        """Returns all runs with their results, oldest first."""
+
+        if self.storage == "sqlite":
+            return self._read_sqlite()
+        return self._read_json()["runs"]
+
+    def compare(
+        self, baseline: object = None, current: object = None, threshold: float = 0.05
+    ) -> list:
+        """Compare results of current runs against baseline runs, benchmark by benchmark.
+
+        Parameters
+        ----------
+        baseline : int or str, optional
+            Run id or git commit (prefix) of baseline (default is None -> for every current run the previous
+            run of the same benchmark on the same machine and Python version).
+        current : int or str, optional
+            Run id or git commit (prefix) of current runs (default is None -> the latest run of every benchmark).
+        threshold : float, optional
+            Relative slowdown of median which is a regression, if it is also significant (default is 0.05).
+
+        Returns
+        ----------
+        List of dictionaries with keys name, approach, baseline_run, current_run, baseline, current, change,
+        significant, regression and comparable (False if machine or Python version differ).
+        Raises ValueError if baseline or current is given and matches no run.
+        """
+
+        runs = self.runs()
+        current_runs = self._select(runs, current)
+        for ref in [baseline, current]:
+            if ref is not None and not self._select(runs, ref):
+                raise ValueError(
+                    f"Run <{ref}> was not found in benchmark history {self.path}!"
+                )
+        rows = []
+        for run in current_runs:
+            if baseline is None:
+                candidates = [
+                    r
+                    for r in runs
+                    if r["id"] < run["id"]
+                    and r["name"] == run["name"]
+                    and r["machine"] == run["machine"]
+                    and r["python"] == run["python"]
+                ]
+            else:
+                candidates = [
+                    r for r in self._select(runs, baseline) if r["name"] == run["name"]
+                ]
+            if not candidates:
+                continue
+            base = candidates[-1]
+
+            base_results = {r["approach"]: r for r in base["results"]}
+            for result in run["results"]:
+                if result["approach"] not in base_results:
+                    continue
+                base_stats = TimingStats(base_results[result["approach"]]["samples"])
+                stats = TimingStats(result["samples"])
+                ratio, low, high = base_stats.compare(stats)
+                change = stats.median / base_stats.median - 1
+                rows.append(
+                    {
+                        "name": run["name"],
+                        "approach": result["approach"],
+                        "baseline_run": base["id"],
+                        "current_run": run["id"],
+                        "baseline": base_stats.median,
+                        "current": stats.median,
+                        "change": change,
+                        "significant": low > 1 or high < 1,
+                        "regression": change > threshold and low > 1,
+                        "comparable": base["machine"] == run["machine"]
+                        and base["python"] == run["python"],
+                    }
+                )
+        return rows
+
+    @staticmethod
+    def _select(runs: list, ref: object) -> list:
+        """Returns runs selected by run id or git commit prefix, the latest run of every benchmark."""
+
+        if ref is None:
+            selected = runs
+        elif isinstance(ref, int) or str(ref).isdigit():
+            selected = [run for run in runs if run["id"] == int(ref)]
+        else:
+            selected = [
+                run for run in runs if (run["git_commit"] or "").startswith(str(ref))
+            ]
+
+        latest = {}
+        for run in selected:
+            latest[run["name"]] = run
+        return sorted(latest.values(), key=lambda run: run["id"])
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _insert_sqlite(self, run: dict) -> int:
+        connection = self._connect()
+        try:
+            with connection:
+                cursor = connection.execute(
+                    f"INSERT INTO runs ({', '.join(_RUN_COLUMNS[1:])}) VALUES ({', '.join('?' * (len(_RUN_COLUMNS) - 1))})",
+                    [run[column] for column in _RUN_COLUMNS[1:]],
+                )
+                run_id = cursor.lastrowid
+                connection.executemany(
+                    f"INSERT INTO results (run_id, {', '.join(_RESULT_COLUMNS)}) VALUES (?, {', '.join('?' * len(_RESULT_COLUMNS))})",
+                    [
+                        [run_id]
+                        + [result[column] for column in _RESULT_COLUMNS[:-1]]
+                        + [json.dumps(result["samples"])]
+                        for result in run["results"]
+                    ],
+                )
+        finally:
+            connection.close()
+        return run_id
+
+    def _read_sqlite(self) -> list:
+        if not os.path.exists(self.path):
+            return []
+        connection = self._connect()
+        try:
+            runs = {
+                row[0]: dict(zip(_RUN_COLUMNS, row), results=[])
+                for row in connection.execute(
+                    f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs ORDER BY id"
+                )
+            }
+            for row in connection.execute(
+                f"SELECT run_id, {', '.join(_RESULT_COLUMNS)} FROM results ORDER BY rowid"
+            ):
+                result = dict(zip(_RESULT_COLUMNS, row[1:]))
+                result["samples"] = json.loads(result["samples"])
+                runs[row[0]]["results"].append(result)
+        finally:
+            connection.close()
+        return list(runs.values())
+
+    def _read_json(self) -> dict:
+        if not os.path.exists(self.path):
+            return {"runs": []}
+        with open(self.path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _insert_json(self, run: dict) -> int:
+        history = self._read_json()
+        run["id"] = max([r["id"] for r in history["runs"]], default=0) + 1
+        history["runs"].append(run)
+
+        # written to temporary file first, so interrupted write does not corrupt the history
+        folder = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(history, file, indent=1)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return run["id"]
@@ -3,11 +3,11 @@
 HELPERS EXAMPLES
 """
 
-import multiprocessing as mp
 import threading
 
 # APPROACH COMPARATOR
 from antools.helpers import ApproachComparator
+from antools.multiprocessing import SyncPrimitives
 
 
 def _is_prime(args, lock):
@@ -27,17 +27,17 @@ def _is_prime(args, lock):
 
 
 if __name__ == "__main__":
-    mp_lock = mp.Manager().Lock()
+    mp_lock = SyncPrimitives()
     thread_lock = threading.Lock()
 
     NUMS = []
     for i in range(1, 1000):
         NUMS.append([i, i + 1])
 
-    mp_lock = mp.Manager().Lock()
-    thread_lock = threading.Lock()
-
-    Comparator = ApproachComparator(_is_prime, args=NUMS)
-    # Comparator.compare_all()
+    # EVERY APPROACH IS RUN ONCE UNTIMED, THEN AT LEAST 10 TIMES AND AT LEAST 1 SECOND
+    Comparator = ApproachComparator(
+        _is_prime, args=NUMS, warmup=1, repeats=10, min_time=1.0
+    )
+    # Comparator.compare_all(mp_lock=mp_lock, thread_lock=thread_lock)
     # Comparator.multiprocessing()
     Comparator()
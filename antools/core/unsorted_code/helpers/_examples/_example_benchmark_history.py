@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+HELPERS EXAMPLES
+"""
+
+# BENCHMARK HISTORY
+from antools.helpers import ApproachComparator, BenchmarkHistory
+
+
+def _square_sum(args, lock):
+    return sum(value * value for value in range(args))
+
+
+if __name__ == "__main__":
+    # RUNS ARE TAGGED WITH GIT COMMIT, PYTHON VERSION AND MACHINE FINGERPRINT
+    History = BenchmarkHistory("benchmark_history.sqlite")
+
+    Comparator = ApproachComparator(
+        _square_sum, args=[10_000] * 200, warmup=1, repeats=10, min_time=0.5
+    )
+    Comparator.main()
+    Comparator.threading(max_workers=4)
+    History.record(Comparator, name="square_sum")
+
+    # COMPARE THE LATEST RUN WITH PREVIOUS RUN OF THE SAME MACHINE AND PYTHON, 5 % SLOWDOWN IS REGRESSION
+    for row in History.compare(threshold=0.05):
+        print(row)
+
+    # THE SAME FROM COMMAND LINE, EXIT CODE IS 1 IF ANY APPROACH REGRESSED
+    # python -m antools.helpers compare --db benchmark_history.sqlite --threshold 0.05
+    # python -m antools.helpers compare --baseline <git commit> --current <git commit>
+    # python -m antools.helpers history
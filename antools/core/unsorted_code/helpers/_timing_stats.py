@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+TIMING STATS CLASS
+"""
+
+import math
+import random
+import statistics
+
+
+def _percentile(values: list, q: float) -> float:
+    """Returns q-th percentile (0 - 1) of sorted values, linear interpolation."""
+
+    if len(values) == 1:
+        return values[0]
+    position = q * (len(values) - 1)
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+class TimingStats:
+    """Robust summary of repeated timings of one approach.
+    Samples outside of Tukey fences (1.5 IQR from quartiles) are rejected as outliers, e.g. runs hit
+    by garbage collection or other processes. Median of the rest is reported with its interquartile range
+    and bootstrap confidence interval, approaches are compared by bootstrap interval of ratio of medians.
+    With less than MIN_SAMPLES samples intervals are unbounded, so no difference is significant.
+
+    ...
+
+    Attributes
+    ----------
+    samples : list
+        Timings in seconds without outliers.
+    outliers : list
+        Rejected timings in seconds.
+    median : float
+        Median of samples.
+    q1 : float
+        First quartile of samples.
+    q3 : float
+        Third quartile of samples.
+    iqr : float
+        Interquartile range of samples, q3 - q1.
+    ci : tuple
+        (low, high) bootstrap confidence interval of median.
+    confidence : float
+        Confidence level of intervals.
+    MIN_SAMPLES : int
+        Minimal number of samples (without outliers) for bounded confidence intervals.
+
+    Methods
+    -------
+    __init__(self, samples:list, confidence:float=0.95, n_boot:int=2000, seed:int=None)
+        Class constructor.
+    compare(self, other:TimingStats) -> tuple
+        Returns (ratio, low, high), how many times self is faster than other with confidence interval.
+    is_faster(self, other:TimingStats) -> bool
+        True if self is significantly faster than other.
+    """
+
+    MIN_SAMPLES = 3
+
+    def __init__(
+        self,
+        samples: list,
+        confidence: float = 0.95,
+        n_boot: int = 2000,
+        seed: int = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        samples : list
+            Timings in seconds, at least one.
+        confidence : float, optional
+            Confidence level of intervals (default is 0.95).
+        n_boot : int, optional
+            Number of bootstrap resamples (default is 2000).
+        seed : int, optional
+            Seed of bootstrap resampling, for reproducible intervals (default is None).
+        """
+
+        if not samples:
+            raise ValueError("TimingStats need at least one sample!")
+        if not 0 < confidence < 1:
+            raise ValueError(
+                f"Confidence must be between 0 and 1, inserted value is {confidence}!"
+            )
+
+        self.confidence = confidence
+        self.n_boot = n_boot
+        self._rng = random.Random(seed)
+
+        ordered = sorted(samples)
+        q1, q3 = _percentile(ordered, 0.25), _percentile(ordered, 0.75)
+        fence = 1.5 * (q3 - q1)
+        self.samples = [x for x in samples if q1 - fence <= x <= q3 + fence]
+        self.outliers = [x for x in samples if not q1 - fence <= x <= q3 + fence]
+
+        ordered = sorted(self.samples)
+        self.median = statistics.median(ordered)
+        self.q1 = _percentile(ordered, 0.25)
+        self.q3 = _percentile(ordered, 0.75)
+        self.iqr = self.q3 - self.q1
+        self.ci = (
+            self._interval(self._bootstrap(lambda a: a))
+            if len(self.samples) >= self.MIN_SAMPLES
+            else (0.0, math.inf)
+        )
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"TimingStats(median={self.median}, iqr={self.iqr}, ci={self.ci}, n={len(self.samples)}, outliers={len(self.outliers)})"
+
+    def compare(self, other: "TimingStats") -> tuple:
+        """Returns how many times self is faster than other.
+
+        Parameters
+        ----------
+        other : TimingStats
+            Timings of other approach.
+
+        Returns
+        ----------
+        (ratio, low, high) -> ratio of medians other / self with its bootstrap confidence interval,
+        (ratio, 0, inf) if any of them has less than MIN_SAMPLES samples
+        """
+
+        ratio = other.median / self.median
+        if min(len(self.samples), len(other.samples)) < self.MIN_SAMPLES:
+            return ratio, 0.0, math.inf
+
+        ratios = self._bootstrap(lambda a: other._resample_median() / a)
+        return ratio, *self._interval(ratios)
+
+    def is_faster(self, other: "TimingStats") -> bool:
+        """True if self is significantly faster than other, i.e. whole confidence interval of ratio is above 1."""
+        return self.compare(other)[1] > 1
+
+    def _resample_median(self) -> float:
+        """Median of one bootstrap resample."""
+        return statistics.median(self._rng.choices(self.samples, k=len(self.samples)))
+
+    def _bootstrap(self, statistic) -> list:
+        """Returns sorted statistic(median of resample) of n_boot resamples."""
+        return sorted(statistic(self._resample_median()) for _ in range(self.n_boot))
+
+    def _interval(self, values: list) -> tuple:
+        """Returns (low, high) percentiles of sorted bootstrap values at confidence level."""
+        alpha = (1 - self.confidence) / 2
+        return _percentile(values, alpha), _percentile(values, 1 - alpha)
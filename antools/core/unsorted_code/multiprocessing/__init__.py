@@ -1,4 +1,10 @@
 from antools.logging._logger_class import _get_mp_logger
 
-from ._mp_handler import MultiProcessHandler
+from ._result_envelope import ResultEnvelope
 from ._mp_process_class import MultiProcess
+from ._shared_array import SharedArray
+from ._start_method import START_METHOD_OPTIONS, get_mp_context
+from ._sync_primitives import SyncPrimitives, TimedPrimitive
+from ._remote import RemoteAgent, RemoteBackend
+from ._worker_pool import WorkerPool
+from ._mp_handler import MultiProcessHandler
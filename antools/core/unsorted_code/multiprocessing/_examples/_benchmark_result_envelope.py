@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+RESULT ENVELOPE BENCHMARK
+
+Compares whole MultiProcess returned from finish() against ResultEnvelope.
+Measures bytes sent back per task and pickle/unpickle time with the pickler used by
+ProcessPoolExecutor (ForkingPickler, default protocol).
+"""
+
+import multiprocessing as mp
+import pickle
+import time
+from multiprocessing.reduction import ForkingPickler
+
+import numpy as np
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcess
+
+REPEATS = 200
+
+
+def _measure(obj) -> tuple:
+    """Returns (bytes, dumps time in ms, loads time in ms)"""
+
+    payload = ForkingPickler.dumps(obj)
+    st = time.perf_counter()
+    for _ in range(REPEATS):
+        ForkingPickler.dumps(obj)
+    dumps_time = (time.perf_counter() - st) / REPEATS * 1000
+
+    st = time.perf_counter()
+    for _ in range(REPEATS):
+        pickle.loads(payload)
+    loads_time = (time.perf_counter() - st) / REPEATS * 1000
+
+    return len(payload), dumps_time, loads_time
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="ERROR", file_log=False)
+    lock = mp.Lock()
+
+    DATA = {
+        "no data": None,
+        "list of 100 tuples": [(i, i % 2 == 0) for i in range(100)],
+        "list of 10000 tuples": [(i, i % 2 == 0) for i in range(10_000)],
+        "ndarray 8 MB": np.random.rand(1_000_000),
+    }
+
+    print(
+        f"{'DATA':<22}{'RESULT':<16}{'BYTES':>12}{'DUMPS [ms]':>12}{'LOADS [ms]':>12}"
+    )
+    for name, data in DATA.items():
+        p = MultiProcess(None, logger, log=False)
+        p.data = data
+        p.status = "OK"
+        p.finish()
+
+        for result_name, result in [
+            ("MultiProcess", p),
+            ("ResultEnvelope", p.envelope()),
+        ]:
+            size, dumps_time, loads_time = _measure(result)
+            print(
+                f"{name:<22}{result_name:<16}{size:>12,}{dumps_time:>12.4f}{loads_time:>12.4f}"
+            )
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+START METHOD BENCHMARK
+
+Compares pool startup latency of fork, spawn, forkserver and forkserver with preloaded modules.
+Every method is measured in a fresh interpreter, because fork server is started only once per process.
+STARTUP -> time until every worker has returned its first task (workers import numpy),
+for forkserver it includes start of the server (and import of preloaded modules).
+WARM ROUND -> the same tasks again on already running workers.
+RUN_FUNC -> whole MultiProcessHandler.run_func with its own pool.
+"""
+
+import concurrent.futures
+import multiprocessing as mp
+import os
+import time
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler, get_mp_context
+
+MAX_WORKERS = min(4, os.cpu_count())
+PRELOAD = ["numpy", "antools.multiprocessing"]
+SLEEP = 0.05
+
+
+def _first_task(args) -> int:
+    import numpy  # already imported when preloaded
+
+    time.sleep(SLEEP)  # keeps worker busy, so every worker gets one task
+    return os.getpid()
+
+
+def _func(args, lock) -> float:
+    import numpy as np
+
+    return float(np.sqrt(args))
+
+
+def _measure(start_method: str, preload: list, queue: object):
+    """Runs in fresh interpreter, puts (startup, warm round, run_func) times in ms to queue."""
+
+    ctx = get_mp_context(start_method, preload)
+    st = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(MAX_WORKERS, mp_context=ctx) as pool:
+        list(pool.map(_first_task, range(MAX_WORKERS)))
+        startup = time.perf_counter() - st - SLEEP
+
+        st = time.perf_counter()
+        list(pool.map(_first_task, range(MAX_WORKERS)))
+        warm = time.perf_counter() - st - SLEEP
+
+    logger = get_logger(level="ERROR", file_log=False)
+    handler = MultiProcessHandler(logger, start_method=start_method, preload=preload)
+    st = time.perf_counter()
+    handler.run_func(_func, range(100), max_workers=MAX_WORKERS)
+    run_func = time.perf_counter() - st
+
+    queue.put((startup * 1000, warm * 1000, run_func * 1000))
+
+
+if __name__ == "__main__":
+
+    CONFIGS = [
+        ("fork", None),
+        ("spawn", None),
+        ("forkserver", None),
+        ("forkserver", PRELOAD),
+    ]
+    spawn = mp.get_context("spawn")
+
+    print(f"MAX_WORKERS={MAX_WORKERS}, PRELOAD={PRELOAD}")
+    print(
+        f"{'START METHOD':<24}{'STARTUP [ms]':>14}{'WARM ROUND [ms]':>17}{'RUN_FUNC [ms]':>15}"
+    )
+    for start_method, preload in CONFIGS:
+        if start_method not in mp.get_all_start_methods():
+            continue
+
+        queue = spawn.Queue()
+        p = spawn.Process(target=_measure, args=(start_method, preload, queue))
+        p.start()
+        startup, warm, run_func = queue.get()
+        p.join()
+
+        name = f"{start_method}{' + preload' if preload else ''}"
+        print(f"{name:<24}{startup:>14.1f}{warm:>17.1f}{run_func:>15.1f}")
@@ -1,4 +1,3 @@
-import multiprocessing as mp
 import time
 
 from antools.logging import get_logger
@@ -12,7 +11,7 @@ def worker_A(lock, logger, args=None):
     p.data = ["A", "B", "C"]
     time.sleep(1)
 
-    return p.finish(terminate_all=False)
+    return p.finish(terminate_all=False).envelope()
 
 
 def worker_B(lock, logger, args=None):
@@ -22,7 +21,7 @@ def worker_B(lock, logger, args=None):
     p.data = ["D", "E", "F"]
     time.sleep(1)
 
-    return p.finish(terminate_all=False)
+    return p.finish(terminate_all=False).envelope()
 
 
 def worker_C(lock, logger, args=None):
@@ -32,7 +31,7 @@ def worker_C(lock, logger, args=None):
     p.data = ["G", "H", "I"]
     time.sleep(1)
 
-    return p.finish(terminate_all=False)
+    return p.finish(terminate_all=False).envelope()
 
 
 def worker_D(lock, logger, args=None):
@@ -43,7 +42,7 @@ def worker_D(lock, logger, args=None):
     time.sleep(1)
     p.error = "SOME ERROR"
 
-    return p.finish(terminate_all=False)
+    return p.finish(terminate_all=False).envelope()
 
 
 def worker_E(lock, logger, args=None):
@@ -53,7 +52,7 @@ def worker_E(lock, logger, args=None):
     p.data = ["A", "B", "C"]
     time.sleep(1)
 
-    return p.finish(terminate_all=False)
+    return p.finish(terminate_all=False).envelope()
 
 
 def worker_F(lock, logger, args=None):
@@ -64,7 +63,7 @@ def worker_F(lock, logger, args=None):
     p.status = "X"
     time.sleep(1)
 
-    return p.finish(terminate_all=False)
+    return p.finish(terminate_all=False).envelope()
 
 
 def my_func(args, lock):
@@ -76,7 +75,6 @@ def my_func(args, lock):
 if __name__ == "__main__":
 
     logger = get_logger(level="INFO", file_log=False)
-    lock = mp.Manager().Lock()
 
     # FIRST EXAMPLE
     # RUN FUNTIONS AS SOON AS ITS DEPENDENCY IS RESOLVED
@@ -102,3 +100,19 @@ if __name__ == "__main__":
     workers = 8 if len(DATA) >= 10000 else 4
     data = Scheduler.run_func(my_func, args=DATA, max_workers=workers)
     print(data)
+
+    # THIRD EXAMPLE
+    # SKEWED WORK -> SMALL CHUNKS STOLEN FROM SHARED QUEUE BY IDLE WORKERS
+    Scheduler = MultiProcessHandler(logger)
+    data = Scheduler.run_func(
+        my_func, args=DATA, max_workers=4, chunking="stealing", chunksize=10
+    )
+    print(data)
+
+    # FOURTH EXAMPLE
+    # STREAM RESULTS FROM LAZY INPUT, AT MOST 8 CHUNKS IN MEMORY
+    Scheduler = MultiProcessHandler(logger)
+    for result in Scheduler.imap(
+        my_func, (i for i in range(1000)), max_workers=4, chunksize=50, max_in_flight=8
+    ):
+        print(result) if result[0] % 100 == 0 else None
@@ -4,11 +4,10 @@ MULTIPROCESSING EXAMPLES
 """
 
 import concurrent.futures
-import multiprocessing as mp
 import time
 
 from antools.logging import get_logger
-from antools.multiprocessing import MultiProcess
+from antools.multiprocessing import MultiProcess, SyncPrimitives
 
 
 def worker_A(lock, logger):
@@ -39,11 +38,14 @@ def worker_B(lock, logger, result):
 if __name__ == "__main__":
 
     logger = get_logger(level="DEBUG", file_log=False)
-    lock = mp.Manager().Lock()
+    sync = SyncPrimitives()
+    lock = sync.lock
 
     logger.info("Starting multiprocessing ... ")
 
-    with concurrent.futures.ProcessPoolExecutor() as executor:
+    with concurrent.futures.ProcessPoolExecutor(
+        initializer=SyncPrimitives.initializer, initargs=(sync,)
+    ) as executor:
 
         p1 = executor.submit(worker_A, lock, logger)
         p2 = executor.submit(worker_A, lock, logger)
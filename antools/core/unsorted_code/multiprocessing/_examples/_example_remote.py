@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+REMOTE BACKEND EXAMPLES
+"""
+
+import multiprocessing as mp
+import socket
+
+from antools.logging import get_logger
+from antools.multiprocessing import (
+    MultiProcess,
+    MultiProcessHandler,
+    RemoteAgent,
+    RemoteBackend,
+)
+
+
+def square(args, lock):
+    return socket.gethostname(), args**2
+
+
+def load(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+    p.data = list(range(10))
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+def total(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+    p.data = sum(sum(value) for value in args.values())
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+def start_agent(address, authkey, name):
+    # ON OTHER HOST: RemoteAgent(("<backend host>", <port>), <backend.authkey>, max_workers=8).serve_forever()
+    RemoteAgent(address, authkey, max_workers=2, name=name).serve_forever()
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+
+    # BACKEND LISTENS ON FREE PORT, USE ("0.0.0.0", <port>) FOR OTHER HOSTS
+    # AGENTS NEED SECRET backend.authkey, IT IS RANDOM UNLESS authkey IS GIVEN
+    with RemoteBackend(batch_size=4, logger=logger) as backend:
+        agents = [
+            mp.Process(
+                target=start_agent,
+                args=(backend.address, backend.authkey, f"agent-{i}"),
+            )
+            for i in range(2)
+        ]
+        for agent in agents:
+            agent.start()
+        backend.wait_for_agents(2, timeout=30)
+
+        Scheduler = MultiProcessHandler(logger, backend=backend)
+
+        # FIRST EXAMPLE
+        # CHUNKS ARE SENT TO AGENTS IN COMPRESSED BATCHES
+        data = Scheduler.run_func(
+            square,
+            args=range(1000),
+            max_workers=backend.max_workers,
+            chunking="fixed",
+            chunksize=50,
+        )
+        print(data[:5])
+
+        # SECOND EXAMPLE
+        # SCHEDULE NODES RUN ON AGENTS AS WELL
+        data = Scheduler.run_schedule({load: [], total: [load]})
+        print(data)
+
+    for agent in agents:
+        agent.join()
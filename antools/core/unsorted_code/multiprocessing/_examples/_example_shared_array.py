@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+SHARED ARRAY EXAMPLES
+"""
+
+import numpy as np
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcess, MultiProcessHandler, SharedArray
+
+
+def row_sum(row, lock):
+    return float(row.sum())
+
+
+def worker_A(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+
+    p.data = np.random.rand(2_000, 1_000)
+
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+def worker_B(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+
+    # SharedArray handle, no copy of the array is made
+    array = np.asarray(args["worker_A"])
+    p.data = float(array.mean())
+
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+
+    # FIRST EXAMPLE
+    # HANDLE TO ARRAY IN SHARED MEMORY, SLICES ARE HANDLES TOO
+    array = SharedArray.create(np.arange(10, dtype=np.float64))
+    print(array, array[2:5], np.asarray(array[2:5]))
+    array.unlink()
+
+    # SECOND EXAMPLE
+    # WORKERS GET VIEWS OF THEIR ROWS INSTEAD OF PICKLED CHUNKS
+    DATA = np.random.rand(100_000, 100)
+    Scheduler = MultiProcessHandler(logger)
+    for shared_memory in [None, "shm", "memmap"]:
+        data = Scheduler.run_func(
+            row_sum, args=DATA, max_workers=4, shared_memory=shared_memory
+        )
+        print(shared_memory, len(data), round(sum(data), 3))
+
+    # THIRD EXAMPLE
+    # ARRAY RESULT IS HANDED TO DEPENDENT FUNCTION THROUGH SHARED MEMORY
+    SCHEDULE = {worker_A: None, worker_B: worker_A}
+    data = Scheduler.run_schedule(schedule=SCHEDULE, max_workers=2, shared_memory="shm")
+    print(data["worker_B"])
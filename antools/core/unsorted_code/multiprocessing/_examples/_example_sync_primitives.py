@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+SYNC PRIMITIVES EXAMPLES
+"""
+
+import concurrent.futures
+import multiprocessing as mp
+import time
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler, SyncPrimitives
+
+
+def count_under_lock(args, lock):
+    for _ in range(1_000):
+        lock.acquire()
+        lock.release()
+    return args
+
+
+def limited_section(args, sync):
+    with sync.semaphore:
+        time.sleep(0.01)
+    return args
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+
+    # FIRST EXAMPLE
+    # HANDLER USES ITS NATIVE LOCK WHEN NO LOCK IS GIVEN, WAIT TIME IS LOGGED
+    Scheduler = MultiProcessHandler(logger)
+    st = time.perf_counter()
+    Scheduler.run_func(count_under_lock, args=list(range(16)), max_workers=4)
+    print(f"Native lock: {round(time.perf_counter() - st, 5)} seconds")
+    print(Scheduler.sync.stats())
+
+    # SAME WORK WITH MANAGER LOCK, EVERY ACQUIRE IS A CALL TO MANAGER PROCESS
+    st = time.perf_counter()
+    Scheduler.run_func(
+        count_under_lock, args=list(range(16)), max_workers=4, lock=mp.Manager().Lock()
+    )
+    print(f"Manager lock: {round(time.perf_counter() - st, 5)} seconds")
+
+    # SECOND EXAMPLE
+    # SEMAPHORE LIMITS SECTION TO 2 PROCESSES AT ONCE, TASKS GET REFERENCE TO PRIMITIVES
+    sync = SyncPrimitives(semaphore_value=2)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=4, initializer=SyncPrimitives.initializer, initargs=(sync,)
+    ) as executor:
+        list(executor.map(limited_section, range(20), [sync] * 20))
+    print(sync.stats()["semaphore"])
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+WORKER POOL EXAMPLES
+"""
+
+import os
+import random
+import time
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler, WorkerPool
+
+_LEAK = []
+
+
+def unreliable_func(args, lock):
+    if args == 13:
+        time.sleep(3600)  # hangs forever
+    if random.random() < 0.05:
+        raise ValueError("Random failure!")
+    return args * 2
+
+
+def leaking_func(args, lock):
+    _LEAK.append(bytearray(1024**2))  # 1 MB never freed
+    return os.getpid()
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    Scheduler = MultiProcessHandler(logger)
+
+    # FIRST EXAMPLE
+    # HUNG CHUNK IS KILLED AFTER 2 SECONDS, FAILED CHUNKS ARE RETRIED
+    data = Scheduler.run_func(
+        unreliable_func,
+        args=list(range(100)),
+        max_workers=4,
+        chunking="fixed",
+        chunksize=5,
+        timeout=2,
+        retries=2,
+    )
+    print(data)
+
+    # SECOND EXAMPLE
+    # WORKERS ARE RECYCLED WHEN THEY GROW OVER 100 MB OR AFTER 20 CHUNKS
+    data = Scheduler.run_func(
+        leaking_func,
+        args=list(range(400)),
+        max_workers=4,
+        chunking="fixed",
+        chunksize=1,
+        max_tasks_per_worker=20,
+        max_worker_rss=100 * 1024**2,
+    )
+    print(f"Used worker processes: {len(set(data))}")
+
+    # THIRD EXAMPLE
+    # POOL CAN BE USED DIRECTLY
+    with WorkerPool(max_workers=2) as pool:
+        print(pool.map(pow, [(2, 10), (3, 3), ("x", 2)], timeout=1))
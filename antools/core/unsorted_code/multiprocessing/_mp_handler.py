@@ -5,11 +5,51 @@ MULTIPROCESS HANDLER
 
 import concurrent.futures
 import os
-import time
 
-import numpy as np
-
-from antools.multiprocessing import MultiProcess
+from antools.multiprocessing import (
+    MultiProcess,
+    ResultEnvelope,
+    RemoteBackend,
+    SharedArray,
+    SyncPrimitives,
+    WorkerPool,
+    get_mp_context,
+)
+from antools.scheduling import (
+    AutoTuner,
+    CancelToken,
+    Checkpoint,
+    InterpreterPool,
+    LoopExecutor,
+    NodeCache,
+    ObjectStore,
+    ProcessPool,
+    ScheduleEngine,
+    Telemetry,
+    as_sequence,
+    get_chunk_bounds,
+    iter_chunks,
+    is_gil_enabled,
+    partition,
+)
+
+# shared work queue of the worker process, set by pool initializer
+_work_queue = None
+
+
+def _init_worker(
+    sync: SyncPrimitives,
+    work_queue: object = None,
+    initializer=None,
+    initargs: tuple = (),
+):
+    """Pool initializer, set sync primitives and shared work queue in worker process
+    and run user initializer."""
+    global _work_queue
+    SyncPrimitives.initializer(sync)
+    _work_queue = work_queue
+    if initializer is not None:
+        initializer(*initargs)
 
 
 class MultiProcessHandler:
@@ -21,27 +61,81 @@ class MultiProcessHandler:
     ----------
     _logger : object
         Logger class.
+    sync : SyncPrimitives
+        Native lock, semaphore and event shared with workers, lock is used when no lock is given.
+    backend : RemoteBackend
+        If set, chunks and functions run on remote agents instead of local processes.
+    start_method : str
+        Start method of worker processes.
+    _ctx : object
+        Multiprocessing context of worker processes and sync primitives.
 
     Methods
     -------
-    __init__(self, logger:object)
+    __init__(self, logger:object, backend:RemoteBackend=None, start_method:str=None, preload:list=None)
         Class constructor.
     run_schedule(self):
         Run multiple functions dependent between themselves.
     run_func(self)
         Run function in multiprocess.
+    imap(self)
+        Lazily run function in multiprocess, yield results in order of args.
+    imap_unordered(self)
+        Lazily run function in multiprocess, yield results as chunks finish.
 
     Examples
     -------
     antools/multiprocessing/_examples/_example_mp_handler.py
     """
 
-    def __init__(self, logger):
-        """Class constructor."""
+    EXECUTOR_OPTIONS = [None, "process", "thread", "interpreter"]
+
+    def __init__(
+        self,
+        logger,
+        backend: RemoteBackend = None,
+        start_method: str = None,
+        preload: list = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        logger : object
+            Logger class.
+        backend : RemoteBackend, optional
+            If set, chunks and functions run on remote agents (default is None -> local processes).
+        start_method : str, optional
+            Start method of worker processes (default is None -> platform default). Options are [None, "fork", "spawn", "forkserver"].
+        preload : list, optional
+            Modules imported once in fork server, so workers start already warm (default is None). Only for "forkserver".
+        """
         self._logger = logger
+        self._ctx = get_mp_context(start_method, preload)
+        self.start_method = self._ctx.get_start_method()
+        self.sync = SyncPrimitives(ctx=self._ctx)
+        self.backend = backend
+
+    def __getstate__(self) -> dict:
+        """Handler is sent to workers without its backend and context."""
+        state = self.__dict__.copy()
+        state["backend"] = None
+        state["_ctx"] = None
+        return state
 
     def run_schedule(
-        self, schedule: dict, max_workers: int = os.cpu_count(), lock: object = None
+        self,
+        schedule: dict,
+        max_workers: int = os.cpu_count(),
+        lock: object = None,
+        shared_memory: str = None,
+        cache: NodeCache = None,
+        telemetry: Telemetry = None,
+        store: ObjectStore = None,
+        resources: dict = None,
+        on_error: str = "continue",
+        deadline: float = None,
+        token: CancelToken = None,
     ) -> dict:
         """Run multiplefunctions dependent between themselves.
 
@@ -53,118 +147,145 @@ class MultiProcessHandler:
         max_workers : int
             Max workers used for the process.
         lock
-            Multiprocessing lock.
+            Multiprocessing lock (default is None -> native lock of handler, see sync).
+        shared_memory : str, optional
+            If set, NumPy array results are passed to dependent functions as SharedArray handles
+            instead of pickled arrays (default is None). Options are [None, "shm", "memmap"].
+        cache : NodeCache, optional
+            If set, function with unchanged code and unchanged dependency results is loaded from cache
+            instead of being run (default is None).
+        telemetry : Telemetry, optional
+            If set, timings of every function are recorded to it (default is None).
+        store : ObjectStore, optional
+            If set, results of functions are kept in store and functions get dictionary
+            dependency name -> ObjectRef, read data by ref.get() (default is None).
+            Cannot be combined with shared_memory, cache or backend.
+        resources : dict, optional
+            Capacity shared by running functions, e.g. {"cpus": 8, "memory": 16 * 1024**3}, functions declare
+            their needs by node(cpus=..., memory=...) (default is None -> cpus is max_workers, memory is physical memory).
+        on_error : str, optional
+            What happens when function fails (default is "continue"). Options are ["continue", "fail_branch", "fail_fast"].
+            "fail_branch" -> dependent functions are skipped, "fail_fast" -> the whole schedule is cancelled.
+        deadline : float, optional
+            Seconds for the whole schedule, then it is cancelled (default is None -> no limit).
+        token : CancelToken, optional
+            Token to cancel the schedule from other thread (default is None). Running functions
+            check get_cancel_token().cancelled and should return early, skipped functions have status "CANCELLED".
+
+        Functions run in worker processes, functions declared by node(executor="thread") or
+        node(executor="asyncio") run in threads or on event loop of main process and get dependency data unpickled.
 
         Returns
         ----------
         Dictionary with results
         """
 
-        waiting_processes = {}
-        run_processes = {}
-        executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
-
-        for func, dependencies in schedule.items():
-            dependencies = [] if dependencies is None else dependencies
-            dependencies = (
-                [dependencies] if not isinstance(dependencies, list) else dependencies
+        if self.backend is not None and (shared_memory or store):
+            raise ValueError(
+                "Options shared_memory and store are not supported with backend!"
             )
-            waiting_processes[func] = dependencies
+        if shared_memory and store:
+            raise ValueError("Options shared_memory and store cannot be combined!")
 
-        self._logger.info(
-            f"Starting multiprocessing schedule with {max_workers} workers ..."
+        shared = {}
+        try:
+            return self._run_schedule(
+                schedule,
+                max_workers,
+                lock,
+                shared_memory,
+                shared,
+                cache,
+                telemetry,
+                store,
+                resources,
+                on_error,
+                deadline,
+                token,
+            )
+        finally:
+            for array in shared.values():
+                array.unlink()
+
+    def _run_schedule(
+        self,
+        schedule: dict,
+        max_workers: int,
+        lock: object,
+        shared_memory: str,
+        shared: dict,
+        cache: NodeCache,
+        telemetry: Telemetry,
+        store: ObjectStore,
+        resources: dict,
+        on_error: str,
+        deadline: float,
+        token: CancelToken,
+    ) -> dict:
+        """Run schedule, shared arrays are collected in shared dict."""
+
+        lock = self.sync.lock if lock is None else lock
+        sync_stats = self.sync.stats()
+
+        def prepare(dependency, value: object, executor: str) -> object:
+            # NumPy results are passed to process nodes in shared memory
+            if (
+                shared_memory
+                and executor == "process"
+                and hasattr(value, "__array_interface__")
+            ):
+                if dependency not in shared:
+                    shared[dependency] = SharedArray.create(
+                        value, backend=shared_memory
+                    )
+                value = shared[dependency]
+            return value
+
+        engine = ScheduleEngine(
+            self._logger,
+            factories={
+                "process": lambda: self._get_executor(max_workers),
+                "thread": lambda: concurrent.futures.ThreadPoolExecutor(max_workers),
+                "asyncio": lambda: LoopExecutor(max_workers),
+            },
+            locks={"process": lock, "thread": lock, "asyncio": lock},
+            default_executor="process",
+            name="multiprocessing",
         )
-        main_loop = True
-        while main_loop:
-
-            finished = True
-
-            # if no processes waiting to be done
-            if not waiting_processes:
-                break
-
-            new_funcs_waiting = []
-            for func, dependencies in waiting_processes.items():
-                func_to_be_done = True
-                for dependency in dependencies:
-
-                    # check if dependent function is running, else skip
-                    if dependency not in run_processes:
-                        func_to_be_done = False
-                        break
-
-                if func_to_be_done:
-                    new_funcs_waiting = [].append(func)
-
-                # if dependency is in running_processes, check if it is finished
-                if func_to_be_done:
-                    for dependency in dependencies:
-                        if run_processes[dependency]._state != "FINISHED":
-                            func_to_be_done = False
-                            break
-
-                    # if all dependencies are finished, run it
-                    if func_to_be_done:
-                        data = dict()
-                        for dependency in dependencies:
-                            data[func.__name__] = (
-                                run_processes[dependency].result().data
-                            )
-
-                        p = executor.submit(func, lock, self._logger, data)
-                        run_processes[func] = p
-
-            # delete new run functions in waiting processes
-            for func in run_processes:
-                if func in waiting_processes:
-                    del waiting_processes[func]
-
-            if waiting_processes:
-                finished = False
-
-            # if there remains functions dependent on each other, raise Error
-            elif waiting_processes and not new_funcs_waiting:
-                self._logger.error(
-                    f"Function dependencies are corrupted! Remaining dependent functions -> {list(waiting_processes)}",
-                    ValueError,
-                )
-                return False
-
-            else:
-                for func, process in run_processes.items():
-                    if process._state != "FINISHED":
-                        finished = False
-
-            if not finished:
-                time.sleep(0.1)
+        data = engine.run(
+            schedule,
+            max_workers,
+            cache,
+            telemetry,
+            prepare,
+            store,
+            resources,
+            on_error,
+            deadline,
+            token,
+        )
+        self._log_sync_stats(sync_stats)
 
-        # wait for all to be finished
-        while True:
-            finished = True
-            for func, process in run_processes.items():
-                if process._state != "FINISHED":
-                    finished = False
-
-            # if all finished
-            if finished:
-                status_list = []
-                for func, process in run_processes.items():
-                    data[func.__name__] = {
-                        "status": f"{process.result().status}",
-                        "data": f"{process.result().data}",
-                        "error": f"{process.result().error}",
-                    }
-
-                    status_list.append(process.result().status)
-                msg = f"Multiprocess schedule is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
-                self._logger.info(msg) if status_list.count("OK") == len(
-                    status_list
-                ) else self._logger.error(msg, terminate=False)
-
-                return data
+        return data
 
     def run_func(
-        self, func, args: list, max_workers: int = os.cpu_count(), lock: object = None
+        self,
+        func,
+        args: list,
+        max_workers: int = os.cpu_count(),
+        lock: object = None,
+        chunking: str = "static",
+        chunksize: int = None,
+        shared_memory: str = None,
+        timeout: float = None,
+        retries: int = 0,
+        max_tasks_per_worker: int = None,
+        max_worker_rss: int = None,
+        checkpoint: Checkpoint = None,
+        telemetry: Telemetry = None,
+        executor: str = None,
+        initializer=None,
+        initargs: tuple = (),
     ) -> list:
         """Run function in multiprocess.
 
@@ -174,52 +295,591 @@ class MultiProcessHandler:
             Name of function
         args : list
             List of data which should be processed
-        max_workers : int
-            Max workers used for the process.
+        max_workers : int or str
+            Max workers used for the process. If "auto", number of workers (up to usable CPUs, see
+            get_usable_cpus()) and chunk size are tuned by measured throughput during the run and the best
+            setting is reused by next runs of the function, chunking and chunksize are then ignored.
         lock
-            Multiprocessing lock.
+            Multiprocessing lock (default is None -> native lock of handler, see sync).
+        chunking : str, optional
+            Scheduling policy (default is "static"). Options are ["static", "fixed", "guided", "stealing"].
+        chunksize : int, optional
+            Chunk size for "fixed" and "stealing", minimal chunk size for "guided" (default is None -> computed).
+        shared_memory : str, optional
+            If set, NumPy array args are placed into shared storage and workers get views of their rows
+            instead of pickled chunks (default is None). Options are [None, "shm", "memmap"].
+        timeout : float, optional
+            Max seconds for one chunk, hung worker is killed and replaced (default is None -> no limit).
+        retries : int, optional
+            Number of retries of failed or timed out chunk (default is 0).
+        max_tasks_per_worker : int, optional
+            Worker is replaced after this number of chunks (default is None -> never).
+        max_worker_rss : int, optional
+            Worker is replaced when its resident memory exceeds this number of bytes (default is None -> never).
+        checkpoint : Checkpoint, optional
+            If set, every finished chunk is saved to checkpoint and chunks saved by previous run
+            of the same job are not run again (default is None). Chunks are then dispatched one by one
+            even for "stealing" chunking.
+        telemetry : Telemetry, optional
+            If set, timings of every chunk are recorded to it (default is None). Chunks are then dispatched
+            one by one even for "stealing" chunking.
+        executor : str, optional
+            Where chunks run (default is None -> threads when the GIL is disabled, e.g. python3.13t,
+            and no backend or supervised option is set, otherwise processes). Options are [None, "process", "thread", "interpreter"].
+            Threads share memory of main process, so args are not pickled and shared_memory is not needed.
+            "interpreter" is experimental, chunks run in sub-interpreters of main process with their own GIL
+            (Python 3.13+, see is_interpreters_available()), func must be importable and gets None as lock.
+        initializer : optional
+            Function called as initializer(*initargs) once in every worker before its first chunk, e.g. to open
+            connection stored by worker_local.set() and read by worker_local.get() in func (default is None).
+        initargs : tuple, optional
+            Arguments of initializer (default is ()).
+
+        If any of timeout, retries, max_tasks_per_worker or max_worker_rss is set, chunks run in supervised
+        WorkerPool. Chunk failed after all retries does not stop the others, its items are returned as None.
+        With backend, max_workers only sets number of chunks and shared_memory and supervised options
+        are not supported.
 
         Returns
         ----------
         List with results
         """
 
-        # split args to multiple arrays by max_workers
-        args = np.array_split(args, max_workers)
+        if self.backend is not None and (
+            shared_memory or timeout or retries or max_tasks_per_worker or max_worker_rss
+        ):
+            raise ValueError(
+                "Options shared_memory, timeout, retries, max_tasks_per_worker and max_worker_rss are not supported with backend!"
+            )
+        if max_workers == "auto" and (
+            self.backend is not None
+            or checkpoint is not None
+            or timeout
+            or retries
+            or max_tasks_per_worker
+            or max_worker_rss
+        ):
+            raise ValueError(
+                'Max workers "auto" is not supported with backend, checkpoint, timeout, retries, max_tasks_per_worker and max_worker_rss!'
+            )
 
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=max_workers
-        ) as executor:
+        if executor not in self.EXECUTOR_OPTIONS:
+            raise ValueError(
+                f"Executor <{executor}> is not valid! It must be in {self.EXECUTOR_OPTIONS}!"
+            )
+        process_only = (
+            self.backend is not None
+            or timeout
+            or retries
+            or max_tasks_per_worker
+            or max_worker_rss
+        )
+        if initializer is not None and self.backend is not None:
+            raise ValueError("Option initializer is not supported with backend!")
+        if executor in ["thread", "interpreter"] and process_only:
+            raise ValueError(
+                f'Options backend, timeout, retries, max_tasks_per_worker and max_worker_rss are not supported with executor "{executor}"!'
+            )
+        # locks of main interpreter cannot be used by sub-interpreters
+        interpreters = executor == "interpreter"
+        if interpreters and lock is not None:
+            raise ValueError(
+                'Option lock is not supported with executor "interpreter"!'
+            )
+        # without the GIL, CPU bound chunks run in parallel in threads and nothing is pickled
+        threads = executor == "thread" or (
+            executor is None and not process_only and not is_gil_enabled()
+        )
+
+        # split args to chunks by selected scheduling policy, types are kept
+        args = as_sequence(args)
+        shared = []
+        if (
+            shared_memory
+            and not threads
+            and not interpreters
+            and hasattr(args, "__array_interface__")
+        ):
+            args = SharedArray.create(args, backend=shared_memory)
+            shared.append(args)
+
+        try:
+            if max_workers == "auto":
+                return self._run_auto(
+                    func,
+                    args,
+                    lock,
+                    telemetry,
+                    threads,
+                    initializer,
+                    initargs,
+                    interpreters,
+                )
+            return self._run_func(
+                func,
+                args,
+                max_workers,
+                lock,
+                chunking,
+                chunksize,
+                timeout,
+                retries,
+                max_tasks_per_worker,
+                max_worker_rss,
+                checkpoint,
+                telemetry,
+                threads,
+                initializer,
+                initargs,
+                interpreters,
+            )
+        finally:
+            for array in shared:
+                array.unlink()
+
+    def _run_func(
+        self,
+        func,
+        args: object,
+        max_workers: int,
+        lock: object,
+        chunking: str,
+        chunksize: int,
+        timeout: float,
+        retries: int,
+        max_tasks_per_worker: int,
+        max_worker_rss: int,
+        checkpoint: Checkpoint,
+        telemetry: Telemetry,
+        threads: bool = False,
+        initializer=None,
+        initargs: tuple = (),
+        interpreters: bool = False,
+    ) -> list:
+        """Run function in multiprocess (threads or sub-interpreters) on sliceable args."""
+
+        lock = self.sync.lock if lock is None and not interpreters else lock
+        sync_stats = self.sync.stats()
+        bounds = get_chunk_bounds(len(args), max_workers, chunking, chunksize)
+        args = partition(args, bounds)
+        processes = [None] * len(args)
+
+        # chunks finished in previous runs of the job are not run again
+        if checkpoint is not None:
+            for i, data in checkpoint.load(bounds).items():
+                processes[i] = ResultEnvelope(data=data)
             self._logger.info(
-                f"Spliting function <{func}> into {max_workers} multiprocesses ..."
+                f"Job <{checkpoint.job_id}>: {len(args) - processes.count(None)} of {len(args)} chunks loaded from checkpoint."
             )
-            proc_results = [
-                executor.submit(self._run_multiprocess, func, curr_args, lock)
-                for curr_args in args
-            ]
+        todo = [i for i, process in enumerate(processes) if process is None]
+
+        def on_done(i: int, process: object):
+            processes[i] = process
+            if checkpoint is not None and process.status == "OK":
+                if not checkpoint.save(bounds[i], process.data):
+                    self._logger.warning(
+                        f"Chunk {bounds[i]} could not be saved to checkpoint!"
+                    )
+
+        if timeout or retries or max_tasks_per_worker or max_worker_rss:
+
+            def on_task_done(task_id: int, ok: bool, result: object):
+                i = todo[task_id]
+                if ok and telemetry is not None:
+                    try:
+                        result = telemetry.unwrap(result)
+                    except Exception as err:
+                        ok, result = False, err
+                if not ok:
+                    self._logger.error(
+                        f"Chunk of {len(args[i])} items failed due to <{result}>!",
+                        terminate=False,
+                    )
+                    result = ResultEnvelope(
+                        ResultEnvelope.STATUS_OPTIONS.index("ERROR"),
+                        str(result),
+                        [None] * len(args[i]),
+                    )
+                on_done(i, result)
+
+            with WorkerPool(
+                max_workers,
+                initializer=_init_worker,
+                initargs=(self.sync, None, initializer, initargs),
+                max_tasks_per_worker=max_tasks_per_worker,
+                max_worker_rss=max_worker_rss,
+                ctx=self._ctx,
+            ) as pool:
+                self._logger.info(
+                    f"Spliting function <{func}> into {len(todo)} chunks on {max_workers} supervised multiprocesses ..."
+                )
+                if telemetry is None:
+                    pool_func = self._run_multiprocess
+                    tasks = [(func, args[i], lock) for i in todo]
+                else:
+                    pool_func = Telemetry.call
+                    tasks = [
+                        (
+                            telemetry.wrap(
+                                func.__name__,
+                                self._run_multiprocess,
+                                func,
+                                args[i],
+                                lock,
+                            ),
+                        )
+                        for i in todo
+                    ]
+                pool.map(
+                    pool_func,
+                    tasks,
+                    timeout=timeout,
+                    retries=retries,
+                    callback=on_task_done,
+                )
+            if pool.replaced_workers:
+                self._logger.info(f"{pool.replaced_workers} workers were replaced.")
+
+        elif (
+            chunking == "stealing"
+            and checkpoint is None
+            and telemetry is None
+            and self.backend is None
+            and not threads
+            and not interpreters
+        ):
+            work_queue = self._ctx.Queue()
+            for i in todo:
+                work_queue.put((i, args[i]))
+            for _ in range(max_workers):
+                work_queue.put(None)
+
+            with self._get_executor(
+                max_workers, work_queue, initializer=initializer, initargs=initargs
+            ) as executor:
+                self._logger.info(
+                    f"Spliting function <{func}> into {len(todo)} chunks stolen by {max_workers} multiprocesses ..."
+                )
+                stealers = [
+                    executor.submit(self._run_stealing, func, lock)
+                    for _ in range(max_workers)
+                ]
+
+            for stealer in stealers:
+                for i, process in stealer.result():
+                    on_done(i, process)
+
+        else:
+            # idle workers take next chunk from executor queue, finished chunks are saved at once
+            with self._get_executor(
+                max_workers, None, threads, initializer, initargs, interpreters
+            ) as executor:
+                self._logger.info(
+                    f"Spliting function <{func}> into {len(todo)} chunks on {max_workers} {self._get_label(threads, interpreters)} ..."
+                )
+                proc_results = {
+                    self._submit(
+                        executor,
+                        telemetry,
+                        func.__name__,
+                        (
+                            self._run_interpreter
+                            if interpreters
+                            else self._run_multiprocess
+                        ),
+                        func,
+                        args[i],
+                        lock,
+                    ): i
+                    for i in todo
+                }
+                error = None
+                for process in concurrent.futures.as_completed(proc_results):
+                    if process.exception() is not None:
+                        # other chunks are still finished and saved
+                        error = error or process.exception()
+                        continue
+                    on_done(proc_results[process], process.result())
+            if error is not None:
+                raise error
 
         data = []
-        i = 0
-        for process in proc_results:
-            data.append(process.result().data)
+        for process in processes:
+            data.append(process.data)
 
         status_list = []
-        for process in proc_results:
-            status_list.append(process.result().status)
+        for process in processes:
+            status_list.append(process.status)
 
         msg = f"Multiprocessing function <{func.__name__}> is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
         self._logger.info(msg) if status_list.count("OK") == len(
             status_list
         ) else self._logger.error(msg, terminate=False)
+        self._log_sync_stats(sync_stats)
 
         # RETURN FLAT LIST OF RESULTS
         return [item for sublist in data for item in sublist]
 
+    def _run_auto(
+        self,
+        func,
+        args: object,
+        lock: object,
+        telemetry: Telemetry,
+        threads: bool = False,
+        initializer=None,
+        initargs: tuple = (),
+        interpreters: bool = False,
+    ) -> list:
+        """Run function in multiprocess (threads or sub-interpreters) with number of workers and chunk size tuned during the run."""
+
+        lock = self.sync.lock if lock is None and not interpreters else lock
+        sync_stats = self.sync.stats()
+        tuner = AutoTuner(func, len(args))
+
+        with self._get_executor(
+            tuner.max_workers, None, threads, initializer, initargs, interpreters
+        ) as executor:
+            self._logger.info(
+                f"Tuning function <{func}> from {tuner.workers} workers and chunks of {tuner.chunksize} on up to {tuner.max_workers} {self._get_label(threads, interpreters)} ..."
+            )
+            processes = tuner.map(
+                lambda chunk: self._submit(
+                    executor,
+                    telemetry,
+                    func.__name__,
+                    self._run_interpreter if interpreters else self._run_multiprocess,
+                    func,
+                    chunk,
+                    lock,
+                ),
+                args,
+            )
+        self._logger.info(
+            f"Function <{func.__name__}> tuned to {tuner.best[0]} workers and chunks of {tuner.best[1]}, {round(tuner.throughput, 2)} items per second."
+        )
+
+        status_list = [process.status for process in processes]
+        msg = f"Multiprocessing function <{func.__name__}> is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
+        self._logger.info(msg) if status_list.count("OK") == len(
+            status_list
+        ) else self._logger.error(msg, terminate=False)
+        self._log_sync_stats(sync_stats)
+
+        # RETURN FLAT LIST OF RESULTS
+        return [item for process in processes for item in process.data]
+
+    def imap(
+        self,
+        func,
+        args,
+        max_workers: int = os.cpu_count(),
+        lock: object = None,
+        chunksize: int = 1,
+        max_in_flight: int = None,
+    ):
+        """Lazily run function in multiprocess, yield results in order of args.
+
+        Parameters
+        ----------
+        func
+            Name of function
+        args
+            Any iterable with data which should be processed, it is consumed lazily.
+        max_workers : int
+            Max workers used for the process.
+        lock
+            Multiprocessing lock (default is None -> native lock of handler, see sync).
+        chunksize : int, optional
+            Number of items sent to worker at once (default is 1).
+        max_in_flight : int, optional
+            Max number of chunks submitted or waiting to be yielded (default is None -> 2 * max_workers).
+
+        Returns
+        ----------
+        Generator of results
+        """
+        return self._imap(func, args, max_workers, lock, chunksize, max_in_flight, True)
+
+    def imap_unordered(
+        self,
+        func,
+        args,
+        max_workers: int = os.cpu_count(),
+        lock: object = None,
+        chunksize: int = 1,
+        max_in_flight: int = None,
+    ):
+        """Lazily run function in multiprocess, yield results as chunks finish.
+
+        Parameters
+        ----------
+        func
+            Name of function
+        args
+            Any iterable with data which should be processed, it is consumed lazily.
+        max_workers : int
+            Max workers used for the process.
+        lock
+            Multiprocessing lock (default is None -> native lock of handler, see sync).
+        chunksize : int, optional
+            Number of items sent to worker at once (default is 1).
+        max_in_flight : int, optional
+            Max number of chunks submitted at once (default is None -> 2 * max_workers).
+
+        Returns
+        ----------
+        Generator of results
+        """
+        return self._imap(
+            func, args, max_workers, lock, chunksize, max_in_flight, False
+        )
+
+    def _imap(
+        self,
+        func,
+        args,
+        max_workers: int,
+        lock: object,
+        chunksize: int,
+        max_in_flight: int,
+        ordered: bool,
+    ):
+        """Yield results of chunks, keep at most max_in_flight chunks in memory."""
+
+        max_in_flight = 2 * max_workers if max_in_flight is None else max_in_flight
+        lock = self.sync.lock if lock is None else lock
+        sync_stats = self.sync.stats()
+        chunks = iter_chunks(args, chunksize)
+        in_flight = {}
+        finished = {}
+        next_index = 0
+        submitted = 0
+        exhausted = False
+        status_list = []
+
+        executor = self._get_executor(max_workers)
+        self._logger.info(
+            f"Streaming function <{func}> in chunks of {chunksize} on {max_workers} multiprocesses ..."
+        )
+        try:
+            while True:
+                # backpressure, finished chunks waiting for order count as in flight
+                while not exhausted and len(in_flight) + len(finished) < max_in_flight:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    future = executor.submit(self._run_multiprocess, func, chunk, lock)
+                    in_flight[future] = submitted
+                    submitted += 1
+
+                if not in_flight:
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    index = in_flight.pop(future)
+                    process = future.result()
+                    status_list.append(process.status)
+                    if ordered:
+                        finished[index] = process
+                    else:
+                        yield from process.data
+
+                while next_index in finished:
+                    yield from finished.pop(next_index).data
+                    next_index += 1
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        msg = f"Multiprocessing function <{func.__name__}> is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
+        self._logger.info(msg) if status_list.count("OK") == len(
+            status_list
+        ) else self._logger.error(msg, terminate=False)
+        self._log_sync_stats(sync_stats)
+
+    def _get_executor(
+        self,
+        max_workers: int,
+        work_queue: object = None,
+        threads: bool = False,
+        initializer=None,
+        initargs: tuple = (),
+        interpreters: bool = False,
+    ) -> concurrent.futures.Executor:
+        """Returns process pool with sync primitives (and work queue) set in workers, remote backend,
+        thread pool or sub-interpreter pool of main process, initializer runs in every worker."""
+        if self.backend is not None:
+            return self.backend.executor()
+        if interpreters:
+            return InterpreterPool(
+                max_workers=max_workers, initializer=initializer, initargs=initargs
+            )
+        if threads:
+            return concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, initializer=initializer, initargs=initargs
+            )
+        return ProcessPool(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.sync, work_queue, initializer, initargs),
+            mp_context=self._ctx,
+        )
+
+    def _submit(
+        self, executor: object, telemetry: Telemetry, name: str, fn, *args
+    ) -> concurrent.futures.Future:
+        """Submit fn(*args) to executor, traced when telemetry is set."""
+        if telemetry is None:
+            return executor.submit(fn, *args)
+        return telemetry.submit(executor, name, fn, *args)
+
+    @staticmethod
+    def _get_label(threads: bool, interpreters: bool) -> str:
+        """Returns name of workers in logs."""
+        if interpreters:
+            return "sub-interpreters"
+        return "threads" if threads else "multiprocesses"
+
+    def _log_sync_stats(self, before: dict):
+        """Logs time spent waiting for sync primitives since before."""
+        for name, stats in self.sync.stats().items():
+            acquires = stats["acquires"] - before[name]["acquires"]
+            if acquires:
+                wait_time = stats["wait_time"] - before[name]["wait_time"]
+                self._logger.info(
+                    f"{name.capitalize()} acquired {acquires} times, total wait time {round(wait_time, 5)} seconds, max wait time {round(stats['max_wait_time'], 5)} seconds."
+                )
+
+    def _run_stealing(self, func, lock: object) -> list:
+        """Run chunks from shared work queue until it is empty."""
+
+        processes = []
+        while True:
+            item = _work_queue.get()
+            if item is None:
+                break
+            i, args = item
+            processes.append((i, self._run_multiprocess(func, args, lock)))
+
+        return processes
+
+    @staticmethod
+    def _run_interpreter(func, args: list, lock: object) -> object:
+        """Split function in sub-interpreter, handler and its logger stay in main interpreter."""
+        return ResultEnvelope(data=[func(value, lock) for value in args])
+
     def _run_multiprocess(self, func, args: list, lock: object) -> object:
         """Split function"""
 
         p = MultiProcess(lock, self._logger, log=False)
 
+        # shared array chunk is viewed in place
+        args = args.open() if isinstance(args, SharedArray) else args
+
         p.data = []
         try:
             for value in args:
@@ -232,4 +892,4 @@ class MultiProcessHandler:
             p.status = "ERROR"
             p.error = err
 
-        return p.finish(terminate_all=True)
+        return p.finish(terminate_all=True).envelope()
@@ -8,6 +8,7 @@ import inspect
 
 from antools.logging import get_logger
 from antools.logging._logger_class import _get_mp_logger
+from antools.multiprocessing import ResultEnvelope
 
 
 class MultiProcess:
@@ -47,6 +48,8 @@ class MultiProcess:
         Release multiprocessing lock
     finish(self, terminate_all:bool=True)
         Evaluates and finish the process.
+    envelope(self)
+        Returns slim ResultEnvelope to be sent to main process instead of self.
 
     Examples
     -------
@@ -155,3 +158,14 @@ class MultiProcess:
         self._finished = True
 
         return self
+
+    def envelope(self) -> object:
+        """Returns slim ResultEnvelope to be sent to main process instead of self.
+        Logger, lock and flags are not pickled, only status code, error and data.
+
+        Returns
+        ----------
+        ResultEnvelope
+
+        """
+        return ResultEnvelope.from_process(self)
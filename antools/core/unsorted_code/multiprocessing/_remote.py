@@ -0,0 +1,526 @@
+# -*- coding: utf-8 -*-
+"""
+REMOTE BACKEND
+"""
+
+import collections
+import concurrent.futures
+import functools
+import itertools
+import math
+import multiprocessing as mp
+import os
+import pickle
+import socket
+import threading
+import time
+import zlib
+from multiprocessing.connection import (
+    Client,
+    Connection,
+    answer_challenge,
+    deliver_challenge,
+)
+
+from antools.logging import get_logger
+from antools.multiprocessing import SyncPrimitives
+
+
+def _send(conn: object, message: tuple, compress_level: int):
+    """Pickle, compress and send message."""
+    conn.send_bytes(zlib.compress(pickle.dumps(message, protocol=5), compress_level))
+
+
+def _recv(conn: object) -> tuple:
+    """Receive, decompress and unpickle message."""
+    return pickle.loads(zlib.decompress(conn.recv_bytes()))
+
+
+def _init_agent_worker(sync: SyncPrimitives):
+    """Agent pool initializer, locks of remote handler are replaced by local ones."""
+    SyncPrimitives.initializer(sync, default=True)
+
+
+def _run_task(payload: bytes) -> tuple:
+    """Run pickled task in agent worker, returns (ok, result or error)."""
+
+    try:
+        func, args = pickle.loads(payload)
+        return True, func(*args)
+    except BaseException as err:
+        return False, err
+
+
+class RemoteAgent:
+    """Worker agent started on another host. It registers with RemoteBackend of MultiProcessHandler,
+    receives batches of tasks, runs them in its local process pool and sends results back.
+    Functions must be importable on the agent host. Use only in trusted network, tasks are pickled,
+    authkey is the secret generated by RemoteBackend (RemoteBackend.authkey).
+
+    ...
+
+    Attributes
+    ----------
+    address : tuple
+        (host, port) of RemoteBackend.
+    max_workers : int
+        Number of local worker processes.
+    name : str
+        Name of agent shown in handler logs.
+
+    Methods
+    -------
+    __init__(self, address:tuple, authkey:bytes, max_workers:int=os.cpu_count(), name:str=None)
+        Class constructor.
+    serve_forever(self, retry_interval:float=1)
+        Connect to backend and run tasks until backend stops the agent.
+
+    Examples
+    -------
+    antools/multiprocessing/_examples/_example_remote.py
+    """
+
+    def __init__(
+        self,
+        address: tuple,
+        authkey: bytes,
+        max_workers: int = os.cpu_count(),
+        name: str = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        address : tuple
+            (host, port) of RemoteBackend.
+        authkey : bytes
+            Shared secret of backend and agents, RemoteBackend.authkey.
+        max_workers : int, optional
+            Number of local worker processes (default is os.cpu_count()).
+        name : str, optional
+            Name of agent (default is None -> <hostname>:<pid>).
+        """
+        if not authkey:
+            raise ValueError("RemoteAgent requires authkey of its RemoteBackend!")
+
+        self.address = tuple(address)
+        self.max_workers = max_workers
+        self.name = f"{socket.gethostname()}:{os.getpid()}" if name is None else name
+        self._authkey = authkey
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"RemoteAgent(name={self.name}, address={self.address}, max_workers={self.max_workers})"
+
+    def serve_forever(self, retry_interval: float = 1):
+        """Connect to backend and run tasks until backend stops the agent.
+
+        Parameters
+        ----------
+        retry_interval : float, optional
+            Seconds between connection attempts while backend is not running (default is 1).
+        """
+
+        while True:
+            try:
+                conn = Client(self.address, authkey=self._authkey)
+                break
+            except ConnectionRefusedError:
+                time.sleep(retry_interval)
+
+        send_lock = threading.Lock()
+        compress_level = 1
+        _send(conn, ("REGISTER", self.name, self.max_workers), compress_level)
+
+        # forked workers would inherit the connection and hide disconnection of the agent
+        ctx = mp.get_context(
+            "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        )
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=ctx,
+            initializer=_init_agent_worker,
+            initargs=(SyncPrimitives(ctx=ctx),),
+        ) as pool:
+            while True:
+                try:
+                    message = _recv(conn)
+                except (EOFError, OSError):
+                    break
+                if message[0] == "STOP":
+                    break
+
+                _, batch_id, tasks, compress_level = message
+                self._run_batch(pool, conn, send_lock, batch_id, tasks, compress_level)
+
+        conn.close()
+
+    def _run_batch(
+        self,
+        pool: object,
+        conn: object,
+        send_lock: object,
+        batch_id: int,
+        tasks: list,
+        compress_level: int,
+    ):
+        """Submit batch to local pool, results are sent back when whole batch is finished."""
+
+        task_ids = [task_id for task_id, _ in tasks]
+        futures = [pool.submit(_run_task, payload) for _, payload in tasks]
+        remaining = [len(futures)]
+
+        def on_done(_):
+            with send_lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+                results = [
+                    (
+                        (task_id, *future.result())
+                        if future.exception() is None
+                        else (task_id, False, future.exception())
+                    )
+                    for task_id, future in zip(task_ids, futures)
+                ]
+                try:
+                    _send(conn, ("RESULTS", batch_id, results), compress_level)
+                except (pickle.PicklingError, TypeError, AttributeError) as err:
+                    # some result cannot be pickled
+                    results = [
+                        (task_id, False, RuntimeError(repr(err)))
+                        for task_id in task_ids
+                    ]
+                    _send(conn, ("RESULTS", batch_id, results), compress_level)
+                except OSError:
+                    # backend is gone
+                    pass
+
+        for future in futures:
+            future.add_done_callback(on_done)
+
+
+class _RemoteAgentLink:
+    """Connection to registered agent held by RemoteBackend."""
+
+    def __init__(self, conn: object, name: str, max_workers: int):
+        self.conn = conn
+        self.name = name
+        self.max_workers = max_workers
+        self.in_flight = {}
+        # batches of serving thread and STOP of close() must not interleave
+        self.send_lock = threading.Lock()
+
+
+class _RemoteExecutor(concurrent.futures.Executor):
+    """Executor view of RemoteBackend used for one run, shutdown does not stop agents."""
+
+    def __init__(self, backend: "RemoteBackend"):
+        self._backend = backend
+        self._futures = []
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        future = self._backend.submit(fn, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        if cancel_futures:
+            for future in self._futures:
+                future.cancel()
+        if wait:
+            concurrent.futures.wait(self._futures)
+
+
+class RemoteBackend:
+    """Multi-node backend of MultiProcessHandler. RemoteAgents started on other hosts register
+    with it and tasks submitted to it are sent to them in compressed batches.
+    Tasks of disconnected agent are sent to other agents. Use only in trusted network, tasks are pickled,
+    agents are authenticated by secret authkey (random one is generated if it is not given).
+
+    ...
+
+    Attributes
+    ----------
+    address : tuple
+        (host, port) on which agents are accepted.
+    authkey : bytes
+        Shared secret of backend and agents, it must be passed to RemoteAgent.
+    batch_size : int
+        Max number of tasks sent to agent in one message.
+    compress_level : int
+        Zlib compression level of messages (0 - 9).
+    agents : list
+        Names of registered agents.
+    max_workers : int
+        Total number of worker processes of registered agents.
+
+    Methods
+    -------
+    __init__(self, address:tuple=("127.0.0.1", 0), authkey:bytes=None, batch_size:int=8, compress_level:int=1, logger:object=None)
+        Class constructor.
+    wait_for_agents(self, count:int=1, timeout:float=None)
+        Wait until count agents are registered.
+    submit(self, fn, *args, **kwargs)
+        Send task to agents, returns Future.
+    executor(self)
+        Returns Executor view used by MultiProcessHandler.
+    close(self)
+        Stop agents and listener.
+
+    Examples
+    -------
+    antools/multiprocessing/_examples/_example_remote.py
+    """
+
+    # seconds for authentication and registration of connected agent
+    HANDSHAKE_TIMEOUT = 10
+
+    def __init__(
+        self,
+        address: tuple = ("127.0.0.1", 0),
+        authkey: bytes = None,
+        batch_size: int = 8,
+        compress_level: int = 1,
+        logger: object = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        address : tuple, optional
+            (host, port) on which agents are accepted (default is ("127.0.0.1", 0) -> free port on localhost).
+        authkey : bytes, optional
+            Shared secret of backend and agents (default is None -> random 32 bytes, see self.authkey).
+        batch_size : int, optional
+            Max number of tasks sent to agent in one message (default is 8).
+        compress_level : int, optional
+            Zlib compression level of messages (default is 1).
+        logger : object, optional
+            Logger class (default is None -> inactive logger).
+        """
+
+        self.batch_size = batch_size
+        self.compress_level = compress_level
+        self._logger = get_logger(_activate=False) if logger is None else logger
+        # tasks and results are pickled, so well-known secret would allow code execution
+        self.authkey = os.urandom(32) if authkey is None else authkey
+        self._socket = socket.create_server(tuple(address))
+        self.address = self._socket.getsockname()[:2]
+        self._agents = []
+        self._pending = collections.deque()
+        self._condition = threading.Condition()
+        self._task_ids = itertools.count()
+        self._batch_ids = itertools.count()
+        self._closed = False
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"RemoteBackend(address={self.address}, agents={self.agents}, max_workers={self.max_workers})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def agents(self) -> list:
+        """Names of registered agents."""
+        return [agent.name for agent in list(self._agents)]
+
+    @property
+    def max_workers(self) -> int:
+        """Total number of worker processes of registered agents."""
+        return sum(agent.max_workers for agent in list(self._agents))
+
+    def wait_for_agents(self, count: int = 1, timeout: float = None) -> bool:
+        """Wait until count agents are registered.
+
+        Parameters
+        ----------
+        count : int, optional
+            Number of agents (default is 1).
+        timeout : float, optional
+            Max seconds to wait (default is None -> no limit).
+
+        Returns
+        ----------
+        True if agents are registered
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self._agents) >= count, timeout)
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        """Send task to agents, returns Future.
+
+        Parameters
+        ----------
+        fn
+            Function importable on agent hosts.
+        args, kwargs
+            Arguments of the function.
+
+        Returns
+        ----------
+        concurrent.futures.Future
+        """
+
+        if self._closed:
+            raise RuntimeError("RemoteBackend is closed!")
+
+        fn = functools.partial(fn, **kwargs) if kwargs else fn
+        payload = pickle.dumps((fn, args), protocol=5)
+        future = concurrent.futures.Future()
+        with self._condition:
+            self._pending.append((next(self._task_ids), payload, future))
+            self._condition.notify_all()
+
+        return future
+
+    def executor(self) -> concurrent.futures.Executor:
+        """Returns Executor view used by MultiProcessHandler, its shutdown does not stop agents."""
+        return _RemoteExecutor(self)
+
+    def close(self):
+        """Stop agents and listener, unfinished tasks fail."""
+
+        self._closed = True
+        for agent in list(self._agents):
+            try:
+                with agent.send_lock:
+                    _send(agent.conn, ("STOP",), self.compress_level)
+            except OSError:
+                pass
+        try:
+            # wakes up accept of listening thread
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+        with self._condition:
+            while self._pending:
+                _, _, future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(RuntimeError("RemoteBackend was closed!"))
+            self._condition.notify_all()
+
+    def _accept_loop(self):
+        """Accept connecting agents, every one is registered in its own thread."""
+
+        while not self._closed:
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                continue
+            threading.Thread(target=self._register, args=(sock,), daemon=True).start()
+
+    def _register(self, sock: socket.socket):
+        """Authenticate and register agent, silent client is disconnected after HANDSHAKE_TIMEOUT."""
+
+        timer = threading.Timer(self.HANDSHAKE_TIMEOUT, self._disconnect, (sock,))
+        timer.start()
+        conn = None
+        try:
+            # the same handshake as multiprocessing Listener, connection gets its own descriptor
+            conn = Connection(os.dup(sock.fileno()))
+            deliver_challenge(conn, self.authkey)
+            answer_challenge(conn, self.authkey)
+            _, name, max_workers = _recv(conn)
+        except Exception:
+            # wrong authkey, broken or timed out handshake
+            if conn is not None:
+                conn.close()
+            return
+        finally:
+            timer.cancel()
+            sock.close()
+
+        if self._closed:
+            conn.close()
+            return
+        agent = _RemoteAgentLink(conn, name, max_workers)
+        with self._condition:
+            self._agents.append(agent)
+            self._condition.notify_all()
+        self._logger.info(
+            f"Remote agent <{name}> with {max_workers} workers has registered."
+        )
+        self._serve_agent(agent)
+
+    @staticmethod
+    def _disconnect(sock: socket.socket):
+        """Stop pending handshake of socket."""
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _serve_agent(self, agent: _RemoteAgentLink):
+        """Send batches to agent and receive its results."""
+
+        max_batches = max(1, math.ceil(2 * agent.max_workers / self.batch_size))
+        try:
+            while not self._closed:
+                batches = []
+                with self._condition:
+                    if not self._pending and not agent.in_flight:
+                        self._condition.wait(0.1)
+                        continue
+
+                    while self._pending and len(agent.in_flight) < max_batches:
+                        batch = []
+                        while self._pending and len(batch) < self.batch_size:
+                            task = self._pending.popleft()
+                            # requeued tasks are already running
+                            if (
+                                task[2].running()
+                                or task[2].set_running_or_notify_cancel()
+                            ):
+                                batch.append(task)
+                        if batch:
+                            batch_id = next(self._batch_ids)
+                            agent.in_flight[batch_id] = batch
+                            batches.append((batch_id, batch))
+
+                for batch_id, batch in batches:
+                    tasks = [(task_id, payload) for task_id, payload, _ in batch]
+                    with agent.send_lock:
+                        _send(
+                            agent.conn,
+                            ("BATCH", batch_id, tasks, self.compress_level),
+                            self.compress_level,
+                        )
+
+                if agent.conn.poll(0.01):
+                    _, batch_id, results = _recv(agent.conn)
+                    futures = {
+                        task_id: future
+                        for task_id, _, future in agent.in_flight.pop(batch_id)
+                    }
+                    for task_id, ok, value in results:
+                        if ok:
+                            futures[task_id].set_result(value)
+                        else:
+                            futures[task_id].set_exception(value)
+
+        except (EOFError, OSError):
+            if not self._closed:
+                self._logger.warning(
+                    f"Remote agent <{agent.name}> has disconnected, its tasks are sent to other agents."
+                )
+
+        with self._condition:
+            self._agents.remove(agent)
+            for batch in agent.in_flight.values():
+                if not self._closed:
+                    self._pending.extendleft(reversed(batch))
+                    continue
+                # tasks are already running, close() does not see them
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("RemoteBackend was closed!"))
+            agent.in_flight = {}
+            self._condition.notify_all()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+RESULT ENVELOPE CLASS
+"""
+
+
+class ResultEnvelope:
+    """Slim result of multiprocess sent back to main process instead of whole MultiProcess.
+    Only status code, error and data are pickled, data come back as they were returned (arrays stay writable).
+
+    ...
+
+    Attributes
+    ----------
+    code : int
+        Index of status in MultiProcess.STATUS_OPTIONS.
+    error : str
+        If process failed, reason for it is held here.
+    data : ?
+        Data returned by process.
+    status : str
+        Status name, read only.
+
+    Methods
+    -------
+    __init__(self, code:int=0, error=None, data=None)
+        Class constructor.
+    from_process(cls, process:object)
+        Returns envelope of finished process.
+
+    Examples
+    -------
+    antools/multiprocessing/_examples/_benchmark_result_envelope.py
+    """
+
+    __slots__ = ("code", "error", "data")
+
+    STATUS_OPTIONS = ["OK", "ERROR", "PROCESSING"]
+
+    def __init__(self, code: int = 0, error=None, data=None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        code : int, optional
+            Index of status in STATUS_OPTIONS (default is 0 -> "OK").
+        error : optional
+            Reason of failure (default is None).
+        data : optional
+            Data returned by process (default is None).
+        """
+        self.code = code
+        self.error = error
+        self.data = data
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"ResultEnvelope(status={self.status}, error={self.error})"
+
+    def __reduce__(self):
+        """Pickled as constructor arguments, without names of slots."""
+        return ResultEnvelope, (self.code, self.error, self.data)
+
+    @classmethod
+    def from_process(cls, process: object) -> "ResultEnvelope":
+        """Returns envelope of finished process.
+
+        Parameters
+        ----------
+        process : MultiProcess
+            Finished process.
+
+        Returns
+        ----------
+        ResultEnvelope
+        """
+        status = process.status
+        code = (
+            cls.STATUS_OPTIONS.index(status)
+            if status in cls.STATUS_OPTIONS
+            else cls.STATUS_OPTIONS.index("ERROR")
+        )
+        return cls(code, process.error, process.data)
+
+    @property
+    def status(self) -> str:
+        """Status name."""
+        return self.STATUS_OPTIONS[self.code]
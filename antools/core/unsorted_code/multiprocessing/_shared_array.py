@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+SHARED ARRAY CLASS
+"""
+
+import os
+import tempfile
+import uuid
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# shared memory blocks and memmaps attached in current process, by name
+_attached = {}
+
+
+def _attach(name: str, backend: str, shape: tuple, dtype: str) -> object:
+    """Returns whole array attached in current process, attaches only once."""
+
+    if name not in _attached:
+        if backend == "shm":
+            try:
+                shm = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                # Python < 3.13 has no track argument
+                shm = shared_memory.SharedMemory(name=name)
+            _attached[name] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+        else:
+            _attached[name] = (
+                None,
+                np.memmap(name, dtype=dtype, mode="r+", shape=shape),
+            )
+
+    return _attached[name][1]
+
+
+class SharedArray:
+    """Lightweight handle to NumPy array placed in shared memory or file-backed memmap.
+    Only the handle is pickled into workers, workers get views without copying the data.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Name of shared memory block or path of memmap file.
+    backend : str
+        Storage of the array. Options are ["shm", "memmap"].
+    shape : tuple
+        Shape of whole array.
+    dtype : str
+        Data type of array.
+    start : int
+        First row of whole array visible through the handle.
+    stop : int
+        Row after last row of whole array visible through the handle.
+    _owner : bool
+        Value True in process which created the array, only owner can unlink it.
+    _shm : object
+        SharedMemory instance of owner.
+
+    Methods
+    -------
+    create(cls, array, backend:str="shm", folder:str=None)
+        Copies array into shared storage and returns owning handle.
+    open(self)
+        Returns view of the array.
+    unlink(self)
+        Frees shared storage, owner only.
+
+    Examples
+    -------
+    antools/multiprocessing/_examples/_example_shared_array.py
+    """
+
+    BACKEND_OPTIONS = ["shm", "memmap"]
+
+    _owner = False
+    _shm = None
+
+    def __init__(
+        self,
+        name: str,
+        shape: tuple,
+        dtype: str,
+        backend: str = "shm",
+        start: int = 0,
+        stop: int = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        name : str
+            Name of shared memory block or path of memmap file.
+        shape : tuple
+            Shape of whole array.
+        dtype : str
+            Data type of array.
+        backend : str, optional
+            Storage of the array (default is "shm"). Options are ["shm", "memmap"].
+        start : int, optional
+            First visible row (default is 0).
+        stop : int, optional
+            Row after last visible row (default is None -> shape[0]).
+        """
+
+        if backend not in self.BACKEND_OPTIONS:
+            raise ValueError(
+                f"Backend <{backend}> is not valid. Backend must be in {self.BACKEND_OPTIONS}!"
+            )
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = str(dtype)
+        self.backend = backend
+        self.start = start
+        self.stop = self.shape[0] if stop is None else stop
+
+    @classmethod
+    def create(cls, array, backend: str = "shm", folder: str = None) -> "SharedArray":
+        """Copies array into shared storage and returns owning handle.
+
+        Parameters
+        ----------
+        array
+            NumPy array (or array-like) to be shared.
+        backend : str, optional
+            Storage of the array (default is "shm"). Options are ["shm", "memmap"].
+        folder : str, optional
+            Folder for memmap files (default is None -> system temp folder).
+
+        Returns
+        ----------
+        SharedArray
+        """
+
+        if np is None:
+            raise ImportError("SharedArray requires numpy to be installed!")
+
+        array = np.ascontiguousarray(array)
+        if array.ndim == 0:
+            raise ValueError("SharedArray cannot be created from 0-dimensional array!")
+
+        if backend == "shm":
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+            handle = cls(shm.name, array.shape, array.dtype, backend)
+            handle._shm = shm
+        else:
+            folder = tempfile.gettempdir() if folder is None else folder
+            path = os.path.join(folder, f"antools_{uuid.uuid4().hex}.mmap")
+            mm = np.memmap(path, dtype=array.dtype, mode="w+", shape=array.shape)
+            mm[...] = array
+            mm.flush()
+            del mm
+            handle = cls(path, array.shape, array.dtype, backend)
+
+        handle._owner = True
+        return handle
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"SharedArray(name={self.name}, backend={self.backend}, shape={self.shape}, dtype={self.dtype}, start={self.start}, stop={self.stop})"
+
+    def __getstate__(self) -> dict:
+        """Only handle is pickled, never the data or ownership."""
+        return {
+            "name": self.name,
+            "shape": self.shape,
+            "dtype": self.dtype,
+            "backend": self.backend,
+            "start": self.start,
+            "stop": self.stop,
+        }
+
+    def __setstate__(self, state: dict):
+        """Restores handle in worker."""
+        self.__dict__.update(state)
+
+    def __len__(self) -> int:
+        """Number of visible rows."""
+        return self.stop - self.start
+
+    def __getitem__(self, key):
+        """Slice of rows returns new handle, anything else indexes the view."""
+
+        if isinstance(key, slice) and key.step in (None, 1):
+            start, stop, _ = key.indices(len(self))
+            return SharedArray(
+                self.name,
+                self.shape,
+                self.dtype,
+                self.backend,
+                self.start + start,
+                self.start + max(start, stop),
+            )
+        return self.open()[key]
+
+    def __array__(self, dtype=None, copy=None):
+        """Enables np.asarray(handle)."""
+        view = self.open()
+        return view if dtype is None else view.astype(dtype)
+
+    def open(self) -> object:
+        """Returns view of the array without copying.
+
+        Returns
+        ----------
+        np.ndarray
+        """
+        whole = _attach(self.name, self.backend, self.shape, self.dtype)
+        return whole[self.start : self.stop]
+
+    def unlink(self):
+        """Frees shared storage, owner only."""
+
+        if not self._owner:
+            return
+
+        attached = _attached.pop(self.name, None)
+        if attached is not None:
+            shm, _ = attached
+            del attached
+            if shm is not None:
+                try:
+                    shm.close()
+                except BufferError:
+                    # views are still used in this process, freed on exit
+                    pass
+
+        try:
+            if self.backend == "shm":
+                self._shm.unlink()
+                self._shm.close()
+            else:
+                os.remove(self.name)
+        except (BufferError, OSError):
+            pass
+
+        self._owner = False
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+START METHOD
+"""
+
+import multiprocessing as mp
+
+START_METHOD_OPTIONS = [None, "fork", "spawn", "forkserver"]
+
+
+def get_mp_context(start_method: str = None, preload: list = None) -> object:
+    """Returns multiprocessing context of selected start method.
+
+    Parameters
+    ----------
+    start_method : str, optional
+        How worker processes are started (default is None -> platform default). Options are [None, "fork", "spawn", "forkserver"].
+        "fork" is the fastest but unsafe with threads, "spawn" re-imports modules in every worker,
+        "forkserver" forks workers from one clean server process.
+    preload : list, optional
+        Names of modules imported once in the fork server, so its workers start already warm,
+        e.g. ["numpy", "antools.multiprocessing"] (default is None). Only for "forkserver".
+        The fork server is shared by the whole process, preload is applied only before it starts.
+
+    Returns
+    ----------
+    Multiprocessing context
+    """
+
+    if start_method not in START_METHOD_OPTIONS:
+        raise ValueError(
+            f"Start method <{start_method}> is not valid! It must be in {START_METHOD_OPTIONS}!"
+        )
+    if start_method is not None and start_method not in mp.get_all_start_methods():
+        raise ValueError(
+            f"Start method <{start_method}> is not available on this platform! It must be in {mp.get_all_start_methods()}!"
+        )
+
+    ctx = mp.get_context(start_method)
+    if preload:
+        if ctx.get_start_method() != "forkserver":
+            raise ValueError(
+                f"Preload is supported only with <forkserver> start method, not <{ctx.get_start_method()}>!"
+            )
+        # main module is preloaded by default, keep it
+        modules = list(preload)
+        if "__main__" not in modules:
+            modules.insert(0, "__main__")
+        ctx.set_forkserver_preload(modules)
+
+    return ctx
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+SYNC PRIMITIVES CLASS
+"""
+
+import multiprocessing as mp
+import time
+import uuid
+import weakref
+from multiprocessing import context
+
+# sync primitives known to current process, by id, dropped with their last reference
+_registry = weakref.WeakValueDictionary()
+# sync primitives registered by pool initializer, kept for whole life of worker process
+_initialized = {}
+# sync primitives used for unknown ids (e.g. on remote host), set by initializer
+_default = None
+
+
+def _resolve(sync_id: str, name: str = None) -> object:
+    """Returns sync primitives (or one of its primitives) registered in current process."""
+
+    if sync_id not in _registry and _default is not None:
+        sync = _default
+    elif sync_id not in _registry:
+        raise RuntimeError(
+            "SyncPrimitives are not available in this process! Pass them to pool through initializer -> SyncPrimitives.initializer."
+        )
+    else:
+        sync = _registry[sync_id]
+    return sync if name is None else getattr(sync, name)
+
+
+def _spawning() -> bool:
+    """Value True if object is pickled for new process, False if it is sent as task argument."""
+    return context.get_spawning_popen() is not None
+
+
+class TimedPrimitive:
+    """Native multiprocessing lock or semaphore which records how long acquires wait.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Name of the primitive in SyncPrimitives.
+    _primitive : object
+        Native multiprocessing Lock or Semaphore.
+    _stats : object
+        Shared array [acquires, total wait time, max wait time].
+    _exclusive : bool
+        Value True for lock, stats are then updated while lock is held.
+
+    Methods
+    -------
+    acquire(self, block:bool=True, timeout:float=None)
+        Acquire primitive and record wait time.
+    release(self)
+        Release primitive.
+    stats(self)
+        Returns dictionary with number of acquires and wait times.
+    """
+
+    def __init__(
+        self, name: str, sync_id: str, primitive: object, stats: object, exclusive: bool
+    ):
+        """Class constructor."""
+        self.name = name
+        self._sync_id = sync_id
+        self._primitive = primitive
+        self._stats = stats
+        self._exclusive = exclusive
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"TimedPrimitive(name={self.name}, {self.stats()})"
+
+    def __reduce__(self):
+        """Whole primitive is inherited by new processes, tasks get only reference."""
+        if _spawning():
+            return TimedPrimitive, (
+                self.name,
+                self._sync_id,
+                self._primitive,
+                self._stats,
+                self._exclusive,
+            )
+        return _resolve, (self._sync_id, self.name)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def acquire(self, block: bool = True, timeout: float = None) -> bool:
+        """Acquire primitive and record wait time.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait until primitive is acquired (default is True).
+        timeout : float, optional
+            Max seconds to wait (default is None -> no limit).
+
+        Returns
+        ----------
+        True if primitive was acquired
+        """
+
+        st = time.perf_counter()
+        acquired = self._primitive.acquire(block, timeout)
+        wait_time = time.perf_counter() - st
+
+        if acquired:
+            if self._exclusive:
+                # lock is held, nobody else can update stats
+                self._record(wait_time)
+            else:
+                with self._stats.get_lock():
+                    self._record(wait_time)
+
+        return acquired
+
+    def release(self):
+        """Release primitive."""
+        self._primitive.release()
+
+    def stats(self) -> dict:
+        """Returns dictionary with number of acquires and wait times in seconds."""
+        acquires, wait_time, max_wait_time = self._stats[:]
+        return {
+            "acquires": int(acquires),
+            "wait_time": wait_time,
+            "max_wait_time": max_wait_time,
+        }
+
+    def _record(self, wait_time: float):
+        """Add wait time to shared stats."""
+        self._stats[0] += 1
+        self._stats[1] += wait_time
+        if wait_time > self._stats[2]:
+            self._stats[2] = wait_time
+
+
+class SyncPrimitives:
+    """Native multiprocessing lock, semaphore and event shared with pool workers.
+    Unlike mp.Manager().Lock(), acquire and release do not call manager server process.
+    Primitives are handed to workers through pool initializer, tasks get only references.
+    Main process keeps them registered only while they are referenced, e.g. by handler or its run.
+
+    ...
+
+    Attributes
+    ----------
+    lock : TimedPrimitive
+        Native lock.
+    semaphore : TimedPrimitive
+        Native semaphore.
+    event : object
+        Native event.
+
+    Methods
+    -------
+    __init__(self, semaphore_value:int=1, ctx:object=None)
+        Class constructor.
+    initializer(sync, default:bool=False)
+        Pool initializer, registers primitives in worker process.
+    stats(self)
+        Returns wait stats of lock and semaphore.
+
+    Examples
+    -------
+    antools/multiprocessing/_examples/_example_sync_primitives.py
+    """
+
+    def __init__(self, semaphore_value: int = 1, ctx: object = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        semaphore_value : int, optional
+            Initial value of semaphore (default is 1).
+        ctx : object, optional
+            Multiprocessing context (default is None -> mp.get_context()).
+        """
+
+        ctx = mp.get_context() if ctx is None else ctx
+        self._id = uuid.uuid4().hex
+        self.lock = TimedPrimitive(
+            "lock", self._id, ctx.Lock(), ctx.Array("d", 3, lock=False), True
+        )
+        self.semaphore = TimedPrimitive(
+            "semaphore",
+            self._id,
+            ctx.Semaphore(semaphore_value),
+            ctx.Array("d", 3),
+            False,
+        )
+        self.event = ctx.Event()
+        _registry[self._id] = self
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"SyncPrimitives({self.stats()})"
+
+    def __reduce__(self):
+        """Whole primitives are inherited by new processes, tasks get only reference."""
+        if _spawning():
+            return SyncPrimitives._rebuild, (
+                self._id,
+                self.lock,
+                self.semaphore,
+                self.event,
+            )
+        return _resolve, (self._id,)
+
+    @staticmethod
+    def _rebuild(sync_id: str, lock, semaphore, event) -> "SyncPrimitives":
+        """Rebuild primitives in new process."""
+        sync = SyncPrimitives.__new__(SyncPrimitives)
+        sync._id = sync_id
+        sync.lock = lock
+        sync.semaphore = semaphore
+        sync.event = event
+        return sync
+
+    @staticmethod
+    def initializer(sync: "SyncPrimitives", default: bool = False):
+        """Pool initializer, registers primitives in worker process.
+
+        Parameters
+        ----------
+        sync : SyncPrimitives
+            Primitives created in main process.
+        default : bool, optional
+            Use primitives also for references to unknown primitives, e.g. primitives of handler
+            on another host (default is False).
+        """
+        global _default
+        _initialized[sync._id] = sync
+        _registry[sync._id] = sync
+        if default:
+            _default = sync
+
+    def stats(self) -> dict:
+        """Returns wait stats of lock and semaphore."""
+        return {"lock": self.lock.stats(), "semaphore": self.semaphore.stats()}
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+WORKER POOL CLASS
+"""
+
+import collections
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import connection
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _get_rss() -> int:
+    """Returns resident memory of current process in bytes."""
+
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        # no procfs (e.g. Windows without psutil), recycling by memory is disabled
+        return 0
+
+
+def _worker_loop(
+    conn: object,
+    initializer: object,
+    initargs: tuple,
+    max_tasks: int,
+    max_rss: int,
+):
+    """Run tasks received from main process until recycled or stopped."""
+
+    if initializer is not None:
+        initializer(*initargs)
+
+    done = 0
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+
+        task_id, func, args = task
+        try:
+            result = (task_id, True, func(*args))
+        except BaseException as err:
+            result = (task_id, False, err)
+
+        done += 1
+        recycle = bool(
+            (max_tasks and done >= max_tasks) or (max_rss and _get_rss() > max_rss)
+        )
+        try:
+            conn.send(result + (recycle,))
+        except Exception as err:
+            # result or error cannot be pickled
+            conn.send((task_id, False, RuntimeError(repr(err)), recycle))
+
+        if recycle:
+            break
+
+
+class _Worker:
+    """Worker process with its own task pipe."""
+
+    def __init__(self, ctx: object, initializer, initargs, max_tasks, max_rss):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_loop,
+            args=(child_conn, initializer, initargs, max_tasks, max_rss),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.task_id = None
+        self.deadline = None
+
+    def stop(self, kill: bool = False):
+        """Stop worker, kill it if it is busy or hung."""
+
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        self.process.join(timeout=None if kill else 5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """Supervised process pool. Every task has its deadline, failed tasks are retried
+    and workers are recycled after number of tasks or when memory grows too much.
+    Hung, crashed or recycled worker is replaced, other workers keep running.
+
+    ...
+
+    Attributes
+    ----------
+    max_workers : int
+        Number of worker processes.
+    max_tasks_per_worker : int
+        Worker is replaced after this number of tasks (None -> never).
+    max_worker_rss : int
+        Worker is replaced when its resident memory exceeds this number of bytes (None -> never).
+    replaced_workers : int
+        Number of workers replaced because of timeout, crash or recycling.
+
+    Methods
+    -------
+    __init__(self, max_workers:int=os.cpu_count(), initializer=None, initargs:tuple=(), max_tasks_per_worker:int=None, max_worker_rss:int=None, ctx:object=None)
+        Class constructor.
+    map(self, func, tasks:list, timeout:float=None, retries:int=0, callback=None)
+        Run func(*task) for every task, returns list of (ok, result or error).
+    shutdown(self)
+        Stop all workers.
+
+    Examples
+    -------
+    antools/multiprocessing/_examples/_example_worker_pool.py
+    """
+
+    def __init__(
+        self,
+        max_workers: int = os.cpu_count(),
+        initializer=None,
+        initargs: tuple = (),
+        max_tasks_per_worker: int = None,
+        max_worker_rss: int = None,
+        ctx: object = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of worker processes (default is os.cpu_count()).
+        initializer : optional
+            Function called in every new worker (default is None).
+        initargs : tuple, optional
+            Arguments of initializer (default is ()).
+        max_tasks_per_worker : int, optional
+            Worker is replaced after this number of tasks (default is None -> never).
+        max_worker_rss : int, optional
+            Worker is replaced when its resident memory exceeds this number of bytes (default is None -> never).
+        ctx : object, optional
+            Multiprocessing context (default is None -> mp.get_context()).
+        """
+
+        self.max_workers = max_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_rss = max_worker_rss
+        self.replaced_workers = 0
+        self._initializer = initializer
+        self._initargs = initargs
+        self._ctx = mp.get_context() if ctx is None else ctx
+        self._workers = [self._start_worker() for _ in range(max_workers)]
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"WorkerPool(max_workers={self.max_workers}, max_tasks_per_worker={self.max_tasks_per_worker}, max_worker_rss={self.max_worker_rss}, replaced_workers={self.replaced_workers})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def map(
+        self,
+        func,
+        tasks: list,
+        timeout: float = None,
+        retries: int = 0,
+        callback=None,
+    ) -> list:
+        """Run func(*task) for every task, returns list of (ok, result or error) in order of tasks.
+
+        Parameters
+        ----------
+        func
+            Function to be run, must be picklable.
+        tasks : list
+            List of argument tuples.
+        timeout : float, optional
+            Max seconds for one task, hung worker is killed (default is None -> no limit).
+        retries : int, optional
+            Number of retries of failed or timed out task (default is 0).
+        callback : optional
+            Called as callback(task_id, ok, result or error) in main process when task is finished
+            for good (default is None).
+
+        Returns
+        ----------
+        List of (ok:bool, result or error)
+        """
+
+        pending = collections.deque(range(len(tasks)))
+        attempts = [0] * len(tasks)
+        results = [None] * len(tasks)
+        idle = list(self._workers)
+        busy = []
+
+        def fail(task_id, error):
+            attempts[task_id] += 1
+            if attempts[task_id] <= retries:
+                pending.append(task_id)
+            else:
+                results[task_id] = (False, error)
+                callback(task_id, False, error) if callback else None
+
+        while pending or busy:
+            while pending and idle:
+                worker = idle.pop()
+                worker.task_id = pending.popleft()
+                worker.deadline = (
+                    None if timeout is None else time.monotonic() + timeout
+                )
+                worker.conn.send((worker.task_id, func, tasks[worker.task_id]))
+                busy.append(worker)
+
+            wait_time = None
+            if timeout is not None:
+                wait_time = max(0, min(w.deadline for w in busy) - time.monotonic())
+            connection.wait(
+                [w.conn for w in busy] + [w.process.sentinel for w in busy], wait_time
+            )
+
+            for worker in list(busy):
+                recycle = True
+                if worker.conn.poll():
+                    try:
+                        task_id, ok, value, recycle = worker.conn.recv()
+                    except (EOFError, OSError):
+                        fail(worker.task_id, RuntimeError("Worker pipe was closed!"))
+                    else:
+                        if ok:
+                            results[task_id] = (True, value)
+                            callback(task_id, True, value) if callback else None
+                        else:
+                            fail(task_id, value)
+                elif not worker.process.is_alive():
+                    fail(
+                        worker.task_id,
+                        RuntimeError(
+                            f"Worker died with exit code {worker.process.exitcode}!"
+                        ),
+                    )
+                elif timeout is not None and time.monotonic() >= worker.deadline:
+                    fail(
+                        worker.task_id,
+                        TimeoutError(f"Task exceeded timeout of {timeout} seconds!"),
+                    )
+                else:
+                    continue
+
+                busy.remove(worker)
+                if recycle:
+                    # worker is recycled, crashed or hung
+                    worker.stop(kill=True)
+                    worker = self._replace_worker(worker)
+                idle.append(worker)
+
+        return results
+
+    def shutdown(self):
+        """Stop all workers."""
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
+    def _start_worker(self) -> _Worker:
+        """Start new worker process."""
+        return _Worker(
+            self._ctx,
+            self._initializer,
+            self._initargs,
+            self.max_tasks_per_worker,
+            self.max_worker_rss,
+        )
+
+    def _replace_worker(self, worker: _Worker) -> _Worker:
+        """Replace stopped worker with new one."""
+        self._workers.remove(worker)
+        new_worker = self._start_worker()
+        self._workers.append(new_worker)
+        self.replaced_workers += 1
+        return new_worker
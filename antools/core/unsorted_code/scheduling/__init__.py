@@ -0,0 +1,26 @@
+from ._auto_tuner import AutoTuner, get_cpu_quota, get_usable_cpus
+from ._cancel_token import Cancelled, CancelToken, get_cancel_token
+from ._checkpoint import Checkpoint
+from ._chunking import CHUNKING_OPTIONS, get_chunk_bounds, iter_chunks
+from ._free_threading import (
+    GIL_STATUS_OPTIONS,
+    get_gil_status,
+    is_free_threaded_build,
+    is_gil_enabled,
+)
+from ._interpreter_pool import InterpreterPool, is_interpreters_available
+from ._loop_executor import LoopExecutor
+from ._node_cache import CachedResult, NodeCache
+from ._object_store import ObjectRef, ObjectStore
+from ._partitioner import as_sequence, partition
+from ._process_pool import ProcessPool
+from ._schedule_engine import (
+    EXECUTOR_OPTIONS,
+    ON_ERROR_OPTIONS,
+    RESOURCE_OPTIONS,
+    ScheduleEngine,
+    get_total_memory,
+    node,
+)
+from ._telemetry import TaskRecord, Telemetry
+from ._worker_local import WorkerLocal, worker_local
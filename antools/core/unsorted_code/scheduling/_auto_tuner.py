@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+AUTO TUNER CLASS
+"""
+
+import concurrent.futures
+import math
+import os
+import time
+
+from antools.scheduling._partitioner import partition
+
+
+def _read_file(path: str) -> str:
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def get_cpu_quota() -> float:
+    """Returns CPU limit of cgroup (v2 or v1) of current process in CPUs, None if there is no limit."""
+
+    # cgroup v2, "<quota> <period>" or "max <period>"
+    content = _read_file("/sys/fs/cgroup/cpu.max")
+    if content is not None:
+        quota, _, period = content.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+
+    # cgroup v1, quota is -1 when there is no limit
+    quota = _read_file("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+    period = _read_file("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+    if quota is not None and period is not None and int(quota) > 0:
+        return int(quota) / int(period)
+    return None
+
+
+def get_usable_cpus() -> int:
+    """Returns number of CPUs current process may really use, respects affinity mask and cgroup CPU quota."""
+
+    if hasattr(os, "process_cpu_count"):
+        cpus = os.process_cpu_count()
+    elif hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count()
+    cpus = cpus or 1
+
+    quota = get_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+class AutoTuner:
+    """Online hill climbing of number of workers and chunk size of one run.
+    Throughput (items per second) is measured over windows of finished chunks, one parameter is moved
+    at a time while throughput grows, otherwise the best setting is restored and the other direction
+    (then the other parameter) is tried. Best setting is cached per function, so later runs start from it.
+
+    ...
+
+    Attributes
+    ----------
+    key : str
+        Cache key of tuned function, "<module>.<qualname>".
+    max_workers : int
+        Upper limit of workers (usable CPUs by default), executor should be created with it.
+    workers : int
+        Current number of chunks running at once.
+    chunksize : int
+        Current number of items in chunk.
+    converged : bool
+        True when no move improves throughput anymore.
+    throughput : float
+        Items per second of the whole run, set by map().
+    history : list
+        List of (workers, chunksize, throughput) of measured windows.
+
+    Methods
+    -------
+    __init__(self, func, n_items:int, max_workers:int=None, tolerance:float=0.05)
+        Class constructor.
+    map(self, submit, args)
+        Run all chunks of args through submit(chunk) -> Future, returns chunk results in order of args.
+    record(self, n_items:int, generation:int)
+        Account finished chunk, moves setting when window is complete.
+    get_cached(func) -> tuple
+        Returns cached (workers, chunksize) of function or None.
+    clear_cache()
+        Forget tuned settings of all functions.
+    """
+
+    # best (workers, chunksize) of tuned functions
+    _cache = {}
+
+    PARAMETER_OPTIONS = ["workers", "chunksize"]
+
+    def __init__(
+        self, func, n_items: int, max_workers: int = None, tolerance: float = 0.05
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        func
+            Tuned function.
+        n_items : int
+            Number of items of the run.
+        max_workers : int, optional
+            Upper limit of workers (default is None -> get_usable_cpus()).
+        tolerance : float, optional
+            Relative throughput gain needed to accept a move (default is 0.05).
+        """
+
+        self.key = self.get_key(func)
+        self.n_items = n_items
+        self.max_workers = max_workers or get_usable_cpus()
+        self.tolerance = tolerance
+        self.max_chunksize = max(1, math.ceil(n_items / self.max_workers))
+
+        cached = self._cache.get(self.key)
+        if cached is None:
+            # many small chunks at first, so there are windows to measure
+            self.workers = self.max_workers
+            self.chunksize = max(1, n_items // (16 * self.max_workers))
+        else:
+            # climbing continues from the best setting of previous runs
+            self.workers = min(cached[0], self.max_workers)
+            self.chunksize = min(cached[1], self.max_chunksize)
+
+        self.converged = False
+        self.throughput = None
+        self.best = (self.workers, self.chunksize, 0.0)
+        self.history = []
+        self.generation = 0
+        self._parameter = 0
+        self._direction = -1
+        self._failed = 0
+        self._window_start = None
+        self._window_items = 0
+        self._window_chunks = 0
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"AutoTuner(key={self.key}, workers={self.workers}, chunksize={self.chunksize}, converged={self.converged})"
+
+    @staticmethod
+    def get_key(func) -> str:
+        """Returns cache key of function."""
+        return f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', repr(func))}"
+
+    @classmethod
+    def get_cached(cls, func) -> tuple:
+        """Returns cached (workers, chunksize) of function or None."""
+        return cls._cache.get(cls.get_key(func))
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget tuned settings of all functions."""
+        cls._cache.clear()
+
+    def map(self, submit, args) -> list:
+        """Run all chunks of args through submit(chunk) -> Future, at most workers chunks at once.
+
+        Parameters
+        ----------
+        submit
+            Function submitting one chunk to executor, returns concurrent.futures.Future.
+        args
+            Sliceable sequence, see as_sequence().
+
+        Returns
+        ----------
+        List of chunk results in order of args
+        """
+
+        results = {}
+        pending = {}
+        start = 0
+        run_start = self._window_start = time.perf_counter()
+        try:
+            while start < self.n_items or pending:
+                while start < self.n_items and len(pending) < self.workers:
+                    stop = min(start + self.chunksize, self.n_items)
+                    chunk = partition(args, [(start, stop)])[0]
+                    pending[submit(chunk)] = (start, stop, self.generation)
+                    start = stop
+
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    chunk_start, chunk_stop, generation = pending.pop(future)
+                    results[chunk_start] = future.result()
+                    self.record(chunk_stop - chunk_start, generation)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        self.throughput = self.n_items / max(time.perf_counter() - run_start, 1e-9)
+        self._cache[self.key] = self.best[:2]
+        return [results[start] for start in sorted(results)]
+
+    def record(self, n_items: int, generation: int):
+        """Account finished chunk, moves setting when window is complete.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of items of finished chunk.
+        generation : int
+            Generation of setting the chunk was submitted with, chunks of older settings are not measured.
+        """
+
+        if self.converged or generation != self.generation:
+            return
+
+        self._window_items += n_items
+        self._window_chunks += 1
+        if self._window_chunks < 2 * self.workers:
+            return
+
+        throughput = self._window_items / max(
+            time.perf_counter() - self._window_start, 1e-9
+        )
+        self.history.append((self.workers, self.chunksize, throughput))
+        self._step(throughput)
+
+        self.generation += 1
+        self._window_start = time.perf_counter()
+        self._window_items = 0
+        self._window_chunks = 0
+
+    def _step(self, throughput: float):
+        """Hill climbing move after measured window."""
+
+        if throughput > self.best[2] * (1 + self.tolerance):
+            self.best = (self.workers, self.chunksize, throughput)
+            self._failed = 0
+        else:
+            # go back to best setting and try other direction, then other parameter
+            self.workers, self.chunksize = self.best[:2]
+            self._failed += 1
+            if self._failed % 2 == 0:
+                self._parameter = (self._parameter + 1) % len(self.PARAMETER_OPTIONS)
+            self._direction = -self._direction
+            if self._failed >= 2 * len(self.PARAMETER_OPTIONS):
+                self.converged = True
+                return
+
+        # move, directions leading out of limits count as failed
+        for _ in range(2 * len(self.PARAMETER_OPTIONS)):
+            if self._move():
+                return
+            self._failed += 1
+            if self._failed % 2 == 0:
+                self._parameter = (self._parameter + 1) % len(self.PARAMETER_OPTIONS)
+            self._direction = -self._direction
+            if self._failed >= 2 * len(self.PARAMETER_OPTIONS):
+                break
+        self.converged = True
+
+    def _move(self) -> bool:
+        """Move current parameter in current direction, returns False at its limit."""
+
+        if self.PARAMETER_OPTIONS[self._parameter] == "workers":
+            workers = min(max(self.workers + self._direction, 1), self.max_workers)
+            if workers == self.workers:
+                return False
+            self.workers = workers
+        else:
+            chunksize = (
+                self.chunksize * 2 if self._direction > 0 else self.chunksize // 2
+            )
+            chunksize = min(max(chunksize, 1), self.max_chunksize)
+            if chunksize == self.chunksize:
+                return False
+            self.chunksize = chunksize
+        return True
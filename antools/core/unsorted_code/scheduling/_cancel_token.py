@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+CANCEL TOKEN CLASS
+"""
+
+import contextvars
+import inspect
+import platform
+import sys
+import threading
+import time
+import uuid
+from multiprocessing import resource_tracker
+
+from antools.scheduling._object_store import _open_segment
+
+# token of node running in current thread or asyncio task
+_current = contextvars.ContextVar("antools_cancel_token", default=None)
+# flags of tokens attached in current process, by segment name
+_attached = {}
+
+
+class Cancelled(Exception):
+    """Raised by CancelToken.raise_if_cancelled() inside of cancelled node."""
+
+
+def get_cancel_token() -> "CancelToken":
+    """Returns CancelToken of schedule node running in current thread, process or asyncio task, None outside of schedule."""
+    return _current.get()
+
+
+class CancelToken:
+    """Cooperative cancellation of schedule, cheap to check from threads, asyncio tasks and worker processes.
+    In the owner process the flag is a plain attribute, shared memory flag of one byte is created only
+    when the token is first sent to a worker process. Deadline is checked against wall clock, so it is
+    valid in every process of the machine.
+
+    ...
+
+    Attributes
+    ----------
+    deadline : float
+        Time (time.time()) after which token is cancelled, None -> no deadline.
+    reason : str
+        Why token was cancelled (only in process which cancelled it).
+
+    Methods
+    -------
+    __init__(self, deadline:float=None)
+        Class constructor.
+    cancelled(self)
+        True if token was cancelled or deadline passed (property).
+    cancel(self, reason:str="Cancelled by user")
+        Cancel token in all processes.
+    raise_if_cancelled(self)
+        Raise Cancelled if token was cancelled.
+    remaining(self)
+        Seconds to deadline, None without deadline.
+    close(self)
+        Free shared memory flag.
+
+    Examples
+    -------
+    antools/scheduling/_examples/_example_cancellation.py
+    """
+
+    def __init__(self, deadline: float = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        deadline : float, optional
+            Seconds from now after which token is cancelled (default is None -> no deadline).
+        """
+
+        self.deadline = None if deadline is None else time.time() + deadline
+        self.reason = None
+        self._cancelled = False
+        self._owner = True
+        self._name = None
+        self._segment = None
+        self._lock = threading.Lock()
+        if sys.version_info < (3, 13):
+            # workers started later share tracker of main process and do not free the flag on exit
+            resource_tracker.ensure_running()
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"CancelToken(cancelled={self.cancelled}, reason={self.reason}, deadline={self.deadline})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self) -> tuple:
+        """Worker processes get name of shared flag, it is created on first pickling."""
+        with self._lock:
+            if self._owner and self._segment is None:
+                self._name = f"antools_cancel_{uuid.uuid4().hex[:16]}"
+                self._segment = _open_segment(self._name, create=True, size=1)
+                self._segment.buf[0] = self._cancelled
+        return self._name, self.deadline, platform.node()
+
+    def __setstate__(self, state: tuple):
+        self._name, self.deadline, host = state
+        # shared flag exists only on machine of owner, remote workers check only the deadline
+        self._name = self._name if host == platform.node() else None
+        self.reason = None
+        self._cancelled = False
+        self._owner = False
+        self._segment = None
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """True if token was cancelled or deadline passed."""
+
+        if self._cancelled:
+            return True
+        if self.deadline is not None and time.time() >= self.deadline:
+            return True
+        if self._owner or self._name is None:
+            return False
+
+        segment = _attached.get(self._name)
+        if segment is None:
+            try:
+                segment = _attached[self._name] = _open_segment(self._name)
+            except FileNotFoundError:
+                # owner already closed the token, its schedule is over
+                return True
+        return bool(segment.buf[0])
+
+    def cancel(self, reason: str = "Cancelled by user"):
+        """Cancel token in all processes.
+
+        Parameters
+        ----------
+        reason : str, optional
+            Why token was cancelled (default is "Cancelled by user").
+        """
+
+        with self._lock:
+            if self._cancelled:
+                return
+            self.reason = reason
+            self._cancelled = True
+            segment = self._segment if self._owner else _attached.get(self._name)
+            if segment is None and not self._owner and self._name is not None:
+                try:
+                    segment = _attached[self._name] = _open_segment(self._name)
+                except FileNotFoundError:
+                    segment = None
+            if segment is not None:
+                segment.buf[0] = 1
+
+    def raise_if_cancelled(self):
+        """Raise Cancelled if token was cancelled."""
+        if self.cancelled:
+            raise Cancelled(self.reason or "Schedule was cancelled!")
+
+    def remaining(self) -> float:
+        """Seconds to deadline, None without deadline."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+
+    def close(self):
+        """Free shared memory flag, owner closes it when its schedule is finished."""
+
+        with self._lock:
+            if self._owner and self._segment is not None:
+                self._segment.close()
+                try:
+                    self._segment.unlink()
+                except FileNotFoundError:
+                    pass
+                self._segment = None
+
+    @staticmethod
+    def run_node(token: "CancelToken", func, *args):
+        """Run func(*args) with token available by get_cancel_token(), coroutine functions are awaited in their task."""
+
+        if inspect.iscoroutinefunction(func):
+            return CancelToken._run_async_node(token, func, *args)
+
+        reset = _current.set(token)
+        try:
+            return func(*args)
+        finally:
+            _current.reset(reset)
+
+    @staticmethod
+    async def _run_async_node(token: "CancelToken", func, *args):
+        # context of asyncio task is its own copy, nothing has to be reset
+        _current.set(token)
+        return await func(*args)
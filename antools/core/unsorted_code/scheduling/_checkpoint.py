@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+CHECKPOINT CLASS
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+
+
+class Checkpoint:
+    """Local store of finished chunks of long run_func job.
+    Every finished chunk is written to its own file and recorded in append-only journal,
+    so when job with the same job_id is run again, only missing chunks are computed.
+
+    ...
+
+    Attributes
+    ----------
+    job_id : str
+        Identifier of the job.
+    folder : str
+        Folder with chunk files and journal of the job.
+    _journal_path : str
+        Path of append-only journal, one line "start stop file_name" per finished chunk.
+
+    Methods
+    -------
+    __init__(self, job_id:str, folder:str=None)
+        Class constructor.
+    load(self, bounds:list)
+        Returns dictionary chunk index -> data of finished chunks.
+    save(self, bound:tuple, data)
+        Writes finished chunk and records it in journal.
+    clear(self)
+        Removes all files of the job.
+
+    Examples
+    -------
+    antools/scheduling/_examples/_example_checkpoint.py
+    """
+
+    def __init__(self, job_id: str, folder: str = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job, use the same one to resume the job.
+        folder : str, optional
+            Root folder of checkpoints (default is None -> <TEMP>/antools_checkpoints).
+        """
+
+        if not job_id or os.sep in job_id or "/" in job_id:
+            raise ValueError(f"Job id <{job_id}> is not valid file name!")
+
+        root = (
+            os.path.join(tempfile.gettempdir(), "antools_checkpoints")
+            if folder is None
+            else folder
+        )
+        self.job_id = job_id
+        self.folder = os.path.join(root, job_id)
+        self._journal_path = os.path.join(self.folder, "journal.log")
+        os.makedirs(self.folder, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"Checkpoint(job_id={self.job_id}, folder={self.folder})"
+
+    def load(self, bounds: list) -> dict:
+        """Returns dictionary chunk index -> data of chunks finished in previous runs.
+
+        Parameters
+        ----------
+        bounds : list
+            List of (start, stop) tuples of current run, see get_chunk_bounds().
+
+        Returns
+        ----------
+        Dictionary
+        """
+
+        journal = {}
+        try:
+            with open(self._journal_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    parts = line.split()
+                    # last line can be incomplete if job was killed while writing it
+                    if len(parts) == 3 and line.endswith("\n"):
+                        journal[(int(parts[0]), int(parts[1]))] = parts[2]
+        except FileNotFoundError:
+            return {}
+
+        finished = {}
+        for i, bound in enumerate(bounds):
+            if tuple(bound) not in journal:
+                continue
+            try:
+                with open(
+                    os.path.join(self.folder, journal[tuple(bound)]), "rb"
+                ) as file:
+                    finished[i] = pickle.load(file)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+
+        return finished
+
+    def save(self, bound: tuple, data) -> bool:
+        """Writes finished chunk and records it in journal.
+
+        Parameters
+        ----------
+        bound : tuple
+            (start, stop) of the chunk.
+        data
+            Picklable results of the chunk.
+
+        Returns
+        ----------
+        True if chunk was saved
+        """
+
+        start, stop = bound
+        file_name = f"chunk_{start}_{stop}.pkl"
+        path = os.path.join(self.folder, file_name)
+        try:
+            with open(path + ".tmp", "wb") as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(path + ".tmp", path)
+        except Exception:
+            return False
+
+        with open(self._journal_path, "a", encoding="utf-8") as file:
+            file.write(f"{start} {stop} {file_name}\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        return True
+
+    def clear(self):
+        """Removes all files of the job."""
+        shutil.rmtree(self.folder, ignore_errors=True)
+        os.makedirs(self.folder, exist_ok=True)
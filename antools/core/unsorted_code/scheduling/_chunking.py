@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+CHUNKING
+"""
+
+import itertools
+import math
+
+CHUNKING_OPTIONS = ["static", "fixed", "guided", "stealing"]
+
+
+def get_chunk_bounds(
+    n_items: int, max_workers: int, chunking: str = "static", chunksize: int = None
+) -> list:
+    """Returns (start, stop) bounds of chunks for selected scheduling policy.
+
+    Parameters
+    ----------
+    n_items : int
+        Number of items which should be processed.
+    max_workers : int
+        Max workers used for the process.
+    chunking : str, optional
+        Scheduling policy (default is "static"). Options are:
+        "static" -> exactly max_workers chunks of (almost) equal size,
+        "fixed" -> chunks of chunksize items,
+        "guided" -> shrinking chunks, each is remaining / max_workers but at least chunksize,
+        "stealing" -> chunks of chunksize items pulled by workers from a shared queue.
+    chunksize : int, optional
+        Size of chunk for "fixed" and "stealing", minimal size of chunk for "guided"
+        (default is None -> n_items / (4 * max_workers) for "fixed" and "stealing", 1 for "guided").
+
+    Returns
+    ----------
+    List of (start, stop) tuples in order of items
+    """
+
+    if chunking not in CHUNKING_OPTIONS:
+        raise ValueError(
+            f"Chunking <{chunking}> is not valid. Chunking must be in {CHUNKING_OPTIONS}!"
+        )
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(
+            f"Chunksize must be a positive integer, inserted value is {chunksize}!"
+        )
+
+    max_workers = max(1, max_workers)
+    bounds = []
+
+    if chunking == "static":
+        # same split as np.array_split, empty chunks are skipped
+        size, extra = divmod(n_items, max_workers)
+        start = 0
+        for i in range(max_workers):
+            stop = start + size + (1 if i < extra else 0)
+            if stop > start:
+                bounds.append((start, stop))
+            start = stop
+
+    elif chunking == "guided":
+        chunksize = 1 if chunksize is None else chunksize
+        start = 0
+        while start < n_items:
+            size = max(math.ceil((n_items - start) / max_workers), chunksize)
+            stop = min(start + size, n_items)
+            bounds.append((start, stop))
+            start = stop
+
+    else:
+        chunksize = (
+            max(1, math.ceil(n_items / (4 * max_workers)))
+            if chunksize is None
+            else chunksize
+        )
+        for start in range(0, n_items, chunksize):
+            bounds.append((start, min(start + chunksize, n_items)))
+
+    return bounds
+
+
+def iter_chunks(args, chunksize: int = 1):
+    """Lazily yields chunks (lists) of chunksize items from any iterable.
+
+    Parameters
+    ----------
+    args
+        Any iterable, it is consumed only as chunks are requested.
+    chunksize : int, optional
+        Number of items in chunk (default is 1).
+
+    Returns
+    ----------
+    Generator of lists
+    """
+
+    if chunksize < 1:
+        raise ValueError(
+            f"Chunksize must be a positive integer, inserted value is {chunksize}!"
+        )
+
+    iterator = iter(args)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+PARTITIONER BENCHMARK
+
+Compares partition() against the previous np.array_split() splitting of run_func args.
+Measures throughput (best of repeats) and peak memory allocated while splitting (tracemalloc).
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from antools.scheduling import as_sequence, get_chunk_bounds, partition
+
+REPEATS = 5
+MAX_WORKERS = 8
+
+
+def _split_numpy(args):
+    return np.array_split(args, MAX_WORKERS)
+
+
+def _split_partitioner(args):
+    args = as_sequence(args)
+    return partition(args, get_chunk_bounds(len(args), MAX_WORKERS))
+
+
+def _measure(split, args) -> tuple:
+    """Returns (best time in seconds, peak memory in MB, type of first item)"""
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        st = time.perf_counter()
+        split(args)
+        best = min(best, time.perf_counter() - st)
+
+    tracemalloc.start()
+    chunks = split(args)
+    peak = tracemalloc.get_traced_memory()[1] / 1024**2
+    tracemalloc.stop()
+
+    return best, peak, type(chunks[0][0]).__name__
+
+
+if __name__ == "__main__":
+
+    N = 1_000_000
+    INPUTS = {
+        "list[int]": list(range(N)),
+        "list[list[int]]": [[i, i + 1] for i in range(N)],
+        "list[str]": [str(i) for i in range(N)],
+        "tuple[int]": tuple(range(N)),
+        "range": range(N),
+        "np.ndarray[float64]": np.arange(N, dtype=np.float64),
+    }
+
+    print(
+        f"{'INPUT':<22}{'SPLITTER':<14}{'TIME [s]':>12}{'ITEMS/s':>16}{'PEAK [MB]':>12}  ITEM TYPE"
+    )
+    for name, args in INPUTS.items():
+        for splitter, split in [
+            ("np.array_split", _split_numpy),
+            ("partition", _split_partitioner),
+        ]:
+            best, peak, item_type = _measure(split, args)
+            print(
+                f"{name:<22}{splitter:<14}{best:>12.5f}{N / best:>16,.0f}{peak:>12.2f}  {item_type}"
+            )
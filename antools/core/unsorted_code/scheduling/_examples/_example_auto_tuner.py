@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+AUTO TUNER EXAMPLES
+"""
+
+import math
+import time
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler
+from antools.scheduling import AutoTuner, get_usable_cpus
+from antools.threading import ThreadHandler
+
+
+def cpu_bound(value, lock):
+    return sum(math.sqrt(i) for i in range(value % 100 * 50))
+
+
+def io_bound(value, lock):
+    time.sleep(0.001)
+    return value
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    print(f"USABLE CPUS={get_usable_cpus()}")
+
+    # FIRST EXAMPLE
+    # FIRST RUN TUNES WORKERS AND CHUNK SIZE, SECOND RUN STARTS FROM THE TUNED SETTING
+    handler = MultiProcessHandler(logger)
+    for _ in range(2):
+        st = time.perf_counter()
+        data = handler.run_func(cpu_bound, range(20_000), max_workers="auto")
+        print(
+            f"{round(time.perf_counter() - st, 2)} seconds, tuned setting {AutoTuner.get_cached(cpu_bound)}"
+        )
+
+    # SECOND EXAMPLE
+    # THE SAME IN THREADS
+    data = ThreadHandler(logger).run_func(io_bound, range(2_000), max_workers="auto")
+    print(AutoTuner.get_cached(io_bound))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+SCHEDULE CANCELLATION EXAMPLES
+"""
+
+import threading
+import time
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler, MultiProcess
+from antools.scheduling import CancelToken, get_cancel_token, node
+from antools.threading import ThreadHandler, ThreadProcess
+
+
+def _work(name, lock, logger, seconds, fail=False):
+    p = ThreadProcess(lock, logger)
+    # long work checks the token cheaply, raised Cancelled gives status "CANCELLED"
+    token = get_cancel_token()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        token.raise_if_cancelled()
+        time.sleep(0.01)
+    if fail:
+        p.error = f"{name} failed"
+    else:
+        p.data = name
+        p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+def extract(lock, logger, args=None):
+    return _work("extract", lock, logger, 0.2, fail=True)
+
+
+def transform(lock, logger, args=None):
+    return _work("transform", lock, logger, 0.2)
+
+
+def load(lock, logger, args=None):
+    return _work("load", lock, logger, 0.2)
+
+
+def report(lock, logger, args=None):
+    return _work("report", lock, logger, 3)
+
+
+@node(executor="process")
+def crunch(lock, logger, args=None):
+    # process node which never checks the token, its worker is terminated
+    p = MultiProcess(lock, logger)
+    total = 0
+    for i in range(10**8):
+        total += i
+    p.data = total
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+def short(lock, logger, args=None):
+    return _work("short", lock, logger, 0.5, fail=True)
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    SCHEDULE = {extract: None, transform: extract, load: transform, report: None}
+
+    # FAIL BRANCH -> TRANSFORM AND LOAD ARE SKIPPED, REPORT STILL RUNS
+    data = ThreadHandler(logger).run_schedule(
+        SCHEDULE, max_workers=2, on_error="fail_branch"
+    )
+    print({name: result["status"] for name, result in data.items()})
+
+    # FAIL FAST -> REPORT STOPS ON ITS TOKEN, NOTHING ELSE IS STARTED
+    st = time.perf_counter()
+    data = ThreadHandler(logger).run_schedule(
+        SCHEDULE, max_workers=2, on_error="fail_fast"
+    )
+    print({name: result["status"] for name, result in data.items()})
+    print(round(time.perf_counter() - st, 2), "seconds")
+
+    # DEADLINE -> RUNNING PROCESS NODE IS TERMINATED AFTER 1 SECOND
+    st = time.perf_counter()
+    data = MultiProcessHandler(logger).run_schedule(
+        {crunch: None, report: None}, max_workers=2, deadline=1
+    )
+    print({name: result["status"] for name, result in data.items()})
+    print(round(time.perf_counter() - st, 2), "seconds")
+
+    # TOKEN -> CANCELLED FROM OTHER THREAD
+    token = CancelToken()
+    threading.Timer(0.5, token.cancel, args=("Cancelled by user",)).start()
+    data = ThreadHandler(logger).run_schedule(SCHEDULE, max_workers=2, token=token)
+    print({name: result["status"] for name, result in data.items()})
+
+    # FAIL FAST IN PROCESS SCHEDULE -> WORKER OF CRUNCH IS TERMINATED
+    st = time.perf_counter()
+    data = MultiProcessHandler(logger).run_schedule(
+        {crunch: None, short: None}, max_workers=2, on_error="fail_fast"
+    )
+    print({name: result["status"] for name, result in data.items()})
+    print(round(time.perf_counter() - st, 2), "seconds")
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+CHECKPOINT EXAMPLES
+"""
+
+import os
+import tempfile
+import time
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler
+from antools.scheduling import Checkpoint
+
+# file which makes the first run fail, simulates job killed at the end
+FAIL_FLAG = os.path.join(tempfile.gettempdir(), "antools_example_fail_flag")
+
+
+def slow_func(args, lock):
+    time.sleep(0.05)
+    if args == 190 and os.path.exists(FAIL_FLAG):
+        raise RuntimeError("Job has crashed!")
+    return args * 2
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    Scheduler = MultiProcessHandler(logger)
+    checkpoint = Checkpoint("example_job")
+    checkpoint.clear()
+
+    # FIRST RUN FAILS, FINISHED CHUNKS ARE ALREADY SAVED
+    open(FAIL_FLAG, "w").close()
+    try:
+        Scheduler.run_func(
+            slow_func,
+            args=list(range(200)),
+            max_workers=4,
+            chunking="fixed",
+            chunksize=10,
+            checkpoint=checkpoint,
+        )
+    except Exception as err:
+        print(f"First run failed: {err}")
+    os.remove(FAIL_FLAG)
+
+    # SECOND RUN WITH THE SAME JOB ID COMPUTES ONLY MISSING CHUNKS
+    st = time.perf_counter()
+    data = Scheduler.run_func(
+        slow_func,
+        args=list(range(200)),
+        max_workers=4,
+        chunking="fixed",
+        chunksize=10,
+        checkpoint=checkpoint,
+    )
+    print(data == [i * 2 for i in range(200)], round(time.perf_counter() - st, 2))
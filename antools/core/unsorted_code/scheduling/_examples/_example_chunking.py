@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+CHUNKING EXAMPLES
+"""
+
+from antools.scheduling import CHUNKING_OPTIONS, get_chunk_bounds
+
+if __name__ == "__main__":
+
+    # SAME ITEMS, DIFFERENT SCHEDULING POLICIES
+    for chunking in CHUNKING_OPTIONS:
+        bounds = get_chunk_bounds(100, max_workers=4, chunking=chunking, chunksize=5)
+        print(f"{chunking} -> {len(bounds)} chunks: {bounds}")
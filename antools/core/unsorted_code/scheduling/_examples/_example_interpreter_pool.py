@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+INTERPRETER POOL EXAMPLES
+
+Sub-interpreters need Python 3.13+, CPU bound function is run in processes, sub-interpreters and threads.
+"""
+
+from antools.helpers import ApproachComparator
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler
+from antools.scheduling import InterpreterPool, is_interpreters_available
+
+
+def count_primes(limit, lock):
+    count = 0
+    for num in range(2, limit):
+        for value in range(2, int(num**0.5) + 1):
+            if num % value == 0:
+                break
+        else:
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+
+    if not is_interpreters_available():
+        raise SystemExit("Sub-interpreters need Python 3.13+!")
+
+    logger = get_logger(level="INFO", file_log=False)
+    LIMITS = [20_000 + i for i in range(32)]
+
+    # POOL -> ANY IMPORTABLE FUNCTION
+    with InterpreterPool(max_workers=4) as pool:
+        print(pool.submit(count_primes, 100, None).result())
+
+    # HANDLER -> CHUNKS RUN IN SUB-INTERPRETERS, FUNCTION GETS NONE AS LOCK
+    data = MultiProcessHandler(logger).run_func(
+        count_primes, LIMITS, max_workers=4, executor="interpreter"
+    )
+    print(data[:4])
+
+    # COMPARISON WITH PROCESSES AND THREADS
+    ApproachComparator(count_primes, args=LIMITS).compare_all(
+        max_workers=4, run_main=False
+    )
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+NODE CACHE EXAMPLES
+"""
+
+import time
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcess, MultiProcessHandler
+from antools.scheduling import NodeCache
+
+
+def load(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+
+    time.sleep(2)  # expensive loading
+    p.data = list(range(1000))
+
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+def transform(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+
+    time.sleep(2)  # expensive transformation
+    p.data = [value * 2 for value in args["load"]]
+
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+def report(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+
+    p.data = sum(args["transform"])
+
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    cache = NodeCache(max_size=100 * 1024**2)
+    cache.clear()
+
+    SCHEDULE = {load: None, transform: load, report: transform}
+    Scheduler = MultiProcessHandler(logger)
+
+    # FIRST RUN COMPUTES ALL FUNCTIONS, SECOND RUN LOADS THEM FROM CACHE
+    # CHANGE CODE OF transform() AND ONLY transform() AND report() WILL RUN AGAIN
+    for _ in range(2):
+        st = time.perf_counter()
+        data = Scheduler.run_schedule(SCHEDULE, max_workers=2, cache=cache)
+        print(data["report"], f"{round(time.perf_counter() - st, 2)} seconds")
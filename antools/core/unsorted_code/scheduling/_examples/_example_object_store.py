@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+OBJECT STORE EXAMPLES
+"""
+
+import time
+
+import numpy as np
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcess, MultiProcessHandler
+from antools.scheduling import ObjectStore, node
+from antools.threading import ThreadProcess
+
+
+def load(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+    p.data = np.random.rand(20_000, 1_000)  # 160 MB intermediate result
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+def column_means(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+    array = args["load"].get()  # read-only view of shared memory, nothing is copied
+    p.data = array.mean(axis=0)
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+def row_max(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+    p.data = args["load"].get().max(axis=1)
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+@node(executor="thread")
+def report(lock, logger, args=None):
+    p = ThreadProcess(lock, logger)
+    # handles of all upstream results
+    p.data = round(
+        float(args["column_means"].get().sum() + args["row_max"].get().sum()), 2
+    )
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    SCHEDULE = {
+        load: None,
+        column_means: load,
+        row_max: load,
+        report: [column_means, row_max],
+    }
+    Scheduler = MultiProcessHandler(logger)
+
+    # LOAD RESULT IS WRITTEN TO SHARED MEMORY ONCE AND FREED AFTER BOTH CONSUMERS FINISH
+    for backend in ["shm", "disk"]:
+        with ObjectStore(backend=backend) as store:
+            st = time.perf_counter()
+            data = Scheduler.run_schedule(SCHEDULE, max_workers=2, store=store)
+            print(
+                backend, data["report"], f"{round(time.perf_counter() - st, 2)} seconds"
+            )
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+RESOURCE AWARE SCHEDULING EXAMPLES
+"""
+
+import time
+
+from antools.logging import get_logger
+from antools.scheduling import node
+from antools.threading import ThreadHandler, ThreadProcess
+
+GB = 1024**3
+
+
+def _work(name, lock, logger, seconds):
+    p = ThreadProcess(lock, logger)
+    time.sleep(seconds)
+    p.data = name
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+@node(memory=6 * GB)
+def big_join_1(lock, logger, args=None):
+    return _work("big_join_1", lock, logger, 1)
+
+
+@node(memory=6 * GB)
+def big_join_2(lock, logger, args=None):
+    return _work("big_join_2", lock, logger, 1)
+
+
+@node(cpus=0.5)
+def light_1(lock, logger, args=None):
+    return _work("light_1", lock, logger, 0.5)
+
+
+@node(cpus=0.5)
+def light_2(lock, logger, args=None):
+    return _work("light_2", lock, logger, 0.5)
+
+
+@node(cpus=0)
+def fetch(lock, logger, args=None):
+    return _work("fetch", lock, logger, 0.5)  # waits on I/O, does not take CPU
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    SCHEDULE = {
+        big_join_1: None,
+        big_join_2: None,
+        light_1: None,
+        light_2: None,
+        fetch: None,
+    }
+
+    # BOTH BIG JOINS DO NOT FIT INTO 8 GB TOGETHER, LIGHT NODES SHARE ONE CPU
+    st = time.perf_counter()
+    data = ThreadHandler(logger).run_schedule(
+        SCHEDULE, max_workers=5, resources={"cpus": 2, "memory": 8 * GB}
+    )
+    print(round(time.perf_counter() - st, 2), "seconds")
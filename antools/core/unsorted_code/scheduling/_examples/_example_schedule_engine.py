@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+SCHEDULE ENGINE EXAMPLES
+"""
+
+import asyncio
+import math
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcess, MultiProcessHandler
+from antools.scheduling import node
+from antools.threading import ThreadHandler, ThreadProcess
+
+
+@node(executor="asyncio")
+async def fetch(lock, logger, args=None):
+    p = ThreadProcess(lock, logger)
+    await asyncio.sleep(0.5)  # I/O bound, e.g. HTTP request
+    p.data = list(range(100_000))
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+@node(executor="process")
+def transform(lock, logger, args=None):
+    p = MultiProcess(lock, logger)
+    values = next(iter(args.values()))
+    p.data = [math.sqrt(value) for value in values]  # CPU bound
+    p.status = "OK"
+    return p.finish(terminate_all=False).envelope()
+
+
+@node(executor="thread")
+def store(lock, logger, args=None):
+    p = ThreadProcess(lock, logger)
+    p.data = round(
+        sum(next(iter(args.values()))), 2
+    )  # runs in main process, data is not pickled
+    p.status = "OK"
+    return p.finish(terminate_all=False)
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    schedule = {fetch: [], transform: fetch, store: transform}
+
+    # FIRST EXAMPLE
+    # EVERY NODE RUNS ON ITS OWN EXECUTOR
+    print(ThreadHandler(logger).run_schedule(schedule, max_workers=2)["store"])
+
+    # SECOND EXAMPLE
+    # THE SAME SCHEDULE IN MULTIPROCESS HANDLER, NODES WITHOUT node() RUN IN PROCESSES
+    print(MultiProcessHandler(logger).run_schedule(schedule, max_workers=2)["store"])
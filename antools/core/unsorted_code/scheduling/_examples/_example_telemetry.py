@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+TELEMETRY EXAMPLES
+"""
+
+import os
+import tempfile
+import time
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler
+from antools.scheduling import Telemetry
+from antools.threading import ThreadHandler
+
+
+def uneven_func(args, lock):
+    time.sleep(0.5 if args == 42 else 0.01)  # one straggler
+    return bytes(args * 1000)
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+
+    # FIRST EXAMPLE
+    # EVERY CHUNK RECORDS QUEUE WAIT, SERIALIZATION, EXECUTION AND WORKER, RESULT SIZE WITH sizes=True
+    telemetry = Telemetry(sizes=True)
+    MultiProcessHandler(logger).run_func(
+        uneven_func,
+        args=list(range(100)),
+        max_workers=4,
+        chunking="fixed",
+        chunksize=5,
+        telemetry=telemetry,
+    )
+    print(telemetry.summary())
+
+    # SECOND EXAMPLE
+    # THREADS ARE RECORDED THE SAME WAY, NOTHING IS PICKLED
+    telemetry.clear()
+    ThreadHandler(logger).run_func(
+        uneven_func, args=list(range(100)), max_workers=4, telemetry=telemetry
+    )
+    print(telemetry.summary())
+
+    # THIRD EXAMPLE
+    # OPEN TRACE IN chrome://tracing OR https://ui.perfetto.dev
+    path = os.path.join(tempfile.gettempdir(), "antools_trace.json")
+    telemetry.to_chrome_trace(path)
+    print(f"Trace written to {path}")
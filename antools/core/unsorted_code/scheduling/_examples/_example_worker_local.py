@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+WORKER LOCAL EXAMPLES
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+
+from antools.logging import get_logger
+from antools.multiprocessing import MultiProcessHandler
+from antools.scheduling import worker_local
+from antools.threading import ThreadHandler
+
+
+def open_connection(path):
+    # runs once in every worker, connection is reused by all its tasks
+    worker_local.set("db", sqlite3.connect(path))
+
+
+def query(value, lock):
+    cursor = worker_local.get("db").execute("SELECT ? * ?", (value, value))
+    return cursor.fetchone()[0]
+
+
+def parse(value, lock):
+    # created lazily on first task of the worker
+    counter = worker_local.get("counter", lambda: [threading.get_ident(), 0])
+    counter[1] += 1
+    return counter[0]
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="INFO", file_log=False)
+    path = os.path.join(tempfile.mkdtemp(), "example.db")
+    sqlite3.connect(path).close()
+
+    # FIRST EXAMPLE
+    # ONE CONNECTION PER THREAD, SQLITE CONNECTIONS CANNOT BE SHARED BY THREADS
+    data = ThreadHandler(logger).run_func(
+        query, range(1_000), 4, initializer=open_connection, initargs=(path,)
+    )
+    print(data[:10])
+
+    # SECOND EXAMPLE
+    # ONE CONNECTION PER WORKER PROCESS
+    data = MultiProcessHandler(logger).run_func(
+        query, range(1_000), 2, initializer=open_connection, initargs=(path,)
+    )
+    print(data[:10])
+
+    # THIRD EXAMPLE
+    # LAZY RESOURCE, NUMBER OF DISTINCT THREADS WHICH CREATED IT
+    data = ThreadHandler(logger).run_func(parse, range(1_000), 4, chunking="fixed")
+    print(len(set(data)))
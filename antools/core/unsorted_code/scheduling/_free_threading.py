@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+FREE THREADING
+"""
+
+import sys
+import sysconfig
+
+GIL_STATUS_OPTIONS = ["enabled", "disabled", "re-enabled"]
+
+
+def is_free_threaded_build() -> bool:
+    """Returns True if interpreter was built without the GIL (e.g. python3.13t)."""
+    return bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+def is_gil_enabled() -> bool:
+    """Returns True if the GIL is active now, it can be re-enabled in free-threaded build
+    by PYTHON_GIL=1 or by import of extension which does not support running without it.
+    """
+    if hasattr(sys, "_is_gil_enabled"):
+        return sys._is_gil_enabled()
+    return True
+
+
+def get_gil_status() -> str:
+    """Returns status of the GIL.
+
+    Returns
+    ----------
+    Status of the GIL. Options are ["enabled", "disabled", "re-enabled"],
+    "re-enabled" -> free-threaded build running with the GIL.
+    """
+    if is_gil_enabled():
+        return "re-enabled" if is_free_threaded_build() else "enabled"
+    return "disabled"
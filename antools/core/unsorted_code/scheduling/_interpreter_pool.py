@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+INTERPRETER POOL CLASS
+"""
+
+import concurrent.futures
+import os
+import pickle
+import queue
+import sys
+import threading
+
+try:
+    # low-level module of Python 3.13+, every isolated interpreter has its own GIL
+    import _interpreters
+except ImportError:
+    _interpreters = None
+
+# run once in every sub-interpreter, task and result bytes are exchanged through shared buffers
+_BOOTSTRAP = """
+import pickle
+import runpy
+import sys
+import _interpreters
+
+sys.path[:] = paths.split(pathsep)
+_antools_main_file = main_file
+
+
+def _antools_load_main():
+    # functions defined in script of main interpreter, script is run as __mp_main__
+    namespace = runpy.run_path(_antools_main_file, run_name="__mp_main__")
+    globals().update({k: v for k, v in namespace.items() if not k.startswith("__")})
+    sys.modules["__mp_main__"] = sys.modules["__main__"]
+
+
+def _antools_run(task):
+    try:
+        fn, args = pickle.loads(task)
+        result = (True, fn(*args))
+    except Exception as err:
+        result = (False, err)
+    try:
+        return pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    except Exception as err:
+        error = err if result[0] else result[1]
+        return pickle.dumps((False, RuntimeError(repr(error))))
+"""
+
+_RUN = """
+_antools_result = _antools_run(task)
+size[:8] = len(_antools_result).to_bytes(8, "little")
+"""
+
+_LOAD_MAIN = """
+_antools_load_main()
+"""
+
+_COLLECT = """
+out[:] = _antools_result
+del _antools_result
+"""
+
+
+def is_interpreters_available() -> bool:
+    """Returns True if sub-interpreters with their own GIL can be created (Python 3.13+)."""
+    return _interpreters is not None
+
+
+class InterpreterPool(concurrent.futures.Executor):
+    """Experimental executor running functions in isolated sub-interpreters of main process.
+    Every sub-interpreter has its own GIL, so CPU bound functions run in parallel without worker
+    processes. Objects cannot be shared between interpreters, so function and arguments are pickled
+    into buffer shared with the sub-interpreter and its pickled result is copied back the same way,
+    nothing is sent through pipes. Functions must be importable (or defined in main script guarded by
+    if __name__ == "__main__") and use only modules supporting sub-interpreters, e.g. numpy does not.
+
+    ...
+
+    Attributes
+    ----------
+    max_workers : int
+        Number of sub-interpreters, every one is driven by its own thread of main interpreter.
+        All of them are started in constructor.
+
+    Methods
+    -------
+    __init__(self, max_workers:int=None, initializer=None, initargs:tuple=())
+        Class constructor.
+    submit(self, fn, *args)
+        Schedule fn(*args) in free sub-interpreter, returns concurrent.futures.Future.
+    shutdown(self, wait:bool=True, cancel_futures:bool=False)
+        Stop threads and destroy sub-interpreters.
+
+    Examples
+    -------
+    antools/scheduling/_examples/_example_interpreter_pool.py
+    """
+
+    def __init__(self, max_workers: int = None, initializer=None, initargs: tuple = ()):
+        """Class constructor.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of sub-interpreters (default is None -> os.cpu_count()).
+        initializer : optional
+            Function called as initializer(*initargs) once in every sub-interpreter (default is None).
+        initargs : tuple, optional
+            Arguments of initializer (default is ()).
+        """
+
+        if _interpreters is None:
+            raise ImportError(
+                "InterpreterPool requires Python 3.13+ with _interpreters module!"
+            )
+
+        self.max_workers = max_workers or os.cpu_count()
+        main = sys.modules.get("__main__")
+        self._shared = {
+            "paths": os.pathsep.join(sys.path),
+            "pathsep": os.pathsep,
+            "main_file": getattr(main, "__file__", None) or "",
+        }
+        self._main_loaded = set()
+        self._init = (
+            None
+            if initializer is None
+            else pickle.dumps((initializer, tuple(initargs)), pickle.HIGHEST_PROTOCOL)
+        )
+        self._work_queue = queue.SimpleQueue()
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._started = threading.Semaphore(0)
+        self._threads = [
+            threading.Thread(
+                target=self._drive, name=f"InterpreterPool-{i}", daemon=True
+            )
+            for i in range(self.max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        # sub-interpreters are ready (with initializer run) when constructor returns
+        for _ in self._threads:
+            self._started.acquire()
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"InterpreterPool(max_workers={self.max_workers})"
+
+    def submit(self, fn, /, *args) -> concurrent.futures.Future:
+        """Schedule fn(*args) in free sub-interpreter, returns concurrent.futures.Future."""
+
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to InterpreterPool after shutdown!")
+            future = concurrent.futures.Future()
+            self._work_queue.put((future, fn, args))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop threads and destroy sub-interpreters.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Wait until submitted tasks are finished (default is True).
+        cancel_futures : bool, optional
+            Cancel tasks which did not start yet (default is False).
+        """
+
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in self._threads:
+                self._work_queue.put(None)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _drive(self):
+        """Thread owning one sub-interpreter, runs tasks from work queue in it."""
+
+        interp = None
+        try:
+            interp = _interpreters.create(_interpreters.new_config("isolated"))
+            self._exec(interp, _BOOTSTRAP, self._shared)
+            if self._init is not None:
+                ok, result = self._call(interp, self._init)
+                if not ok:
+                    raise result
+        except Exception as err:
+            # tasks fail instead of hanging, when sub-interpreter cannot be started
+            error = err
+        else:
+            error = None
+        self._started.release()
+
+        try:
+            while True:
+                item = self._work_queue.get()
+                if item is None:
+                    break
+                future, fn, args = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                    continue
+                try:
+                    ok, result = self._call(
+                        interp, pickle.dumps((fn, args), pickle.HIGHEST_PROTOCOL)
+                    )
+                except BaseException as err:
+                    future.set_exception(err)
+                    continue
+                if ok:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+        finally:
+            if interp is not None:
+                _interpreters.destroy(interp)
+
+    @staticmethod
+    def _exec(interp: int, code: str, shared: dict):
+        """Execute code in sub-interpreter, exception in it is raised as RuntimeError."""
+
+        error = _interpreters.exec(interp, code, shared)
+        if error is not None:
+            raise RuntimeError(
+                f"Sub-interpreter failed due to <{error.formatted}>!\n{error.errdisplay}"
+            )
+
+    def _call(self, interp: int, task: bytes) -> tuple:
+        """Run pickled (fn, args) in sub-interpreter, returns (ok, result or exception)."""
+
+        # task refers to script of main interpreter (maybe in nested pickle), it is loaded once
+        if (
+            self._shared["main_file"]
+            and interp not in self._main_loaded
+            and b"__main__" in task
+        ):
+            self._exec(interp, _LOAD_MAIN, {})
+            self._main_loaded.add(interp)
+
+        # buffers are shared, not copied, sub-interpreter reads task and writes size of result
+        size = bytearray(8)
+        self._exec(interp, _RUN, {"task": memoryview(task), "size": memoryview(size)})
+        out = bytearray(int.from_bytes(size, "little"))
+        self._exec(interp, _COLLECT, {"out": memoryview(out)})
+        return pickle.loads(out)
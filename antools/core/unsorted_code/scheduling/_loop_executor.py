@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+LOOP EXECUTOR CLASS
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+
+
+class LoopExecutor(concurrent.futures.Executor):
+    """Executor running coroutine functions on asyncio event loop in its own thread.
+    Submitted coroutine functions are awaited on the loop, plain functions are called in the loop thread
+    (and block it) and their awaitable results are awaited.
+
+    ...
+
+    Attributes
+    ----------
+    max_workers : int
+        Max number of tasks awaited at once.
+    _loop : asyncio.AbstractEventLoop
+        Event loop running in _thread.
+
+    Methods
+    -------
+    __init__(self, max_workers:int=None)
+        Class constructor.
+    submit(self, fn, *args, **kwargs)
+        Schedule fn(*args, **kwargs) on the loop, returns concurrent.futures.Future.
+    shutdown(self, wait:bool=True, cancel_futures:bool=False)
+        Stop the loop and its thread.
+    """
+
+    def __init__(self, max_workers: int = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Max number of tasks awaited at once (default is None -> no limit).
+        """
+
+        self.max_workers = max_workers
+        self._futures = set()
+        self._shutdown = False
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="LoopExecutor", daemon=True
+        )
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"LoopExecutor(max_workers={self.max_workers}, running={len(self._futures)})"
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        """Schedule fn(*args, **kwargs) on the loop, returns concurrent.futures.Future."""
+
+        if self._shutdown:
+            raise RuntimeError("Cannot submit to LoopExecutor after shutdown!")
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(fn, args, kwargs), self._loop
+        )
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop the loop and its thread.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Wait until submitted tasks are finished (default is True).
+        cancel_futures : bool, optional
+            Cancel submitted tasks (default is False).
+        """
+
+        if self._shutdown:
+            return
+        self._shutdown = True
+
+        if cancel_futures:
+            for future in list(self._futures):
+                future.cancel()
+        if wait:
+            concurrent.futures.wait(list(self._futures))
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait:
+            self._thread.join()
+            self._loop.close()
+
+    async def _run(self, fn, args: tuple, kwargs: dict) -> object:
+        """Run fn on the loop, limited by semaphore."""
+
+        if self._semaphore is None:
+            return await self._call(fn, args, kwargs)
+        async with self._semaphore:
+            return await self._call(fn, args, kwargs)
+
+    @staticmethod
+    async def _call(fn, args: tuple, kwargs: dict) -> object:
+        """Call fn and await its result if it is awaitable."""
+
+        result = fn(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+NODE CACHE CLASS
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+
+def _hash_code(code: object, digest: object):
+    """Add bytecode, constants and names of code object (and nested ones) to digest."""
+
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(const, digest)
+        elif isinstance(const, frozenset):
+            # order of set items depends on hash seed
+            digest.update(repr(sorted(const, key=repr)).encode())
+        else:
+            digest.update(repr(const).encode())
+
+
+class CachedResult:
+    """Result of schedule node loaded from NodeCache, same interface as process results."""
+
+    __slots__ = ("status", "error", "data")
+
+    def __init__(self, data):
+        """Class constructor."""
+        self.status = "OK"
+        self.error = None
+        self.data = data
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"CachedResult(status={self.status})"
+
+
+class NodeCache:
+    """Content-addressed disk cache of schedule node results.
+    Key of node is hash of its function bytecode, its config and hashes of its upstream results,
+    so unchanged node with unchanged inputs is not run again. Least recently used results are
+    evicted when cache exceeds max_size.
+
+    ...
+
+    Attributes
+    ----------
+    folder : str
+        Folder where results are stored.
+    max_size : int
+        Max size of stored results in bytes.
+    hits : int
+        Number of nodes loaded from cache.
+    misses : int
+        Number of nodes which had to be run.
+
+    Methods
+    -------
+    __init__(self, folder:str=None, max_size:int=1024**3)
+        Class constructor.
+    node_key(self, func, upstream_hashes:list, config=None)
+        Returns key of node.
+    get(self, key:str)
+        Returns (CachedResult, result hash) or (None, None).
+    put(self, key:str, data)
+        Stores node result, returns its hash.
+    schedule_node_key(self, func, dependencies:list, run_processes:dict, node_keys:dict, result_hashes:dict)
+        Returns key of schedule node, stores results of its finished dependencies.
+    put_finished(self, run_processes:dict, node_keys:dict, result_hashes:dict)
+        Stores results of all finished schedule nodes.
+    clear(self)
+        Removes all stored results.
+
+    Examples
+    -------
+    antools/scheduling/_examples/_example_node_cache.py
+    """
+
+    _SUFFIX = ".pkl"
+
+    def __init__(self, folder: str = None, max_size: int = 1024**3):
+        """Class constructor.
+
+        Parameters
+        ----------
+        folder : str, optional
+            Folder where results are stored (default is None -> <TEMP>/antools_node_cache).
+        max_size : int, optional
+            Max size of stored results in bytes (default is 1 GB).
+        """
+
+        self.folder = (
+            os.path.join(tempfile.gettempdir(), "antools_node_cache")
+            if folder is None
+            else folder
+        )
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.folder, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"NodeCache(folder={self.folder}, max_size={self.max_size}, hits={self.hits}, misses={self.misses})"
+
+    def node_key(self, func, upstream_hashes: list, config=None) -> str:
+        """Returns key of node.
+
+        Parameters
+        ----------
+        func
+            Function of the node, functools.partial arguments are part of its config.
+        upstream_hashes : list
+            Hashes of results of dependencies in order of dependencies.
+        config : optional
+            Any other picklable settings of the node (default is None).
+
+        Returns
+        ----------
+        Hex digest
+        """
+
+        digest = hashlib.sha256()
+        while isinstance(func, functools.partial):
+            digest.update(pickle.dumps((func.args, func.keywords)))
+            func = func.func
+        digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+        _hash_code(func.__code__, digest)
+        digest.update(pickle.dumps(config))
+        for upstream_hash in upstream_hashes:
+            digest.update(upstream_hash.encode())
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> tuple:
+        """Returns (CachedResult, result hash) or (None, None) if key is not stored.
+
+        Parameters
+        ----------
+        key : str
+            Key of node, see node_key().
+
+        Returns
+        ----------
+        Tuple
+        """
+
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as file:
+                payload = file.read()
+            # mark as recently used
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None, None
+
+        self.hits += 1
+        return CachedResult(pickle.loads(payload)), hashlib.sha256(payload).hexdigest()
+
+    def put(self, key: str, data) -> str:
+        """Stores node result, returns its hash.
+
+        Parameters
+        ----------
+        key : str
+            Key of node, see node_key().
+        data
+            Picklable result data of node.
+
+        Returns
+        ----------
+        Hex digest of result, None if data cannot be pickled
+        """
+
+        try:
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        path = self._get_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(payload)
+        os.replace(tmp_path, path)
+        self._evict()
+
+        return hashlib.sha256(payload).hexdigest()
+
+    def schedule_node_key(
+        self,
+        func,
+        dependencies: list,
+        run_processes: dict,
+        node_keys: dict,
+        result_hashes: dict,
+    ) -> str:
+        """Returns key of schedule node, stores results of its finished dependencies.
+
+        Parameters
+        ----------
+        func
+            Function of the node.
+        dependencies : list
+            Finished dependencies of the node.
+        run_processes : dict
+            Function -> future with its result.
+        node_keys : dict
+            Function -> key of node, None if node cannot be cached.
+        result_hashes : dict
+            Function -> hash of its stored result, filled by this method.
+
+        Returns
+        ----------
+        Key of node, None if any dependency failed or cannot be cached
+        """
+
+        upstream_hashes = []
+        for dependency in dependencies:
+            if dependency not in result_hashes:
+                result = run_processes[dependency].result()
+                if result.status != "OK" or node_keys.get(dependency) is None:
+                    return None
+                result_hashes[dependency] = self.put(node_keys[dependency], result.data)
+            if result_hashes[dependency] is None:
+                return None
+            upstream_hashes.append(result_hashes[dependency])
+
+        return self.node_key(func, upstream_hashes)
+
+    def put_finished(self, run_processes: dict, node_keys: dict, result_hashes: dict):
+        """Stores results of all finished schedule nodes which are not stored yet.
+
+        Parameters
+        ----------
+        run_processes : dict
+            Function -> future with its result.
+        node_keys : dict
+            Function -> key of node, None if node cannot be cached.
+        result_hashes : dict
+            Function -> hash of its stored result.
+        """
+
+        for func, process in run_processes.items():
+            if func in result_hashes or node_keys.get(func) is None:
+                continue
+            if process.done() and process.exception() is None:
+                result = process.result()
+                if result.status == "OK":
+                    result_hashes[func] = self.put(node_keys[func], result.data)
+
+    def clear(self):
+        """Removes all stored results."""
+        with self._lock:
+            for entry in os.scandir(self.folder):
+                if entry.name.endswith(self._SUFFIX):
+                    os.remove(entry.path)
+
+    def _get_path(self, key: str) -> str:
+        """Returns path of stored result."""
+        return os.path.join(self.folder, key + self._SUFFIX)
+
+    def _evict(self):
+        """Removes least recently used results until cache fits max_size."""
+
+        with self._lock:
+            entries = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(self.folder)
+                if entry.name.endswith(self._SUFFIX)
+            ]
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= self.max_size:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total_size -= size
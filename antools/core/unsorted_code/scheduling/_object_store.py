@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+OBJECT STORE CLASS
+"""
+
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+import uuid
+from multiprocessing import resource_tracker, shared_memory
+
+# objects of in-process refs, by key
+_local = {}
+# shared memory segments and mapped files opened in current process, by key
+_opened = {}
+
+# buffers of pickled object are aligned for fast NumPy access
+_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> object:
+    """Open shared memory segment, it is freed only by ObjectStore.release()."""
+    try:
+        return shared_memory.SharedMemory(
+            name=name, create=create, size=size, track=False
+        )
+    except TypeError:
+        # Python < 3.13 has no track argument, segment is registered in shared resource tracker
+        return shared_memory.SharedMemory(name=name, create=create, size=size)
+
+
+class ObjectRef:
+    """Handle to object in ObjectStore, small to pickle and valid in every process of the machine
+    (in-process refs only in the process which created them).
+
+    ...
+
+    Attributes
+    ----------
+    key : str
+        Name of shared memory segment, file or in-process object.
+    backend : str
+        Where object is stored. Options are ["local", "shm", "disk"].
+    size : int
+        Size of stored object in bytes (0 for in-process objects).
+    released : bool
+        True when object was freed by store.
+
+    Methods
+    -------
+    get(self)
+        Returns stored object, NumPy arrays are read-only views of the stored buffers.
+    """
+
+    __slots__ = ("key", "backend", "size", "path", "released")
+
+    def __init__(self, key: str, backend: str, size: int = 0, path: str = None):
+        self.key = key
+        self.backend = backend
+        self.size = size
+        self.path = path
+        self.released = False
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        state = ", released" if self.released else ""
+        return f"ObjectRef(key={self.key}, backend={self.backend}, size={self.size}{state})"
+
+    def __getstate__(self) -> tuple:
+        return self.key, self.backend, self.size, self.path
+
+    def __setstate__(self, state: tuple):
+        self.key, self.backend, self.size, self.path = state
+        self.released = False
+
+    def get(self) -> object:
+        """Returns stored object, NumPy arrays are read-only views of the stored buffers."""
+
+        if self.released:
+            raise RuntimeError(f"{self} was already released!")
+        if self.backend == "local":
+            return _local[self.key]
+
+        if self.key not in _opened:
+            if self.backend == "shm":
+                _opened[self.key] = _open_segment(self.key)
+            else:
+                with open(self.path, "rb") as file:
+                    _opened[self.key] = mmap.mmap(
+                        file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+
+        opened = _opened[self.key]
+        buffer = opened.buf if self.backend == "shm" else opened
+        return _loads(memoryview(buffer)[: self.size].toreadonly())
+
+
+def _dumps(obj: object) -> tuple:
+    """Pickle object with out-of-band buffers, returns (size, write function)."""
+
+    buffers = []
+    main = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+
+    header_size = 8 * (2 + 2 * len(raws))
+    offsets = []
+    offset = _align(header_size + len(main))
+    for raw in raws:
+        offsets.append(offset)
+        offset = _align(offset + raw.nbytes)
+    size = max(offset, 1)
+
+    def write(target: memoryview):
+        header = [len(raws), len(main)]
+        for start, raw in zip(offsets, raws):
+            header += [start, raw.nbytes]
+        target[:header_size] = struct.pack(f"<{len(header)}Q", *header)
+        target[header_size : header_size + len(main)] = main
+        for start, raw in zip(offsets, raws):
+            target[start : start + raw.nbytes] = raw.cast("B")
+
+    return size, write
+
+
+def _loads(source: memoryview) -> object:
+    """Unpickle object written by _dumps, buffers are not copied."""
+
+    n_buffers, main_size = struct.unpack_from("<2Q", source)
+    header = struct.unpack_from(f"<{2 * n_buffers}Q", source, 16)
+    header_size = 8 * (2 + 2 * n_buffers)
+    buffers = [
+        source[start : start + length]
+        for start, length in zip(header[::2], header[1::2])
+    ]
+    return pickle.loads(source[header_size : header_size + main_size], buffers=buffers)
+
+
+class ObjectStore:
+    """Reference counted store of large intermediate results of schedules.
+    Process nodes put their results to shared memory or local disk and return only ObjectRef,
+    so results do not cross process boundary through main process. Results of thread and asyncio
+    nodes are kept in main process. Result is released as soon as its last consumer finishes.
+
+    ...
+
+    Attributes
+    ----------
+    backend : str
+        Storage of objects put from any process. Options are ["shm", "disk"].
+    folder : str
+        Folder with stored files for "disk" backend.
+
+    Methods
+    -------
+    __init__(self, backend:str="shm", folder:str=None)
+        Class constructor.
+    put(self, obj)
+        Store object, returns ObjectRef valid in all processes.
+    put_local(self, obj)
+        Keep object in current process, returns ObjectRef.
+    release(self, ref:ObjectRef)
+        Free stored object.
+    close(self)
+        Remove folder of "disk" backend.
+
+    Examples
+    -------
+    antools/scheduling/_examples/_example_object_store.py
+    """
+
+    BACKEND_OPTIONS = ["shm", "disk"]
+
+    def __init__(self, backend: str = "shm", folder: str = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        backend : str, optional
+            Storage of objects put from any process (default is "shm"). Options are ["shm", "disk"].
+        folder : str, optional
+            Folder for "disk" backend (default is None -> new temporary folder).
+        """
+
+        if backend not in self.BACKEND_OPTIONS:
+            raise ValueError(
+                f"Backend <{backend}> is not valid! It must be in {self.BACKEND_OPTIONS}!"
+            )
+
+        self.backend = backend
+        self.folder = None
+        if backend == "shm":
+            # workers started later share tracker of main process and do not free segments on exit
+            resource_tracker.ensure_running()
+        if backend == "disk":
+            self.folder = (
+                tempfile.mkdtemp(prefix="antools_store_") if folder is None else folder
+            )
+            os.makedirs(self.folder, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"ObjectStore(backend={self.backend}, folder={self.folder})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def put(self, obj: object) -> ObjectRef:
+        """Store object, returns ObjectRef valid in all processes.
+
+        Parameters
+        ----------
+        obj : object
+            Picklable object.
+
+        Returns
+        ----------
+        ObjectRef
+        """
+
+        size, write = _dumps(obj)
+        key = f"antools_{uuid.uuid4().hex[:16]}"
+
+        if self.backend == "shm":
+            segment = _open_segment(key, create=True, size=size)
+            try:
+                write(segment.buf)
+            finally:
+                segment.close()
+            return ObjectRef(key, "shm", size)
+
+        path = os.path.join(self.folder, key)
+        with open(path, "wb") as file:
+            file.truncate(size)
+        with open(path, "r+b") as file:
+            with mmap.mmap(file.fileno(), size) as mapped:
+                write(memoryview(mapped))
+        return ObjectRef(key, "disk", size, path)
+
+    def put_local(self, obj: object) -> ObjectRef:
+        """Keep object in current process, nothing is copied, returns ObjectRef.
+
+        Parameters
+        ----------
+        obj : object
+            Any object.
+
+        Returns
+        ----------
+        ObjectRef
+        """
+        key = f"local_{uuid.uuid4().hex[:16]}"
+        _local[key] = obj
+        return ObjectRef(key, "local")
+
+    def release(self, ref: ObjectRef):
+        """Free stored object, views already returned by get() stay valid in their process.
+
+        Parameters
+        ----------
+        ref : ObjectRef
+            Handle of object.
+        """
+
+        if ref.released:
+            return
+        ref.released = True
+
+        if ref.backend == "local":
+            _local.pop(ref.key, None)
+            return
+
+        opened = _opened.pop(ref.key, None)
+        if opened is not None:
+            try:
+                opened.close()
+            except BufferError:
+                # views of the object are still used, memory is freed with them
+                pass
+
+        try:
+            if ref.backend == "shm":
+                segment = _open_segment(ref.key)
+                segment.close()
+                segment.unlink()
+            else:
+                os.remove(ref.path)
+        except OSError:
+            # already removed, or file still mapped on Windows and removed by close()
+            pass
+
+    def close(self):
+        """Remove folder of "disk" backend."""
+        if self.folder is not None:
+            shutil.rmtree(self.folder, ignore_errors=True)
+
+    @staticmethod
+    def run_node(store: "ObjectStore", func, lock: object, logger: object, data: dict):
+        """Run schedule node in worker process and put its result data to store."""
+
+        result = func(lock, logger, data)
+        if result.data is not None and not isinstance(result.data, ObjectRef):
+            result.data = store.put(result.data)
+        return result
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+PARTITIONER
+"""
+
+from collections.abc import Sequence
+
+
+def as_sequence(args) -> object:
+    """Returns args as sliceable sequence with known length.
+
+    Lists, tuples, ranges, strings, bytes, memoryviews, NumPy arrays and pandas objects
+    are returned untouched. Any other iterable is materialized into a list once.
+
+    Parameters
+    ----------
+    args
+        Data which should be processed.
+
+    Returns
+    ----------
+    Sliceable sequence
+    """
+
+    if isinstance(args, (list, tuple, range, str, bytes, bytearray, memoryview)):
+        return args
+    # NumPy arrays (and array-likes with the same protocol) slice into views
+    if hasattr(args, "__array_interface__") and hasattr(args, "__getitem__"):
+        return args
+    # pandas objects slice by position through iloc
+    if hasattr(args, "iloc"):
+        return args
+    if isinstance(args, Sequence):
+        return args
+    return list(args)
+
+
+def partition(args, bounds: list) -> list:
+    """Splits args into chunks by bounds without copying items or changing their types.
+
+    Every type gets its fastest slicing path:
+    range -> range (no items are created), NumPy array -> view (zero-copy),
+    memoryview -> memoryview (zero-copy), pandas object -> iloc slice,
+    list/tuple/str/bytes -> native slice (items are shared, not copied).
+
+    Parameters
+    ----------
+    args
+        Sliceable sequence, see as_sequence().
+    bounds : list
+        List of (start, stop) tuples, see get_chunk_bounds().
+
+    Returns
+    ----------
+    List of chunks in order of bounds
+    """
+
+    if hasattr(args, "iloc"):
+        iloc = args.iloc
+        return [iloc[start:stop] for start, stop in bounds]
+
+    try:
+        return [args[start:stop] for start, stop in bounds]
+    except TypeError:
+        # sequence without slicing support
+        return [[args[i] for i in range(start, stop)] for start, stop in bounds]
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+PROCESS POOL CLASS
+"""
+
+import concurrent.futures
+import multiprocessing as mp
+import os
+import signal
+
+
+def _register_worker(pids: object, initializer, initargs: tuple):
+    """Pool initializer, reports pid of worker and runs initializer of the pool."""
+    pids.put(os.getpid())
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class ProcessPool(concurrent.futures.ProcessPoolExecutor):
+    """ProcessPoolExecutor which can kill its workers, e.g. when schedule is cancelled.
+    Workers report their pids from initializer, so no private attribute of the pool is needed.
+
+    ...
+
+    Methods
+    -------
+    __init__(self, max_workers:int=None, mp_context:object=None, initializer=None, initargs:tuple=(), **kwargs)
+        Class constructor.
+    terminate_workers(self)
+        Kill all worker processes, their running tasks fail with BrokenProcessPool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        mp_context: object = None,
+        initializer=None,
+        initargs: tuple = (),
+        **kwargs,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of worker processes (default is None -> os.cpu_count()).
+        mp_context : object, optional
+            Multiprocessing context (default is None -> mp.get_context()).
+        initializer : optional
+            Function called as initializer(*initargs) in every worker (default is None).
+        initargs : tuple, optional
+            Arguments of initializer (default is ()).
+        kwargs
+            Other arguments of ProcessPoolExecutor.
+        """
+
+        mp_context = mp.get_context() if mp_context is None else mp_context
+        self._pids = set()
+        self._pid_queue = mp_context.SimpleQueue()
+        super().__init__(
+            max_workers,
+            mp_context=mp_context,
+            initializer=_register_worker,
+            initargs=(self._pid_queue, initializer, tuple(initargs)),
+            **kwargs,
+        )
+
+    def terminate_workers(self):
+        """Kill all worker processes, their running tasks fail with BrokenProcessPool."""
+
+        while not self._pid_queue.empty():
+            self._pids.add(self._pid_queue.get())
+        for pid in self._pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                # worker has already exited
+                pass
+        self._pids.clear()
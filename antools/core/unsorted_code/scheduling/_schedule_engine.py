@@ -0,0 +1,588 @@
+# -*- coding: utf-8 -*-
+"""
+SCHEDULE ENGINE
+"""
+
+import concurrent.futures
+import math
+import os
+import time
+
+from antools.scheduling import Cancelled, CancelToken, ObjectRef, ObjectStore
+
+EXECUTOR_OPTIONS = ["thread", "process", "asyncio"]
+RESOURCE_OPTIONS = ["cpus", "memory"]
+ON_ERROR_OPTIONS = ["continue", "fail_branch", "fail_fast"]
+
+
+def get_total_memory() -> int:
+    """Returns physical memory of the machine in bytes, None if it cannot be found."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        try:
+            import psutil
+
+            return psutil.virtual_memory().total
+        except ImportError:
+            return None
+
+
+def node(executor: str = None, cpus: float = 1, memory: int = 0):
+    """Decorator declaring how function runs as node of schedule.
+
+    Parameters
+    ----------
+    executor : str, optional
+        Executor of the node (default is None -> default executor of handler). Options are [None, "thread", "process", "asyncio"].
+        "asyncio" nodes must be coroutine functions, "process" nodes must be importable.
+    cpus : float, optional
+        CPUs reserved for the node while it runs (default is 1). Use 0 for nodes waiting on I/O.
+    memory : int, optional
+        Bytes of memory reserved for the node while it runs (default is 0).
+
+    Returns
+    ----------
+    Decorator which returns the same function with node options set
+    """
+
+    if executor not in [None] + EXECUTOR_OPTIONS:
+        raise ValueError(
+            f"Executor <{executor}> is not valid! It must be in {[None] + EXECUTOR_OPTIONS}!"
+        )
+
+    if cpus < 0 or memory < 0:
+        raise ValueError(
+            f"Resources cpus <{cpus}> and memory <{memory}> must not be negative!"
+        )
+
+    def decorator(func):
+        func.__antools_node__ = {"executor": executor, "cpus": cpus, "memory": memory}
+        return func
+
+    return decorator
+
+
+class _CancelledResult:
+    """Result of node which was skipped or stopped by cancellation."""
+
+    status = "CANCELLED"
+    data = None
+
+    def __init__(self, error: str):
+        self.error = error
+
+
+class ScheduleEngine:
+    """Schedule loop shared by MultiProcessHandler and ThreadHandler.
+    Every node runs on executor declared by node() decorator, executors are created on first use.
+    Results stay in main process, so dependency data of thread and asyncio nodes is never pickled,
+    only process nodes receive pickled copies. Ready nodes are started only while their declared cpus
+    and memory fit into free capacity, bigger nodes first. With ObjectStore, process nodes put results to shared memory
+    or disk and every node gets ObjectRef handles of its upstream results, freed after their last consumer.
+    Nodes can check CancelToken of the run by get_cancel_token(). When the run is cancelled (failure with "fail_fast",
+    deadline or token cancelled by user), waiting nodes are skipped, queued nodes are cancelled, workers of process
+    nodes are terminated and thread nodes are awaited, they should stop on their token.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Name of schedule in logs, e.g. "multiprocessing".
+    default_executor : str
+        Executor of nodes without node() decorator.
+    _logger : object
+        Logger class.
+    _factories : dict
+        Executor name -> function returning new executor.
+    _locks : dict
+        Executor name -> lock passed to its nodes.
+
+    Methods
+    -------
+    __init__(self, logger:object, factories:dict, locks:dict, default_executor:str, name:str)
+        Class constructor.
+    run(self, schedule:dict, max_workers:int, cache:NodeCache=None, telemetry:Telemetry=None, prepare=None, store:ObjectStore=None,
+        resources:dict=None, on_error:str="continue", deadline:float=None, token:CancelToken=None)
+        Run schedule, returns dictionary with results.
+    """
+
+    def __init__(
+        self,
+        logger: object,
+        factories: dict,
+        locks: dict,
+        default_executor: str,
+        name: str,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        logger : object
+            Logger class.
+        factories : dict
+            Executor name -> function returning new executor.
+        locks : dict
+            Executor name -> lock passed to its nodes.
+        default_executor : str
+            Executor of nodes without node() decorator.
+        name : str
+            Name of schedule in logs.
+        """
+
+        self._logger = logger
+        self._factories = factories
+        self._locks = locks
+        self.default_executor = default_executor
+        self.name = name
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"ScheduleEngine(name={self.name}, executors={list(self._factories)}, default_executor={self.default_executor})"
+
+    def executor_of(self, func) -> str:
+        """Returns executor name of schedule node."""
+
+        executor = getattr(func, "__antools_node__", {}).get("executor")
+        executor = self.default_executor if executor is None else executor
+        if executor not in self._factories:
+            raise ValueError(
+                f"Executor <{executor}> of function <{func.__name__}> is not available! It must be in {list(self._factories)}!"
+            )
+        return executor
+
+    @staticmethod
+    def requirements_of(func) -> dict:
+        """Returns cpus and memory declared by schedule node."""
+        options = getattr(func, "__antools_node__", {})
+        return {"cpus": options.get("cpus", 1), "memory": options.get("memory", 0)}
+
+    def run(
+        self,
+        schedule: dict,
+        max_workers: int,
+        cache: object = None,
+        telemetry: object = None,
+        prepare=None,
+        store: ObjectStore = None,
+        resources: dict = None,
+        on_error: str = "continue",
+        deadline: float = None,
+        token: CancelToken = None,
+    ) -> dict:
+        """Run schedule, returns dictionary with results.
+
+        Parameters
+        ----------
+        schedule : dict
+            Key -> function, called as func(lock, logger, data), data is dictionary dependency name -> its data
+            Value -> list of dependent functions or directly dependent function
+        max_workers : int
+            Max workers of every executor (used in logs).
+        cache : NodeCache, optional
+            If set, node with unchanged code and unchanged dependency results is loaded from cache (default is None).
+        telemetry : Telemetry, optional
+            If set, timings of thread and process nodes are recorded to it (default is None).
+        prepare : callable, optional
+            prepare(dependency, data, executor) -> data passed to node, e.g. to place data
+            to shared memory for process nodes (default is None). Not used with store.
+        store : ObjectStore, optional
+            If set, nodes get dictionary dependency name -> ObjectRef instead of dependency data
+            and results are released after their last consumer finishes (default is None).
+            Cannot be combined with cache.
+        resources : dict, optional
+            Capacity of the machine, e.g. {"cpus": 8, "memory": 16 * 1024**3}
+            (default is None -> cpus is max_workers, memory is physical memory).
+        on_error : str, optional
+            What happens when node fails (default is "continue"). Options are ["continue", "fail_branch", "fail_fast"].
+            "continue" -> dependent nodes still run, "fail_branch" -> dependent nodes are skipped, other branches run,
+            "fail_fast" -> whole run is cancelled. Skipped and cancelled nodes have status "CANCELLED".
+        deadline : float, optional
+            Seconds for the whole run, then it is cancelled (default is None -> no limit).
+        token : CancelToken, optional
+            Token to cancel the run from outside, e.g. from other thread (default is None -> no outside cancellation).
+            It is only watched, nodes get token of the run, so deadline of the run does not change it.
+
+        Returns
+        ----------
+        Dictionary with results
+        """
+
+        waiting_processes = {}
+        run_processes = {}
+        node_keys = {}
+        result_hashes = {}
+        executors = {}
+        refs = {}
+        consumed = set()
+
+        if store is not None and cache is not None:
+            raise ValueError("ObjectStore cannot be combined with NodeCache!")
+        if on_error not in ON_ERROR_OPTIONS:
+            raise ValueError(
+                f"On error <{on_error}> is not valid! It must be in {ON_ERROR_OPTIONS}!"
+            )
+
+        # nodes check token of the run, token of user is only watched and never changed
+        user_token = token
+        token = CancelToken()
+        deadlines = [
+            time.time() + deadline if deadline is not None else None,
+            None if user_token is None else user_token.deadline,
+        ]
+        if any(deadlines):
+            token.deadline = min(d for d in deadlines if d is not None)
+        failed = set()
+        checked = set()
+        cancel_reason = None
+
+        for func, dependencies in schedule.items():
+            dependencies = [] if dependencies is None else dependencies
+            dependencies = (
+                [dependencies] if not isinstance(dependencies, list) else dependencies
+            )
+            waiting_processes[func] = dependencies
+
+        kinds = {func: self.executor_of(func) for func in waiting_processes}
+
+        # capacity is never oversubscribed, node bigger than capacity could never run
+        capacity = {"cpus": max_workers, "memory": get_total_memory()}
+        capacity.update(resources or {})
+        for name in capacity:
+            if name not in RESOURCE_OPTIONS:
+                raise ValueError(
+                    f"Resource <{name}> is not valid! It must be in {RESOURCE_OPTIONS}!"
+                )
+        requirements = {func: self.requirements_of(func) for func in waiting_processes}
+        for func, required in requirements.items():
+            for name, value in required.items():
+                if capacity[name] is not None and value > capacity[name]:
+                    raise ValueError(
+                        f"Function <{func.__name__}> requires {name}={value}, but capacity is {capacity[name]}!"
+                    )
+        reserved = {}
+        cache_checked = set()
+
+        def fits(required: dict) -> bool:
+            # free capacity is summed again, running += and -= of floats would drift below capacity
+            return all(
+                capacity[name] is None
+                or required[name]
+                <= capacity[name] - math.fsum(r[name] for r in reserved.values())
+                for name in capacity
+            )
+
+        def reserve(func):
+            reserved[func] = requirements[func]
+
+        def free_finished():
+            for func in [func for func in reserved if run_processes[func].done()]:
+                reserved.pop(func)
+
+        dependencies_of = dict(waiting_processes)
+        consumers = {func: 0 for func in waiting_processes}
+        for dependencies in dependencies_of.values():
+            for dependency in dependencies:
+                if dependency in consumers:
+                    consumers[dependency] += 1
+
+        def upstream(dependency, kind: str) -> object:
+            """Returns data or ObjectRef of finished dependency passed to node of kind."""
+
+            value = run_processes[dependency].result().data
+            if store is None:
+                return value if prepare is None else prepare(dependency, value, kind)
+            if isinstance(value, ObjectRef):
+                return value
+
+            # result of thread or asyncio node is copied to store only for process nodes
+            shared = kind == "process"
+            if (dependency, shared) not in refs:
+                refs[(dependency, shared)] = (
+                    store.put(value) if shared else store.put_local(value)
+                )
+            return refs[(dependency, shared)]
+
+        def release(func):
+            """Release stored result of node."""
+
+            process = run_processes.get(func)
+            if (
+                process is not None
+                and process.done()
+                and not process.cancelled()
+                and process.exception() is None
+            ):
+                value = process.result().data
+                if isinstance(value, ObjectRef):
+                    store.release(value)
+            for shared in (False, True):
+                if (func, shared) in refs:
+                    store.release(refs.pop((func, shared)))
+
+        def release_consumed():
+            """Release results whose consumers are all finished."""
+
+            for func, process in run_processes.items():
+                if func in consumed or not process.done():
+                    continue
+                consumed.add(func)
+                for dependency in dependencies_of[func]:
+                    consumers[dependency] -= 1
+                    if consumers[dependency] == 0:
+                        release(dependency)
+
+        def skip(func, reason: str):
+            """Mark waiting node as cancelled, it is never run."""
+            p = concurrent.futures.Future()
+            p.set_result(_CancelledResult(reason))
+            run_processes[func] = p
+            del waiting_processes[func]
+            checked.add(func)
+            failed.add(func)
+
+        def find_failed():
+            for func, process in run_processes.items():
+                if func in checked or not process.done():
+                    continue
+                checked.add(func)
+                if (
+                    process.cancelled()
+                    or process.exception() is not None
+                    or process.result().status != "OK"
+                ):
+                    failed.add(func)
+
+        def get_cancel_reason() -> str:
+            if user_token is not None and user_token.cancelled:
+                if user_token.reason is not None:
+                    return user_token.reason
+                if user_token.remaining() == 0:
+                    return "Deadline of token exceeded"
+                return "Cancelled by user"
+            if token.cancelled:
+                if token.reason is not None:
+                    return token.reason
+                if deadline is not None and token.remaining() == 0:
+                    return f"Deadline of {deadline} seconds exceeded"
+                return "Cancelled by node"
+            if on_error == "fail_fast" and failed:
+                name = next(func.__name__ for func in run_processes if func in failed)
+                return f"Function <{name}> failed"
+            return None
+
+        def cancel_all(reason: str):
+            """Skip waiting nodes, cancel queued nodes and stop workers of running process nodes."""
+            token.cancel(reason)
+            for func in list(waiting_processes):
+                skip(func, reason)
+            for process in run_processes.values():
+                process.cancel()
+            if "process" in executors:
+                self._terminate_workers(executors["process"])
+
+        self._logger.info(
+            f"Starting {self.name} schedule with {max_workers} workers, capacity {capacity} ..."
+        )
+
+        try:
+            while True:
+                if store is not None:
+                    release_consumed()
+                free_finished()
+
+                find_failed()
+                if cancel_reason is None:
+                    cancel_reason = get_cancel_reason()
+                    if cancel_reason is not None:
+                        self._logger.error(
+                            f"{self.name.capitalize()} schedule is cancelled due to <{cancel_reason}>!",
+                            terminate=False,
+                        )
+                        cancel_all(cancel_reason)
+
+                # nodes downstream of failed nodes are skipped, skipped nodes fail their own downstream
+                if on_error == "fail_branch":
+                    skipped = True
+                    while skipped:
+                        skipped = False
+                        for func, dependencies in list(waiting_processes.items()):
+                            for dependency in dependencies:
+                                if dependency in failed:
+                                    skip(
+                                        func,
+                                        f"Upstream function <{dependency.__name__}> failed",
+                                    )
+                                    skipped = True
+                                    break
+
+                # the biggest nodes are packed first, so they are not starved by small ones
+                ready = sorted(
+                    (
+                        func
+                        for func, dependencies in waiting_processes.items()
+                        if all(
+                            dependency in run_processes
+                            and run_processes[dependency].done()
+                            for dependency in dependencies
+                        )
+                    ),
+                    key=lambda func: (
+                        requirements[func]["memory"],
+                        requirements[func]["cpus"],
+                    ),
+                    reverse=True,
+                )
+
+                started = False
+                for func in ready:
+                    dependencies = waiting_processes[func]
+
+                    # if all dependencies are finished, load it from cache or run it
+                    if cache is not None and func not in cache_checked:
+                        cache_checked.add(func)
+                        node_keys[func] = cache.schedule_node_key(
+                            func, dependencies, run_processes, node_keys, result_hashes
+                        )
+                        if node_keys[func] is not None:
+                            cached, result_hash = cache.get(node_keys[func])
+                            if cached is not None:
+                                p = concurrent.futures.Future()
+                                p.set_result(cached)
+                                run_processes[func] = p
+                                result_hashes[func] = result_hash
+                                del waiting_processes[func]
+                                started = True
+                                continue
+
+                    if not fits(requirements[func]):
+                        continue
+                    del waiting_processes[func]
+                    reserve(func)
+
+                    kind = kinds[func]
+                    data = dict()
+                    for dependency in dependencies:
+                        data[dependency.__name__] = upstream(dependency, kind)
+
+                    if kind not in executors:
+                        executors[kind] = self._factories[kind]()
+                    args = (func, self._locks.get(kind), self._logger, data)
+                    if store is not None and kind == "process":
+                        args = (ObjectStore.run_node, store) + args
+                    args = (CancelToken.run_node, token) + args
+                    if telemetry is not None and kind != "asyncio":
+                        p = telemetry.submit(executors[kind], func.__name__, *args)
+                    else:
+                        p = executors[kind].submit(*args)
+                    run_processes[func] = p
+                    started = True
+
+                if started:
+                    continue
+
+                running = [p for p in run_processes.values() if not p.done()]
+                if not running and not waiting_processes:
+                    break
+
+                # if there remains functions dependent on each other, raise Error
+                if not running:
+                    if store is not None:
+                        for func in run_processes:
+                            release(func)
+                    if ready:
+                        # nothing runs, so ready node would never fit
+                        func = ready[0]
+                        self._logger.error(
+                            f"Function <{func.__name__}> requirements {requirements[func]} exceed capacity {capacity}!",
+                            ValueError,
+                        )
+                        return False
+                    self._logger.error(
+                        f"Function dependencies are corrupted! Remaining dependent functions -> {list(waiting_processes)}",
+                        ValueError,
+                    )
+                    return False
+
+                # wake up at deadline, token of user can be cancelled anytime
+                timeout = token.remaining()
+                if user_token is not None:
+                    timeout = 0.1 if timeout is None else min(timeout, 0.1)
+                concurrent.futures.wait(
+                    running,
+                    timeout=timeout,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+
+            # nodes stopped by cancellation get their reason instead of exception
+            for func, process in list(run_processes.items()):
+                if process.cancelled():
+                    error = cancel_reason or "Cancelled"
+                else:
+                    exception = process.exception()
+                    if isinstance(exception, Cancelled):
+                        error = str(exception)
+                    elif cancel_reason is not None and isinstance(
+                        exception, concurrent.futures.BrokenExecutor
+                    ):
+                        error = cancel_reason
+                    else:
+                        continue
+                p = concurrent.futures.Future()
+                p.set_result(_CancelledResult(error))
+                run_processes[func] = p
+
+            if store is not None:
+                release_consumed()
+
+        except BaseException:
+            if store is not None:
+                for func in run_processes:
+                    release(func)
+            raise
+
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+            token.close()
+
+        data = dict()
+        status_list = []
+        for func, process in run_processes.items():
+            value = process.result().data
+            # results without consumers are loaded and released
+            if isinstance(value, ObjectRef) and not value.released:
+                value = value.get()
+            data[func.__name__] = {
+                "status": f"{process.result().status}",
+                "data": f"{value}",
+                "error": f"{process.result().error}",
+            }
+            status_list.append(process.result().status)
+            if store is not None:
+                value = None
+                release(func)
+
+        msg = f"{self.name.capitalize()} schedule is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}, CANCELLED={status_list.count('CANCELLED')}"
+        (
+            self._logger.info(msg)
+            if status_list.count("OK") == len(status_list)
+            else self._logger.error(msg, terminate=False)
+        )
+
+        if cache is not None:
+            cache.put_finished(run_processes, node_keys, result_hashes)
+            self._logger.info(f"Node cache: HIT={cache.hits}, MISS={cache.misses}")
+
+        return data
+
+    @staticmethod
+    def _terminate_workers(executor: object):
+        """Kill worker processes of process pool (ProcessPool), their running nodes are doomed.
+        Other executors only cancel queued nodes."""
+        if hasattr(executor, "terminate_workers"):
+            executor.terminate_workers()
+            return
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,524 @@
+# -*- coding: utf-8 -*-
+"""
+TELEMETRY CLASS
+"""
+
+import concurrent.futures
+import itertools
+import json
+import os
+import pickle
+import statistics
+import threading
+import time
+
+
+class TaskRecord:
+    """Timings of one task, times are seconds since epoch so records of all processes can be compared.
+
+    ...
+
+    Attributes
+    ----------
+    task_id : int
+        Order in which task was submitted.
+    name : str
+        Name of the task (function name).
+    status : str
+        Status of the task. Options are ["OK", "ERROR"].
+    pid : int
+        Id of worker process.
+    tid : int
+        Native id of worker thread.
+    worker : str
+        Readable id of worker, "<pid>:<thread name>".
+    submit_time : float
+        Time when task was submitted.
+    start_time : float
+        Time when worker started to run the task.
+    end_time : float
+        Time when worker finished the task.
+    queue_time : float
+        Seconds the task waited for a free worker, including transfer to the worker.
+    exec_time : float
+        Seconds the function was running.
+    serialize_time : float
+        Seconds executor spent pickling and unpickling args and result (0 in threads).
+    args_size : int
+        Size of pickled args in bytes, only with Telemetry(sizes=True) (None in threads).
+    result_size : int
+        Size of pickled result in bytes, only with Telemetry(sizes=True) (None in threads).
+    """
+
+    __slots__ = (
+        "task_id",
+        "name",
+        "status",
+        "pid",
+        "tid",
+        "worker",
+        "submit_time",
+        "start_time",
+        "end_time",
+        "queue_time",
+        "exec_time",
+        "serialize_time",
+        "args_size",
+        "result_size",
+    )
+
+    def __init__(self, **kwargs):
+        """Class constructor."""
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"TaskRecord(task_id={self.task_id}, name={self.name}, worker={self.worker}, status={self.status}, exec_time={round(self.exec_time, 5)})"
+
+    def as_dict(self) -> dict:
+        """Returns record as dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _LoadStart:
+    """Pickled before function and args, unpickled as time when their unpickling started."""
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return time.time, ()
+
+
+class _DumpEnd:
+    """Pickled after function and args, holds time when their pickling ended."""
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return float, (time.time(),)
+
+
+_LOAD_START = _LoadStart()
+_DUMP_END = _DumpEnd()
+
+
+def _pickled_size(obj: object) -> int:
+    """Size of pickled object in bytes, None if it cannot be pickled."""
+    try:
+        return len(pickle.dumps(obj, protocol=5))
+    except Exception:
+        return None
+
+
+class TracedResult:
+    """Record and result of TracedCall, pickling done by executor is added to its serialize_time."""
+
+    __slots__ = ("record", "result")
+
+    def __init__(self, record: TaskRecord, result: object):
+        self.record = record
+        self.result = result
+
+    def __reduce__(self):
+        return TracedResult._rebuild, (
+            _LOAD_START,
+            self.record,
+            self.result,
+            time.time(),
+            _DUMP_END,
+        )
+
+    @staticmethod
+    def _rebuild(
+        load_start: float,
+        record: TaskRecord,
+        result: object,
+        dump_start: float,
+        dump_end: float,
+    ) -> "TracedResult":
+        record.serialize_time += (dump_end - dump_start) + (time.time() - load_start)
+        return TracedResult(record, result)
+
+
+class TracedCall:
+    """Picklable call of function which measures itself in worker, see Telemetry.wrap().
+    Function and args are pickled only by executor, time of its pickling is taken by markers around them.
+    """
+
+    __slots__ = (
+        "task_id",
+        "name",
+        "submit_time",
+        "fn",
+        "args",
+        "serialize_time",
+        "args_size",
+        "sizes",
+    )
+
+    def __init__(
+        self,
+        task_id: int,
+        name: str,
+        submit_time: float,
+        fn,
+        args: tuple,
+        args_size: int = None,
+        sizes: bool = False,
+    ):
+        self.task_id = task_id
+        self.name = name
+        self.submit_time = submit_time
+        self.fn = fn
+        self.args = args
+        self.serialize_time = 0
+        self.args_size = args_size
+        self.sizes = sizes
+
+    def __reduce__(self):
+        return TracedCall._rebuild, (
+            _LOAD_START,
+            self.task_id,
+            self.name,
+            self.submit_time,
+            self.args_size,
+            self.sizes,
+            time.time(),
+            self.fn,
+            self.args,
+            _DUMP_END,
+        )
+
+    @staticmethod
+    def _rebuild(
+        load_start: float,
+        task_id: int,
+        name: str,
+        submit_time: float,
+        args_size: int,
+        sizes: bool,
+        dump_start: float,
+        fn,
+        args: tuple,
+        dump_end: float,
+    ) -> "TracedCall":
+        call = TracedCall(task_id, name, submit_time, fn, args, args_size, sizes)
+        call.serialize_time = (dump_end - dump_start) + (time.time() - load_start)
+        return call
+
+    def __call__(self) -> TracedResult:
+        """Run the call, returns TracedResult with record and result or error."""
+
+        start = time.time()
+        status = "OK"
+        try:
+            result = self.fn(*self.args)
+        except BaseException as err:
+            status, result = "ERROR", err
+        end = time.time()
+
+        thread = threading.current_thread()
+        record = TaskRecord(
+            task_id=self.task_id,
+            name=self.name,
+            status=status,
+            pid=os.getpid(),
+            tid=threading.get_native_id(),
+            worker=f"{os.getpid()}:{thread.name}",
+            submit_time=self.submit_time,
+            start_time=start,
+            end_time=end,
+            queue_time=start - self.submit_time,
+            exec_time=end - start,
+            serialize_time=self.serialize_time,
+            args_size=self.args_size,
+            result_size=_pickled_size(result) if self.sizes else None,
+        )
+        return TracedResult(record, result)
+
+
+class Telemetry:
+    """Collector of per task timings of MultiProcessHandler and ThreadHandler.
+    Every task records its queue wait, serialization, execution time, result size and worker,
+    records can be exported as Chrome trace (chrome://tracing, Perfetto) or summarized by worker.
+    Serialization time is the pickling done by executor itself, sizes need one more pickling,
+    so they are measured only with sizes=True.
+
+    ...
+
+    Attributes
+    ----------
+    records : list
+        List of TaskRecord in order of finishing.
+    sizes : bool
+        Measure sizes of pickled args and results.
+
+    Methods
+    -------
+    __init__(self, sizes:bool=False)
+        Class constructor.
+    submit(self, executor:object, name:str, fn, *args)
+        Submit traced fn(*args) to executor, returns Future with result of fn.
+    wrap(self, name:str, fn, *args, serialize:bool=True)
+        Returns picklable TracedCall of fn(*args).
+    call(traced_call:TracedCall)
+        Run TracedCall in worker.
+    unwrap(self, traced:TracedResult)
+        Stores record of finished TracedCall, returns its result or raises its error.
+    to_chrome_trace(self, path:str=None)
+        Returns (and writes) Chrome trace-event JSON.
+    summary(self)
+        Returns table with per worker statistics and stragglers.
+    clear(self)
+        Removes all records.
+
+    Examples
+    -------
+    antools/scheduling/_examples/_example_telemetry.py
+    """
+
+    # task slower than STRAGGLER_FACTOR * median of its function is reported as straggler
+    STRAGGLER_FACTOR = 2
+
+    def __init__(self, sizes: bool = False):
+        """Class constructor.
+
+        Parameters
+        ----------
+        sizes : bool, optional
+            Measure sizes of pickled args and results, they are pickled once more outside of measured times (default is False).
+        """
+        self.sizes = sizes
+        self.records = []
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"Telemetry(records={len(self.records)})"
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def wrap(self, name: str, fn, *args, serialize: bool = True) -> TracedCall:
+        """Returns picklable TracedCall of fn(*args).
+
+        Parameters
+        ----------
+        name : str
+            Name of the task.
+        fn
+            Function to be run.
+        args
+            Arguments of the function.
+        serialize : bool, optional
+            Executor pickles function and args, use False for threads, they have no sizes (default is True).
+
+        Returns
+        ----------
+        TracedCall, run it with call() and pass its result to unwrap()
+        """
+
+        sizes = self.sizes and serialize
+        args_size = _pickled_size((fn, args)) if sizes else None
+        return TracedCall(
+            next(self._task_ids), name, time.time(), fn, args, args_size, sizes
+        )
+
+    @staticmethod
+    def call(traced_call: TracedCall) -> TracedResult:
+        """Run TracedCall in worker, used where function with args is expected (e.g. WorkerPool.map).
+
+        Parameters
+        ----------
+        traced_call : TracedCall
+            Call returned by wrap().
+
+        Returns
+        ----------
+        TracedResult to be passed to unwrap()
+        """
+        return traced_call()
+
+    def unwrap(self, traced: TracedResult) -> object:
+        """Stores record of finished TracedCall, returns its result or raises its error.
+
+        Parameters
+        ----------
+        traced : TracedResult
+            Result of TracedCall.
+
+        Returns
+        ----------
+        Result of the function
+        """
+
+        record, result = traced.record, traced.result
+        with self._lock:
+            self.records.append(record)
+
+        if record.status == "ERROR":
+            raise result
+        return result
+
+    def submit(
+        self, executor: object, name: str, fn, *args
+    ) -> concurrent.futures.Future:
+        """Submit traced fn(*args) to executor, returns Future with result of fn.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor
+            Process or thread executor, nothing is pickled for ThreadPoolExecutor.
+        name : str
+            Name of the task.
+        fn
+            Function to be run.
+        args
+            Arguments of the function.
+
+        Returns
+        ----------
+        concurrent.futures.Future
+        """
+
+        serialize = not isinstance(executor, concurrent.futures.ThreadPoolExecutor)
+        inner = executor.submit(
+            Telemetry.call, self.wrap(name, fn, *args, serialize=serialize)
+        )
+        outer = concurrent.futures.Future()
+        outer.set_running_or_notify_cancel()
+
+        def on_done(future: concurrent.futures.Future):
+            try:
+                outer.set_result(self.unwrap(future.result()))
+            except BaseException as err:
+                outer.set_exception(err)
+
+        inner.add_done_callback(on_done)
+        return outer
+
+    def to_chrome_trace(self, path: str = None) -> dict:
+        """Returns Chrome trace-event JSON, one event per task on its worker and one per queue wait.
+
+        Parameters
+        ----------
+        path : str, optional
+            If set, trace is also written to this file (default is None).
+
+        Returns
+        ----------
+        Dictionary with "traceEvents"
+        """
+
+        events = []
+        threads = {}
+        for record in self.records:
+            threads[(record.pid, record.tid)] = record.worker
+            args = record.as_dict()
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.status,
+                    "ph": "X",
+                    "ts": record.start_time * 1e6,
+                    "dur": record.exec_time * 1e6,
+                    "pid": record.pid,
+                    "tid": record.tid,
+                    "args": args,
+                }
+            )
+            events.append(
+                {
+                    "name": f"queue {record.name}",
+                    "cat": "queue",
+                    "ph": "X",
+                    "ts": record.submit_time * 1e6,
+                    "dur": record.queue_time * 1e6,
+                    "pid": 0,
+                    "tid": record.task_id,
+                    "args": {"task_id": record.task_id},
+                }
+            )
+
+        for (pid, tid), worker in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": worker},
+                }
+            )
+        events.append(
+            {"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "queue"}}
+        )
+
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w") as file:
+                json.dump(trace, file)
+
+        return trace
+
+    def summary(self) -> str:
+        """Returns table with per worker statistics and stragglers.
+
+        Returns
+        ----------
+        String table
+        """
+
+        if not self.records:
+            return "No tasks recorded."
+
+        records = list(self.records)
+        begin = min(record.submit_time for record in records)
+        span = max(record.end_time for record in records) - begin
+
+        workers = {}
+        for record in records:
+            workers.setdefault(record.worker, []).append(record)
+
+        header = f"{'WORKER':<28}{'TASKS':>7}{'BUSY[s]':>10}{'IDLE[%]':>9}{'QUEUE[s]':>10}{'SERIAL[s]':>11}{'MAX EXEC[s]':>13}{'RESULT[B]':>11}"
+        lines = [header, "-" * len(header)]
+        for worker, worker_records in sorted(workers.items()):
+            busy = sum(record.exec_time for record in worker_records)
+            idle = 100 * (1 - busy / span) if span else 0
+            sizes = [r.result_size for r in worker_records if r.result_size is not None]
+            result_size = sum(sizes) if sizes else "-"
+            lines.append(
+                f"{worker[:27]:<28}{len(worker_records):>7}{busy:>10.4f}{idle:>9.1f}"
+                f"{sum(record.queue_time for record in worker_records):>10.4f}"
+                f"{sum(record.serialize_time for record in worker_records):>11.4f}"
+                f"{max(record.exec_time for record in worker_records):>13.4f}{result_size:>11}"
+            )
+
+        lines.append("-" * len(header))
+        lines.append(
+            f"TOTAL_RUN={len(records)}, OK={[record.status for record in records].count('OK')}, "
+            f"ERROR={[record.status for record in records].count('ERROR')}, WALL={span:.4f}s, WORKERS={len(workers)}"
+        )
+
+        medians = {}
+        for record in records:
+            medians.setdefault(record.name, []).append(record.exec_time)
+        medians = {name: statistics.median(times) for name, times in medians.items()}
+        stragglers = [
+            record
+            for record in records
+            if record.exec_time > self.STRAGGLER_FACTOR * medians[record.name] > 0
+        ]
+        for record in sorted(stragglers, key=lambda record: -record.exec_time)[:5]:
+            lines.append(
+                f"Straggler: task {record.task_id} <{record.name}> on {record.worker} took {record.exec_time:.4f}s (median {medians[record.name]:.4f}s)"
+            )
+
+        return "\n".join(lines)
+
+    def clear(self):
+        """Removes all records."""
+        with self._lock:
+            self.records = []
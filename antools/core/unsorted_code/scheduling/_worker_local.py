@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+WORKER LOCAL
+"""
+
+import threading
+
+try:
+    import _interpreters
+
+    # thread states of sub-interpreter are not kept between tasks of InterpreterPool,
+    # one sub-interpreter is one worker, so its slots are global
+    _interpreter_slots = (
+        {} if _interpreters.get_current()[0] != _interpreters.get_main()[0] else None
+    )
+except ImportError:
+    _interpreter_slots = None
+
+
+class WorkerLocal(threading.local):
+    """Slots of resources local to one worker, i.e. one thread of thread pool, one process of process pool
+    or one sub-interpreter of InterpreterPool.
+    Expensive resources (file handles, DB connections, parsers) are created once per worker
+    by initializer or on first get() and reused by all tasks of the worker. Slots are freed when the worker exits.
+
+    ...
+
+    Methods
+    -------
+    get(self, name:str, factory=None)
+        Returns resource of current worker, missing resource is created by factory().
+    set(self, name:str, value)
+        Store resource of current worker.
+    clear(self)
+        Remove all resources of current worker.
+
+    Examples
+    -------
+    antools/scheduling/_examples/_example_worker_local.py
+    """
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"WorkerLocal(thread={threading.current_thread().name}, slots={list(self._slots())})"
+
+    def get(self, name: str, factory=None) -> object:
+        """Returns resource of current worker.
+
+        Parameters
+        ----------
+        name : str
+            Name of slot.
+        factory : optional
+            Function without arguments creating missing resource (default is None -> KeyError if missing).
+
+        Returns
+        ----------
+        Resource
+        """
+
+        slots = self._slots()
+        if name not in slots:
+            if factory is None:
+                raise KeyError(
+                    f"Resource <{name}> is not set in worker <{threading.current_thread().name}>!"
+                )
+            slots[name] = factory()
+        return slots[name]
+
+    def set(self, name: str, value: object):
+        """Store resource of current worker.
+
+        Parameters
+        ----------
+        name : str
+            Name of slot.
+        value : object
+            Resource.
+        """
+        self._slots()[name] = value
+
+    def clear(self):
+        """Remove all resources of current worker."""
+        self._slots().clear()
+
+    def _slots(self) -> dict:
+        """Returns slots of current worker."""
+        return self.__dict__ if _interpreter_slots is None else _interpreter_slots
+
+
+# slots shared by initializers and tasks, every thread sees its own
+worker_local = WorkerLocal()
@@ -1,4 +1,5 @@
 from antools.logging._logger_class import _get_thread_logger
 
-from ._thread_handler import ThreadHandler
+from ._limiters import ConcurrencyLimiter, LeakyBucket, TokenBucket
 from ._thread_process_class import ThreadProcess
+from ._thread_handler import ThreadHandler
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+THREADING RESULT COLLECTION BENCHMARK
+
+Fine grained calls (pure overhead, and 1 ms of simulated I/O) through ThreadHandler.run_func.
+Results are written by queue-fed workers directly to their index, Telemetry forces the former
+path (ThreadProcess per chunk and flattening of chunk lists), so both can be compared in one run.
+"""
+
+import time
+
+from antools.logging import get_logger
+from antools.scheduling import Telemetry
+from antools.threading import ThreadHandler
+
+THREADS = 32
+
+
+def noop(value, lock):
+    return value
+
+
+def io_call(value, lock):
+    time.sleep(0.001)
+    return value
+
+
+def _measure(handler, func, n_items: int, chunksize: int, telemetry=None) -> float:
+    st = time.perf_counter()
+    results = handler.run_func(
+        func,
+        range(n_items),
+        max_workers=THREADS,
+        chunking="fixed",
+        chunksize=chunksize,
+        telemetry=telemetry,
+    )
+    elapsed = time.perf_counter() - st
+    assert results == list(range(n_items))
+    return n_items / elapsed
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="WARNING", file_log=False)
+    handler = ThreadHandler(logger)
+
+    for name, func, n_items in [("noop", noop, 200_000), ("io 1 ms", io_call, 20_000)]:
+        for chunksize in [1, 16, 256]:
+            indexed = _measure(handler, func, n_items, chunksize)
+            chunked = _measure(handler, func, n_items, chunksize, Telemetry())
+            print(
+                f"{name:8} chunksize={chunksize:<4} indexed {indexed:>10.0f} items/s, "
+                f"chunk processes {chunked:>10.0f} items/s ({indexed / chunked:.2f}x)"
+            )
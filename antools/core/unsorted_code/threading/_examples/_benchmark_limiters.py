@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+LIMITERS BENCHMARK
+
+Overhead of one acquire + release of limiters which never make the caller wait (rate is far above
+the load), compared with plain threading.Lock and with no limiter.
+1 THREAD -> uncontended cost, THREADS -> the same calls from THREADS threads at once (contended).
+"""
+
+import concurrent.futures
+import threading
+import time
+
+from antools.threading import ConcurrencyLimiter, LeakyBucket, TokenBucket
+
+N_CALLS = 200_000
+THREADS = 8
+
+
+class _NoLimiter:
+    def acquire(self, key=None):
+        return True
+
+    def release(self, key=None):
+        pass
+
+
+class _Lock:
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def acquire(self, key=None):
+        return self._lock.acquire()
+
+    def release(self, key=None):
+        self._lock.release()
+
+
+def _loop(limiter, n_calls: int):
+    acquire, release = limiter.acquire, limiter.release
+    for _ in range(n_calls):
+        acquire("key")
+        release("key")
+
+
+def _measure(limiter, threads: int) -> float:
+    """Returns ns per acquire + release."""
+    per_thread = N_CALLS // threads
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        st = time.perf_counter()
+        list(executor.map(lambda _: _loop(limiter, per_thread), range(threads)))
+        elapsed = time.perf_counter() - st
+    return elapsed / (per_thread * threads) * 1e9
+
+
+if __name__ == "__main__":
+
+    LIMITERS = {
+        "no limiter": _NoLimiter,
+        "threading.Lock": _Lock,
+        "TokenBucket": lambda: TokenBucket(rate=1e12),
+        "LeakyBucket": lambda: LeakyBucket(rate=1e12),
+        "ConcurrencyLimiter": lambda: ConcurrencyLimiter(limit=THREADS),
+    }
+
+    print(f"N_CALLS={N_CALLS}")
+    print(f"{'LIMITER':<22}{'1 THREAD [ns]':>16}{f'{THREADS} THREADS [ns]':>18}")
+    for name, factory in LIMITERS.items():
+        single = _measure(factory(), 1)
+        contended = _measure(factory(), THREADS)
+        print(f"{name:<22}{single:>16.0f}{contended:>18.0f}")
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+LIMITERS EXAMPLES
+"""
+
+import threading
+import time
+
+from antools.logging import get_logger
+from antools.threading import (
+    ConcurrencyLimiter,
+    LeakyBucket,
+    ThreadHandler,
+    TokenBucket,
+)
+
+
+class FakeBackend:
+    """Local stand-in of rate limited API, max RATE requests per second.
+    Throttled requests count against the limit too and client waits PENALTY before retry.
+    """
+
+    RATE = 50
+    PENALTY = 0.5
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._window = []
+        self.throttled = 0
+
+    def request(self, value):
+        with self._lock:
+            now = time.monotonic()
+            self._window = [t for t in self._window if now - t < 1]
+            ok = len(self._window) < self.RATE
+            self._window.append(now)
+            self.throttled += not ok
+        time.sleep(0.01 if ok else self.PENALTY)
+        return ok
+
+
+def call(backend):
+    def fetch(value, lock):
+        while not backend.request(value):  # retry of throttled request
+            pass
+        return value
+
+    return fetch
+
+
+if __name__ == "__main__":
+
+    logger = get_logger(level="ERROR", file_log=False)
+    handler = ThreadHandler(logger)
+
+    # FIRST EXAMPLE
+    # WITHOUT LIMITER, REQUESTS OVER THE LIMIT ARE THROTTLED AND RETRIED
+    # WITH TOKEN BUCKET (RATE + BURST WITHIN THE LIMIT) OR LEAKY BUCKET, EVERY REQUEST PASSES AT FIRST ATTEMPT
+    for name, limiters in [
+        ("no limiter", None),
+        ("token bucket", [TokenBucket(rate=45, capacity=5)]),
+        ("leaky bucket", [LeakyBucket(rate=48)]),
+    ]:
+        backend = FakeBackend()
+        st = time.perf_counter()
+        handler.run_func(
+            call(backend),
+            range(200),
+            20,
+            chunking="fixed",
+            chunksize=1,
+            limiters=limiters,
+        )
+        print(
+            f"{name:<14} {round(time.perf_counter() - st, 2)} seconds, throttled {backend.throttled} requests"
+        )
+
+    # SECOND EXAMPLE
+    # AT MOST 2 REQUESTS AT ONCE PER HOST, 5 FOR "fast.example.com"
+    running = {}
+
+    def download(url, lock):
+        host = url.split("/")[2]
+        with lock:
+            running[host] = running.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), running[host])
+        time.sleep(0.05)
+        with lock:
+            running[host] -= 1
+        return url
+
+    peak = {}
+    urls = [
+        f"https://{host}/{i}"
+        for i in range(20)
+        for host in ["a.example.com", "fast.example.com"]
+    ]
+    handler.run_func(
+        download,
+        urls,
+        16,
+        lock=threading.Lock(),
+        chunking="fixed",
+        chunksize=1,
+        limiters=[ConcurrencyLimiter(2, limits={"fast.example.com": 5})],
+        limiter_key=lambda url: url.split("/")[2],
+    )
+    print(peak)
@@ -102,3 +102,19 @@ if __name__ == "__main__":
     workers = 8 if len(DATA) >= 10000 else 4
     data = Scheduler.run_func(my_func, args=DATA, max_workers=workers)
     print(data)
+
+    # THIRD EXAMPLE
+    # SKEWED WORK -> SMALL CHUNKS STOLEN FROM SHARED QUEUE BY IDLE WORKERS
+    Scheduler = ThreadHandler(logger)
+    data = Scheduler.run_func(
+        my_func, args=DATA, max_workers=4, chunking="stealing", chunksize=10
+    )
+    print(data)
+
+    # FOURTH EXAMPLE
+    # STREAM RESULTS FROM LAZY INPUT, AT MOST 8 CHUNKS IN MEMORY
+    Scheduler = ThreadHandler(logger)
+    for result in Scheduler.imap(
+        my_func, (i for i in range(1000)), max_workers=4, chunksize=50, max_in_flight=8
+    ):
+        print(result) if result[0] % 100 == 0 else None
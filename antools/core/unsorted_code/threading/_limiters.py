@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+LIMITERS
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Rate limiter allowing bursts, tokens are refilled at rate per second up to capacity.
+    Every acquire takes one token, when bucket is empty the token is reserved in advance and caller
+    sleeps (outside of the lock) until it is refilled, so waiting callers are served in order.
+
+    ...
+
+    Attributes
+    ----------
+    rate : float
+        Tokens refilled per second.
+    capacity : float
+        Max tokens in bucket, i.e. max burst.
+
+    Methods
+    -------
+    __init__(self, rate:float, capacity:float=None)
+        Class constructor.
+    acquire(self, key=None, timeout:float=None)
+        Take token, wait until it is available, returns False if it would take more than timeout.
+    release(self, key=None)
+        Nothing to release, tokens are refilled by time.
+
+    Examples
+    -------
+    antools/threading/_examples/_example_limiters.py
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        rate : float
+            Tokens refilled per second.
+        capacity : float, optional
+            Max tokens in bucket (default is None -> rate, i.e. one second of burst).
+        """
+
+        if rate <= 0:
+            raise ValueError(
+                f"Rate must be a positive number, inserted value is {rate}!"
+            )
+
+        self.rate = rate
+        self.capacity = max(1, rate if capacity is None else capacity)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"TokenBucket(rate={self.rate}, capacity={self.capacity})"
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def acquire(self, key=None, timeout: float = None) -> bool:
+        """Take token, wait until it is available.
+
+        Parameters
+        ----------
+        key : optional
+            Ignored, one bucket is shared by all keys.
+        timeout : float, optional
+            Max seconds to wait (default is None -> no limit).
+
+        Returns
+        ----------
+        False if token would not be available in timeout, True otherwise
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            wait = (1 - tokens) / self.rate if tokens < 1 else 0.0
+            if timeout is not None and wait > timeout:
+                self._tokens = tokens
+                return False
+            self._tokens = tokens - 1
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def release(self, key=None):
+        """Nothing to release, tokens are refilled by time."""
+
+
+class LeakyBucket:
+    """Rate limiter without bursts, callers pass at constant pace of rate per second.
+    Every acquire reserves next free slot and sleeps (outside of the lock) until it comes.
+
+    ...
+
+    Attributes
+    ----------
+    rate : float
+        Callers passed per second.
+    capacity : int
+        Max callers waiting for their slot, None -> no limit.
+
+    Methods
+    -------
+    __init__(self, rate:float, capacity:int=None)
+        Class constructor.
+    acquire(self, key=None, timeout:float=None)
+        Wait for next slot, returns False if bucket is full or slot is further than timeout.
+    release(self, key=None)
+        Nothing to release, bucket leaks by time.
+
+    Examples
+    -------
+    antools/threading/_examples/_example_limiters.py
+    """
+
+    def __init__(self, rate: float, capacity: int = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        rate : float
+            Callers passed per second.
+        capacity : int, optional
+            Max callers waiting for their slot (default is None -> no limit).
+        """
+
+        if rate <= 0:
+            raise ValueError(
+                f"Rate must be a positive number, inserted value is {rate}!"
+            )
+
+        self.rate = rate
+        self.capacity = capacity
+        self._interval = 1 / rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"LeakyBucket(rate={self.rate}, capacity={self.capacity})"
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def acquire(self, key=None, timeout: float = None) -> bool:
+        """Wait for next slot.
+
+        Parameters
+        ----------
+        key : optional
+            Ignored, one bucket is shared by all keys.
+        timeout : float, optional
+            Max seconds to wait (default is None -> no limit).
+
+        Returns
+        ----------
+        False if bucket is full or slot would not come in timeout, True otherwise
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            wait = slot - now
+            if timeout is not None and wait > timeout:
+                return False
+            if self.capacity is not None and wait > self.capacity * self._interval:
+                return False
+            self._next = slot + self._interval
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def release(self, key=None):
+        """Nothing to release, bucket leaks by time."""
+
+
+class ConcurrencyLimiter:
+    """Caps number of callers running at once, per key (e.g. host name or tenant).
+    Slots of keys are created on first use, free slot is taken by one lock acquire
+    (threading.Semaphore needs its condition lock and more Python code).
+
+    ...
+
+    Attributes
+    ----------
+    limit : int
+        Cap of keys without their own limit, None -> no cap.
+    limits : dict
+        Caps of selected keys.
+
+    Methods
+    -------
+    __init__(self, limit:int=None, limits:dict=None)
+        Class constructor.
+    acquire(self, key=None, timeout:float=None)
+        Take slot of key, returns False if it is not free in timeout.
+    release(self, key=None)
+        Free slot of key.
+    __call__(self, key=None)
+        Returns context manager holding slot of key.
+
+    Examples
+    -------
+    antools/threading/_examples/_example_limiters.py
+    """
+
+    def __init__(self, limit: int = None, limits: dict = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Cap of keys without their own limit (default is None -> no cap).
+        limits : dict, optional
+            Key -> cap of the key (default is None).
+        """
+
+        self.limit = limit
+        self.limits = {} if limits is None else dict(limits)
+        for key, value in [(None, limit), *self.limits.items()]:
+            if value is not None and value < 1:
+                raise ValueError(
+                    f"Limit of key <{key}> must be a positive integer, inserted value is {value}!"
+                )
+        # key -> [running, limit, waiting, condition], conditions share one lock
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Representative string."""
+        return f"ConcurrencyLimiter(limit={self.limit}, limits={self.limits})"
+
+    def __call__(self, key=None) -> "_Slot":
+        """Returns context manager holding slot of key."""
+        return _Slot(self, key)
+
+    def acquire(self, key=None, timeout: float = None) -> bool:
+        """Take slot of key.
+
+        Parameters
+        ----------
+        key : optional
+            Key of the caller (default is None).
+        timeout : float, optional
+            Max seconds to wait (default is None -> no limit).
+
+        Returns
+        ----------
+        False if slot was not free in timeout, True otherwise
+        """
+
+        slot = self._slots.get(key) or self._get_slot(key)
+        if slot[1] is None:
+            return True
+
+        with self._lock:
+            # fast path, one lock acquire when slot is free
+            if slot[0] < slot[1]:
+                slot[0] += 1
+                return True
+
+            deadline = None if timeout is None else time.monotonic() + timeout
+            slot[2] += 1
+            try:
+                while slot[0] >= slot[1]:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    slot[3].wait(remaining)
+                slot[0] += 1
+                return True
+            finally:
+                slot[2] -= 1
+
+    def release(self, key=None):
+        """Free slot of key."""
+
+        slot = self._slots.get(key)
+        if slot is None or slot[1] is None:
+            return
+        with self._lock:
+            if slot[0] <= 0:
+                raise ValueError(f"Slot of key <{key}> released too many times!")
+            slot[0] -= 1
+            if slot[2]:
+                slot[3].notify()
+
+    def _get_slot(self, key) -> list:
+        """Returns [running, limit, waiting, condition] of key, created on first use."""
+        limit = self.limits.get(key, self.limit)
+        with self._lock:
+            return self._slots.setdefault(
+                key, [0, limit, 0, threading.Condition(self._lock)]
+            )
+
+
+class _Slot:
+    """Context manager holding slot of ConcurrencyLimiter."""
+
+    __slots__ = ("_limiter", "_key")
+
+    def __init__(self, limiter: ConcurrencyLimiter, key):
+        self._limiter = limiter
+        self._key = key
+
+    def __enter__(self):
+        self._limiter.acquire(self._key)
+        return self
+
+    def __exit__(self, *args):
+        self._limiter.release(self._key)
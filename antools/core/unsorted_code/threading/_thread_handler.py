@@ -4,11 +4,26 @@ THREADING HANDLER
 """
 
 import concurrent.futures
+import functools
 import os
-import time
-
-import numpy as np
-
+import queue
+
+from antools.multiprocessing import SyncPrimitives
+from antools.scheduling import (
+    AutoTuner,
+    CancelToken,
+    LoopExecutor,
+    NodeCache,
+    ObjectStore,
+    ProcessPool,
+    ScheduleEngine,
+    Telemetry,
+    as_sequence,
+    get_chunk_bounds,
+    get_gil_status,
+    iter_chunks,
+    partition,
+)
 from antools.threading import ThreadProcess
 
 
@@ -29,7 +44,11 @@ class ThreadHandler:
     run_schedule(self):
         Run multiplefunctions dependent between themselves.
     run_func(self)
-        Run function in multiprocess.
+        Run function in threading.
+    imap(self)
+        Lazily run function in threading, yield results in order of args.
+    imap_unordered(self)
+        Lazily run function in threading, yield results as chunks finish.
 
     Examples
     -------
@@ -41,7 +60,17 @@ class ThreadHandler:
         self._logger = logger
 
     def run_schedule(
-        self, schedule: dict, max_workers: int = os.cpu_count(), lock: object = None
+        self,
+        schedule: dict,
+        max_workers: int = os.cpu_count(),
+        lock: object = None,
+        cache: NodeCache = None,
+        telemetry: Telemetry = None,
+        store: ObjectStore = None,
+        resources: dict = None,
+        on_error: str = "continue",
+        deadline: float = None,
+        token: CancelToken = None,
     ) -> dict:
         """Run multiple functions dependent between themselves.
 
@@ -54,115 +83,76 @@ class ThreadHandler:
             Max workers used for the process.
         lock
            Threading lock.
+        cache : NodeCache, optional
+            If set, function with unchanged code and unchanged dependency results is loaded from cache
+            instead of being run (default is None).
+        telemetry : Telemetry, optional
+            If set, timings of every function are recorded to it (default is None).
+        store : ObjectStore, optional
+            If set, results of functions are kept in store and functions get dictionary
+            dependency name -> ObjectRef, read data by ref.get() (default is None). Cannot be combined with cache.
+        resources : dict, optional
+            Capacity shared by running functions, e.g. {"cpus": 8, "memory": 16 * 1024**3}, functions declare
+            their needs by node(cpus=..., memory=...) (default is None -> cpus is max_workers, memory is physical memory).
+        on_error : str, optional
+            What happens when function fails (default is "continue"). Options are ["continue", "fail_branch", "fail_fast"].
+            "fail_branch" -> dependent functions are skipped, "fail_fast" -> the whole schedule is cancelled.
+        deadline : float, optional
+            Seconds for the whole schedule, then it is cancelled (default is None -> no limit).
+        token : CancelToken, optional
+            Token to cancel the schedule from other thread (default is None). Running functions
+            check get_cancel_token().cancelled and should return early, skipped functions have status "CANCELLED".
+
+        Functions run in threads, functions declared by node(executor="process") run in worker processes
+        (with native lock instead of given lock) and node(executor="asyncio") on event loop thread.
 
         Returns
         ----------
         Dictionary with results
         """
 
-        waiting_processes = {}
-        run_processes = {}
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
-
-        for func, dependencies in schedule.items():
-            dependencies = [] if dependencies is None else dependencies
-            dependencies = (
-                [dependencies] if not isinstance(dependencies, list) else dependencies
-            )
-            waiting_processes[func] = dependencies
-
-        self._logger.info(f"Starting threading schedule with {max_workers} workers ...")
-        main_loop = True
-        while main_loop:
-
-            finished = True
-
-            # if no processes waiting to be done
-            if not waiting_processes:
-                break
-
-            new_funcs_waiting = []
-            for func, dependencies in waiting_processes.items():
-                func_to_be_done = True
-                for dependency in dependencies:
-
-                    # check if dependent function is running, else skip
-                    if dependency not in run_processes:
-                        func_to_be_done = False
-                        break
-
-                if func_to_be_done:
-                    new_funcs_waiting = [].append(func)
-
-                # if dependency is in running_processes, check if it is finished
-                if func_to_be_done:
-                    for dependency in dependencies:
-                        if run_processes[dependency]._state != "FINISHED":
-                            func_to_be_done = False
-                            break
-
-                    # if all dependencies are finished, run it
-                    if func_to_be_done:
-                        data = dict()
-                        for dependency in dependencies:
-                            data[func.__name__] = (
-                                run_processes[dependency].result().data
-                            )
-
-                        p = executor.submit(func, lock, self._logger, data)
-                        run_processes[func] = p
-
-            # delete new run functions in waiting processes
-            for func in run_processes:
-                if func in waiting_processes:
-                    del waiting_processes[func]
-
-            if waiting_processes:
-                finished = False
-
-            # if there remains functions dependent on each other, raise Error
-            elif waiting_processes and not new_funcs_waiting:
-                self._logger.error(
-                    f"Function dependencies are corrupted! Remaining dependent functions -> {list(waiting_processes)}",
-                    ValueError,
-                )
-                return False
-
-            else:
-                for func, process in run_processes.items():
-                    if process._state != "FINISHED":
-                        finished = False
-
-            if not finished:
-                time.sleep(0.1)
-
-        # wait for all to be finished
-        while True:
-            finished = True
-            for func, process in run_processes.items():
-                if process._state != "FINISHED":
-                    finished = False
-
-            # if all finished
-            if finished:
-                status_list = []
-                for func, process in run_processes.items():
-                    data[func.__name__] = {
-                        "status": f"{process.result().status}",
-                        "data": f"{process.result().data}",
-                        "error": f"{process.result().error}",
-                    }
-
-                    status_list.append(process.result().status)
-                msg = f"Thread schedule is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
-                self._logger.info(msg) if status_list.count("OK") == len(
-                    status_list
-                ) else self._logger.error(msg, terminate=False)
-
-                return data
+        # process nodes get native lock handed to workers by initializer
+        sync = SyncPrimitives()
+        engine = ScheduleEngine(
+            self._logger,
+            factories={
+                "thread": lambda: concurrent.futures.ThreadPoolExecutor(max_workers),
+                "process": lambda: ProcessPool(
+                    max_workers,
+                    initializer=SyncPrimitives.initializer,
+                    initargs=(sync,),
+                ),
+                "asyncio": lambda: LoopExecutor(max_workers),
+            },
+            locks={"thread": lock, "process": sync.lock, "asyncio": lock},
+            default_executor="thread",
+            name="threading",
+        )
+        return engine.run(
+            schedule,
+            max_workers,
+            cache,
+            telemetry,
+            store=store,
+            resources=resources,
+            on_error=on_error,
+            deadline=deadline,
+            token=token,
+        )
 
     def run_func(
-        self, func, args: list, max_workers: int = os.cpu_count(), lock: object = None
+        self,
+        func,
+        args: list,
+        max_workers: int = os.cpu_count(),
+        lock: object = None,
+        chunking: str = "static",
+        chunksize: int = None,
+        telemetry: Telemetry = None,
+        initializer=None,
+        initargs: tuple = (),
+        limiters: list = None,
+        limiter_key=None,
     ) -> list:
         """Run function in threading.
 
@@ -172,38 +162,82 @@ class ThreadHandler:
             Name of function
         args : list
             List of data which should be processed
-        max_workers : int
-            Max workers used for the process.
+        max_workers : int or str
+            Max workers used for the process. If "auto", number of workers (up to usable CPUs, see
+            get_usable_cpus()) and chunk size are tuned by measured throughput during the run and the best
+            setting is reused by next runs of the function, chunking and chunksize are then ignored.
         lock
             Threading lock.
+        chunking : str, optional
+            Scheduling policy (default is "static"). Options are ["static", "fixed", "guided", "stealing"].
+        chunksize : int, optional
+            Chunk size for "fixed" and "stealing", minimal chunk size for "guided" (default is None -> computed).
+        telemetry : Telemetry, optional
+            If set, timings of every chunk are recorded to it (default is None). Chunks are then dispatched
+            one by one even for "stealing" chunking.
+        initializer : optional
+            Function called as initializer(*initargs) once in every thread before its first chunk, e.g. to open
+            connection stored by worker_local.set() and read by worker_local.get() in func (default is None).
+        initargs : tuple, optional
+            Arguments of initializer (default is ()).
+        limiters : list, optional
+            TokenBucket, LeakyBucket, ConcurrencyLimiter (or objects with acquire(key) and release(key)) shared
+            by all calls, every call of func holds all of them, acquired in order of list (default is None).
+        limiter_key : optional
+            Function returning key of value for per-key limiters, e.g. host of URL (default is None -> key is None).
+
+        CPU bound functions run in parallel only when the GIL is disabled (free-threaded build, see get_gil_status()).
+        Without telemetry, threads take chunks from one queue and write results straight to their index.
 
         Returns
         ----------
         List with results
         """
 
-        # split args to multiple arrays by max_workers
-        args = np.array_split(args, max_workers)
+        if limiters:
+            func = self._limit(func, limiters, limiter_key)
+
+        # split args to chunks by selected scheduling policy, types are kept
+        args = as_sequence(args)
+        if max_workers == "auto":
+            return self._run_auto(func, args, lock, telemetry, initializer, initargs)
+        bounds = get_chunk_bounds(len(args), max_workers, chunking, chunksize)
+
+        if telemetry is None:
+            return self._run_indexed(
+                func, args, bounds, max_workers, lock, initializer, initargs
+            )
 
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=max_workers
+        # traced chunks are separate tasks with their own ThreadProcess
+        args = partition(args, bounds)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, initializer=initializer, initargs=initargs
         ) as executor:
             self._logger.info(
-                f"Spliting function <{func}> into {max_workers} threads ..."
+                f"Spliting function <{func}> into {len(args)} chunks on {max_workers} threads, GIL {get_gil_status()} ..."
             )
             proc_results = [
-                executor.submit(self._run_threading, func, curr_args, lock)
+                self._submit(
+                    executor,
+                    telemetry,
+                    func.__name__,
+                    self._run_threading,
+                    func,
+                    curr_args,
+                    lock,
+                )
                 for curr_args in args
             ]
 
+        processes = [process.result() for process in proc_results]
+
         data = []
-        i = 0
-        for process in proc_results:
-            data.append(process.result().data)
+        for process in processes:
+            data.append(process.data)
 
         status_list = []
-        for process in proc_results:
-            status_list.append(process.result().status)
+        for process in processes:
+            status_list.append(process.status)
 
         msg = f"Threading function <{func.__name__}> is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
         self._logger.info(msg) if status_list.count("OK") == len(
@@ -213,6 +247,277 @@ class ThreadHandler:
         # RETURN FLAT LIST OF RESULTS
         return [item for sublist in data for item in sublist]
 
+    def _run_indexed(
+        self,
+        func,
+        args: object,
+        bounds: list,
+        max_workers: int,
+        lock: object,
+        initializer=None,
+        initargs: tuple = (),
+    ) -> list:
+        """Run function in threading, workers take bounds of chunks from queue and write results
+        straight to their index of preallocated list, so nothing is merged and no lock is needed."""
+
+        results = [None] * len(args)
+        failed = []
+        work_queue = queue.SimpleQueue()
+        for curr_bounds in bounds:
+            work_queue.put(curr_bounds)
+        for _ in range(max_workers):
+            work_queue.put(None)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, initializer=initializer, initargs=initargs
+        ) as executor:
+            self._logger.info(
+                f"Spliting function <{func}> into {len(bounds)} chunks taken from queue by {max_workers} threads, GIL {get_gil_status()} ..."
+            )
+            workers = [
+                executor.submit(
+                    self._run_queue, func, args, work_queue, results, failed, lock
+                )
+                for _ in range(max_workers)
+            ]
+
+        finished = sum(worker.result() for worker in workers)
+        msg = f"Threading function <{func.__name__}> is finished! TOTAL_RUN={len(bounds)}, OK={finished}, ERROR={len(bounds) - finished}"
+        self._logger.info(msg) if finished == len(bounds) else self._logger.error(
+            msg, terminate=False
+        )
+
+        return results
+
+    def _run_auto(
+        self,
+        func,
+        args: object,
+        lock: object,
+        telemetry: Telemetry,
+        initializer=None,
+        initargs: tuple = (),
+    ) -> list:
+        """Run function in threading with number of workers and chunk size tuned during the run."""
+
+        tuner = AutoTuner(func, len(args))
+        with concurrent.futures.ThreadPoolExecutor(
+            tuner.max_workers, initializer=initializer, initargs=initargs
+        ) as executor:
+            self._logger.info(
+                f"Tuning function <{func}> from {tuner.workers} workers and chunks of {tuner.chunksize} on up to {tuner.max_workers} threads, GIL {get_gil_status()} ..."
+            )
+            processes = tuner.map(
+                lambda chunk: self._submit(
+                    executor,
+                    telemetry,
+                    func.__name__,
+                    self._run_threading,
+                    func,
+                    chunk,
+                    lock,
+                ),
+                args,
+            )
+        self._logger.info(
+            f"Function <{func.__name__}> tuned to {tuner.best[0]} workers and chunks of {tuner.best[1]}, {round(tuner.throughput, 2)} items per second."
+        )
+
+        status_list = [process.status for process in processes]
+        msg = f"Threading function <{func.__name__}> is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
+        self._logger.info(msg) if status_list.count("OK") == len(
+            status_list
+        ) else self._logger.error(msg, terminate=False)
+
+        # RETURN FLAT LIST OF RESULTS
+        return [item for process in processes for item in process.data]
+
+    def imap(
+        self,
+        func,
+        args,
+        max_workers: int = os.cpu_count(),
+        lock: object = None,
+        chunksize: int = 1,
+        max_in_flight: int = None,
+    ):
+        """Lazily run function in threading, yield results in order of args.
+
+        Parameters
+        ----------
+        func
+            Name of function
+        args
+            Any iterable with data which should be processed, it is consumed lazily.
+        max_workers : int
+            Max workers used for the process.
+        lock
+            Threading lock.
+        chunksize : int, optional
+            Number of items sent to worker at once (default is 1).
+        max_in_flight : int, optional
+            Max number of chunks submitted or waiting to be yielded (default is None -> 2 * max_workers).
+
+        Returns
+        ----------
+        Generator of results
+        """
+        return self._imap(func, args, max_workers, lock, chunksize, max_in_flight, True)
+
+    def imap_unordered(
+        self,
+        func,
+        args,
+        max_workers: int = os.cpu_count(),
+        lock: object = None,
+        chunksize: int = 1,
+        max_in_flight: int = None,
+    ):
+        """Lazily run function in threading, yield results as chunks finish.
+
+        Parameters
+        ----------
+        func
+            Name of function
+        args
+            Any iterable with data which should be processed, it is consumed lazily.
+        max_workers : int
+            Max workers used for the process.
+        lock
+            Threading lock.
+        chunksize : int, optional
+            Number of items sent to worker at once (default is 1).
+        max_in_flight : int, optional
+            Max number of chunks submitted at once (default is None -> 2 * max_workers).
+
+        Returns
+        ----------
+        Generator of results
+        """
+        return self._imap(
+            func, args, max_workers, lock, chunksize, max_in_flight, False
+        )
+
+    def _imap(
+        self,
+        func,
+        args,
+        max_workers: int,
+        lock: object,
+        chunksize: int,
+        max_in_flight: int,
+        ordered: bool,
+    ):
+        """Yield results of chunks, keep at most max_in_flight chunks in memory."""
+
+        max_in_flight = 2 * max_workers if max_in_flight is None else max_in_flight
+        chunks = iter_chunks(args, chunksize)
+        in_flight = {}
+        finished = {}
+        next_index = 0
+        submitted = 0
+        exhausted = False
+        status_list = []
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._logger.info(
+            f"Streaming function <{func}> in chunks of {chunksize} on {max_workers} threads ..."
+        )
+        try:
+            while True:
+                # backpressure, finished chunks waiting for order count as in flight
+                while not exhausted and len(in_flight) + len(finished) < max_in_flight:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    future = executor.submit(self._run_threading, func, chunk, lock)
+                    in_flight[future] = submitted
+                    submitted += 1
+
+                if not in_flight:
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    index = in_flight.pop(future)
+                    process = future.result()
+                    status_list.append(process.status)
+                    if ordered:
+                        finished[index] = process
+                    else:
+                        yield from process.data
+
+                while next_index in finished:
+                    yield from finished.pop(next_index).data
+                    next_index += 1
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        msg = f"Threading function <{func.__name__}> is finished! TOTAL_RUN={len(status_list)}, OK={status_list.count('OK')}, ERROR={status_list.count('ERROR')}"
+        self._logger.info(msg) if status_list.count("OK") == len(
+            status_list
+        ) else self._logger.error(msg, terminate=False)
+
+    def _submit(
+        self, executor: object, telemetry: Telemetry, name: str, fn, *args
+    ) -> concurrent.futures.Future:
+        """Submit fn(*args) to executor, traced when telemetry is set."""
+        if telemetry is None:
+            return executor.submit(fn, *args)
+        return telemetry.submit(executor, name, fn, *args)
+
+    @staticmethod
+    def _limit(func, limiters: list, limiter_key) -> object:
+        """Returns func holding all limiters while it runs."""
+
+        @functools.wraps(func)
+        def limited(value, lock):
+            key = None if limiter_key is None else limiter_key(value)
+            acquired = []
+            try:
+                for limiter in limiters:
+                    limiter.acquire(key)
+                    acquired.append(limiter)
+                return func(value, lock)
+            finally:
+                for limiter in reversed(acquired):
+                    limiter.release(key)
+
+        return limited
+
+    def _run_queue(
+        self,
+        func,
+        args: object,
+        work_queue: object,
+        results: list,
+        failed: list,
+        lock: object,
+    ) -> int:
+        """Run chunks from shared work queue until it is empty, returns number of finished chunks."""
+
+        finished = 0
+        while True:
+            item = work_queue.get()
+            if item is None:
+                return finished
+            # after failure of other worker the queue is only drained, the run fails anyway
+            if failed:
+                continue
+
+            try:
+                for i, value in enumerate(partition(args, [item])[0], item[0]):
+                    results[i] = func(value, lock)
+            except Exception as err:
+                failed.append(err)
+                self._logger.exception(
+                    f"Threading failed due to: {err}", add_info=True, terminate=True
+                )
+            finished += 1
+
     def _run_threading(self, func, args: list, lock: object) -> object:
         """Split function."""
 